@@ -0,0 +1,28 @@
+"""Single bit mutation throughput per storage backend as vectors grow.
+
+$ python benchmarks/bench_backends.py
+"""
+
+import random
+import timeit
+
+from bitvector import BitVector
+
+
+def main(number: int = 20_000) -> None:
+
+    print(f"{'size':>10} {'backend':>8} {'set usec':>10} {'get usec':>10}")
+
+    for size in [1 << 10, 1 << 16, 1 << 20, 1 << 24]:
+        offsets = [random.randrange(size) for _ in range(number)]
+        for backend in ["int", "bytes", "words"]:
+            bv = BitVector(size=size, backend=backend)
+            put = timeit.timeit(lambda: [bv.__setitem__(n, 1) for n in offsets], number=1)
+            get = timeit.timeit(lambda: [bv[n] for n in offsets], number=1)
+            set_us = put / number * 1e6
+            get_us = get / number * 1e6
+            print(f"{size:>10} {backend:>8} {set_us:>10.3f} {get_us:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
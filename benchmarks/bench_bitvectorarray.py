@@ -0,0 +1,49 @@
+"""BitVectorArray batched operations versus a list of BitVectors.
+
+$ python benchmarks/bench_bitvectorarray.py
+"""
+
+import random
+import time
+
+from bitvector import BitVector, BitVectorArray
+
+
+def clock(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main(count: int = 100_000) -> None:
+
+    print(f"{'size':>5} {'operation':>10} {'list ms':>10} {'array ms':>10}")
+
+    for size in [32, 64, 256]:
+        values = [random.getrandbits(size) for _ in range(count)]
+        vectors = [BitVector(v, size=size) for v in values]
+        others = [BitVector(v, size=size) for v in reversed(values)]
+        arr = BitVectorArray(values, size=size)
+        other = BitVectorArray(reversed(values), size=size)
+
+        cases = {
+            "a & b": (
+                lambda: [a & b for a, b in zip(vectors, others)],
+                lambda: arr & other,
+            ),
+            "a | 0xff": (lambda: [a | 0xFF for a in vectors], lambda: arr | 0xFF),
+            "~a": (lambda: [~a for a in vectors], lambda: ~arr),
+            "a << 3": (lambda: [a << 3 for a in vectors], lambda: arr << 3),
+            "a == 7": (lambda: [a == 7 for a in vectors], lambda: arr == 7),
+            "popcount": (
+                lambda: [bin(a.value).count("1") for a in vectors],
+                arr.popcount,
+            ),
+        }
+
+        for name, (listed, batched) in cases.items():
+            print(f"{size:>5} {name:>10} {clock(listed):>10.2f} {clock(batched):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
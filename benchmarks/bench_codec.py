@@ -0,0 +1,62 @@
+"""Record codec versus per-field BitField descriptor access.
+
+$ python benchmarks/bench_codec.py
+"""
+
+import timeit
+
+from bitvector import BitVector, BitField
+
+
+class Command(BitVector):
+    def __init__(self, value: int = 0):
+        super().__init__(value, size=32)
+
+    power = BitField(0, 1)
+    spin = BitField(1, 1)
+    speed = BitField(2, 4)
+    sense = BitField(6, 2)
+    red = BitField(8, 8)
+    blue = BitField(16, 8)
+    green = BitField(24, 8)
+
+
+class PlainCommand(Command, codegen=False):
+    pass
+
+
+NAMES = list(Command._codec.names)
+FIELDS = dict(power=1, spin=0, speed=5, sense=2, red=0xAA, blue=0xBB, green=0xCC)
+
+
+def descriptors_get(bv):
+    return {name: getattr(bv, name) for name in NAMES}
+
+
+def descriptors_set(bv):
+    for name, value in FIELDS.items():
+        setattr(bv, name, value)
+
+
+def main(number: int = 100_000) -> None:
+
+    compiled = Command(0xCCBB_AA95)
+    plain = PlainCommand(0xCCBB_AA95)
+
+    cases = {
+        "descriptors get": lambda: descriptors_get(compiled),
+        "unpack() plain": plain.unpack,
+        "unpack() compiled": compiled.unpack,
+        "unpack(tuple) compiled": lambda: compiled.unpack(False),
+        "descriptors set": lambda: descriptors_set(compiled),
+        "pack() plain": lambda: plain.pack(**FIELDS),
+        "pack() compiled": lambda: compiled.pack(**FIELDS),
+    }
+
+    for name, statement in cases.items():
+        usec = timeit.timeit(statement, number=number) / number * 1e6
+        print(f"{name:>24}: {usec:8.3f} usec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""BitField column extraction versus per-record descriptor access.
+
+$ python benchmarks/bench_columns.py
+"""
+
+import random
+import time
+
+from bitvector import BitVector, BitVectorArray, BitField
+
+
+class Registers(BitVector):
+    def __init__(self, value: int = 0):
+        super().__init__(value, size=128)
+
+    byte0 = BitField(0, 8)
+    byte3 = BitField(24, 8)
+    word2 = BitField(32, 16)
+    flags = BitField(60, 12)
+
+
+def clock(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main(count: int = 200_000) -> None:
+
+    values = [random.getrandbits(128) for _ in range(count)]
+    objects = [Registers(v) for v in values]
+    records = BitVectorArray(values, size=128, vector_type=Registers)
+
+    print(f"{'field':>6} {'objects ms':>11} {'column(objs) ms':>16} {'column(array) ms':>17}")
+
+    for name in ["byte0", "byte3", "word2", "flags"]:
+        field = getattr(Registers, name)
+        loop = clock(lambda: [getattr(o, name) for o in objects])
+        listed = clock(lambda: field.column(objects))
+        packed = clock(lambda: field.column(records))
+        print(f"{name:>6} {loop:>11.2f} {listed:>16.2f} {packed:>17.2f}")
+
+    put = clock(lambda: Registers.byte3.set_column(records, range(count)))
+    print(f"set_column(array) byte3: {put:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""EWAHBitmap encode and decode throughput, compression ratio and
+compressed-domain operations on clustered and random 2**24-bit vectors,
+against the same operations on dense BitVectors.
+
+$ python benchmarks/bench_ewah.py
+"""
+
+import random
+import time
+
+from bitvector import BitVector, EWAHBitmap
+
+
+SIZE = 1 << 24
+
+
+def msec(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1e3
+
+
+def clustered(rng: random.Random, runs: int) -> int:
+    value = 0
+    for _ in range(runs):
+        value |= ((1 << rng.randrange(1 << 10, 1 << 16)) - 1) << rng.randrange(SIZE)
+    return value & ((1 << SIZE) - 1)
+
+
+def main() -> None:
+
+    rng = random.Random(0)
+    mbits = SIZE / 1e6
+
+    for name, make in [
+        ("clustered", lambda: clustered(rng, 200)),
+        ("random 1%", lambda: rng.getrandbits(SIZE) & rng.getrandbits(SIZE) & rng.getrandbits(SIZE)
+         & rng.getrandbits(SIZE) & rng.getrandbits(SIZE) & rng.getrandbits(SIZE) & rng.getrandbits(SIZE)),
+        ("random 50%", lambda: rng.getrandbits(SIZE)),
+    ]:
+        a, b = BitVector(make(), size=SIZE), BitVector(make(), size=SIZE)
+        t_encode = msec(lambda: EWAHBitmap.from_bitvector(a))
+        ea, eb = EWAHBitmap.from_bitvector(a), EWAHBitmap.from_bitvector(b)
+        t_decode = msec(ea.to_bitvector)
+
+        print(f"{name}: {ea.nbytes / 1e3:.1f} kB, ratio {SIZE / 8 / ea.nbytes:.1f}x")
+        print(f"  encode {t_encode:8.1f} msec {mbits / t_encode * 1e3:8.0f} Mbit/s")
+        print(f"  decode {t_decode:8.1f} msec {mbits / t_decode * 1e3:8.0f} Mbit/s")
+        for op, func, dense in [
+            ("&", lambda: ea & eb, lambda: a & b),
+            ("|", lambda: ea | eb, lambda: a | b),
+            ("^", lambda: ea ^ eb, lambda: a ^ b),
+            ("count", ea.count, a.count),
+        ]:
+            print(f"  {op:5} {msec(func):9.2f} msec (dense {msec(dense):7.2f} msec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Per-instance memory footprint and operation rates for BitVector,
+and how closely sys.getsizeof and footprint() track tracemalloc for
+each backend.
+
+$ python benchmarks/bench_footprint.py
+"""
+
+import timeit
+import tracemalloc
+
+from bitvector import BitVector
+from bitvector.memory import footprint
+
+
+def bytes_per_instance(size: int, count: int = 100_000) -> float:
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    vectors = [BitVector(n | (1 << (size - 1)), size=size) for n in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    total = sum(stat.size_diff for stat in stats)
+    # discount the list holding the vectors
+    total -= vectors.__sizeof__()
+
+    return total / count
+
+
+def accounting(backend: str, size: int, count: int = 2_000) -> tuple:
+    """Returns bytes per vector reported by footprint() and freed on
+    deleting the vectors, and the seconds footprint() took.
+    """
+    def make():
+        return [BitVector(n | (1 << (size - 1)), size=size, backend=backend) for n in range(count)]
+
+    tracemalloc.start()
+    vectors = make()
+    report = footprint(vectors)
+    before = tracemalloc.get_traced_memory()[0]
+    del vectors
+    freed = before - tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    vectors = make()
+    elapsed = min(timeit.repeat(lambda: footprint(vectors), number=1, repeat=5))
+
+    return report.total_bytes / count, freed / count, elapsed
+
+
+def ops_per_second(statement, number: int = 200_000) -> float:
+    return number / timeit.timeit(statement, number=number)
+
+
+def main() -> None:
+
+    for size in [8, 32, 64, 128]:
+        print(f"size {size:>4}: {bytes_per_instance(size):8.1f} bytes/instance")
+
+    print(f"{'backend':>8} {'size':>7} {'getsizeof':>10} {'freed':>10} {'footprint()':>12}")
+    for backend in ["int", "bytes", "words", "summary"]:
+        for size in [128, 1 << 16]:
+            reported, freed, elapsed = accounting(backend, size, 2_000 if size < 1024 else 200)
+            print(f"{backend:>8} {size:>7} {reported:10.1f} {freed:10.1f} {elapsed * 1e3:9.2f} ms")
+
+    a = BitVector(0x1234_5678, size=32)
+    b = BitVector(0x0F0F_0F0F, size=32)
+
+    rates = {
+        "create": lambda: BitVector(0x1234, size=32),
+        "a[5]": lambda: a[5],
+        "a[5] = 1": lambda: a.__setitem__(5, 1),
+        "a[8:16]": lambda: a[8:16],
+        "a & b": lambda: a & b,
+        "a |= b": lambda: a.__ior__(b),
+        "a == b": lambda: a == b,
+        "len(a)": lambda: len(a),
+        "str(a)": lambda: str(a),
+    }
+
+    for name, statement in rates.items():
+        print(f"{name:>10}: {ops_per_second(statement):12,.0f} ops/sec")
+
+
+if __name__ == "__main__":
+    main()
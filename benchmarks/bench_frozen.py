@@ -0,0 +1,43 @@
+"""Dict lookups keyed by FrozenBitVector against the (value, len)
+tuples they replace, and the cost of freeze() and thaw().
+
+$ python benchmarks/bench_frozen.py
+"""
+
+import random
+import timeit
+
+from bitvector import BitVector, FrozenBitVector
+
+
+def usec(statement, number: int = 20_000) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    rng = random.Random(42)
+
+    print(f"{'size':>6} {'tuple key':>10} {'frozen key':>11}  usec/lookup")
+    for size in [64, 1024, 1 << 16]:
+        vectors = [BitVector(rng.getrandbits(size), size=size) for _ in range(100)]
+        by_tuple = {(bv.value, len(bv)): n for n, bv in enumerate(vectors)}
+        frozen = [bv.freeze() for bv in vectors]
+        by_frozen = {bv: n for n, bv in enumerate(frozen)}
+        probe = vectors[37]
+        key = frozen[37]
+
+        print(
+            f"{size:>6} {usec(lambda: by_tuple[probe.value, len(probe)]):10.3f}"
+            f" {usec(lambda: by_frozen[key]):11.3f}"
+        )
+
+    print(f"\n{'backend':>8} {'size':>6} {'freeze':>8} {'thaw':>8}  usec")
+    for backend in ["int", "bytes"]:
+        for size in [64, 1 << 16]:
+            bv = BitVector(rng.getrandbits(size), size=size, backend=backend)
+            frozen = FrozenBitVector(bv.value, size=size, backend=backend)
+            print(f"{backend:>8} {size:>6} {usec(bv.freeze):8.3f} {usec(frozen.thaw):8.3f}")
+
+
+if __name__ == "__main__":
+    main()
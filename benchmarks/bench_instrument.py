@@ -0,0 +1,45 @@
+"""Cost of instrumentation per call: hot operations timed before
+instrumentation was ever enabled, while enabled and after disabling.
+
+$ python benchmarks/bench_instrument.py
+"""
+
+import timeit
+
+from bitvector import BitVector, BitField
+from bitvector import instrument
+
+
+class Record(BitVector):
+    mid = BitField(3, 5)
+
+
+def measure(stmt, number: int = 200_000) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e9
+
+
+def main() -> None:
+    a = BitVector(0xF0F0, size=128)
+    b = BitVector(0x3C3C, size=128)
+    record = Record(0xFF, size=32)
+
+    cases = {
+        "getitem-int": lambda: a[7],
+        "getitem-slice": lambda: a[8:16],
+        "setitem-int": lambda: a.__setitem__(7, 1),
+        "and": lambda: a & b,
+        "iand": lambda: a.__iand__(b),
+        "bitfield-get": lambda: record.mid,
+    }
+
+    print(f"{'operation':16} {'never':>9} {'enabled':>9} {'disabled':>9}  nsec/call")
+    for name, stmt in cases.items():
+        before = measure(stmt)
+        with instrument.instrumented():
+            during = measure(stmt)
+        after = measure(stmt)
+        print(f"{name:16} {before:9.0f} {during:9.0f} {after:9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Eager operators against lazy, fused evaluation of expressions with
+5, 10 and 20 operands, on dense random vectors and on sparse ones
+where AND short-circuits.
+
+$ python benchmarks/bench_lazy.py [bits]     # default 16777216
+"""
+
+import random
+import sys
+import timeit
+
+from bitvector import BitVector
+from bitvector.lazy import lazy
+
+
+def vectors(count: int, size: int, backend: str, sparse: bool, rng: random.Random) -> list:
+    result = []
+    for _ in range(count):
+        if sparse:
+            # a few clustered runs of ones, most words are zero
+            value = 0
+            for _ in range(4):
+                start = rng.randrange(size - 4096)
+                value |= ((1 << 4096) - 1) << start
+        else:
+            value = rng.getrandbits(size)
+        result.append(BitVector(value, size=size, backend=backend))
+    return result
+
+
+def expression(vs: list, wrap):
+    # alternating terms of ((v0 & v1) | (v2 & ~v3)) ^ ... in groups of five
+    expr = None
+    for n in range(0, len(vs), 5):
+        a, b, c, d, e = (wrap(v) for v in vs[n : n + 5])
+        term = (a & b) | (c & ~d) ^ e
+        expr = term if expr is None else expr ^ term
+    return expr
+
+
+def conjunction(vs: list, wrap):
+    expr = wrap(vs[0])
+    for v in vs[1:]:
+        expr = expr & v
+    return expr
+
+
+def msec(func) -> float:
+    return min(timeit.repeat(func, number=1, repeat=3)) * 1e3
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1 << 24
+    rng = random.Random(7)
+
+    print(f"{size} bits, msec per evaluation")
+    print(f"{'backend':>8} {'data':>7} {'shape':>12} {'operands':>8} {'eager':>9} {'lazy':>9} {'speedup':>8}")
+
+    for backend in ["int", "bytes"]:
+        for sparse in [False, True]:
+            pool = vectors(20, size, backend, sparse, rng)
+            for name, build in [("mixed", expression), ("and-chain", conjunction)]:
+                for count in [5, 10, 20]:
+                    vs = pool[:count]
+                    eager = msec(lambda: build(vs, lambda v: v))
+                    fused = msec(lambda: build(vs, lazy).evaluate())
+                    assert build(vs, lazy).evaluate() == build(vs, lambda v: v)
+                    data = "sparse" if sparse else "dense"
+                    print(
+                        f"{backend:>8} {data:>7} {name:>12} {count:>8} {eager:9.1f} {fused:9.1f} {eager / fused:7.1f}x"
+                    )
+
+
+if __name__ == "__main__":
+    main()
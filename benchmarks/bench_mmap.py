@@ -0,0 +1,68 @@
+"""Memory-mapped BitVectors: random single-bit reads and writes on a
+sparse file that can be larger than RAM, and opening a file compared
+with reading it into an int.
+
+$ python benchmarks/bench_mmap.py [GiB]    # default 8
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from bitvector import BitVector
+
+
+def msec(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+
+    gib = float(sys.argv[1]) if len(sys.argv) > 1 else 8
+    size = int(gib * (1 << 33)) & ~0x7
+    rng = random.Random(0)
+    offsets = [rng.randrange(size) for _ in range(100_000)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "large.bits")
+
+        t_open = msec(lambda: BitVector.open(path, size=size, mode="w+").close())
+        bv = BitVector.open(path, size=size, mode="r+")
+        print(f"{gib:g} GiB sparse file, {size} bits: create {t_open:.1f} msec")
+
+        t_write = msec(lambda: [bv._setb(n) for n in offsets[:10_000]])
+        t_flush = msec(bv.flush)
+        print(f"  random writes       {t_write * 1e3 / 10_000:7.2f} usec/bit, flush {t_flush:.1f} msec")
+
+        t_read = msec(lambda: [bv[n] for n in offsets])
+        print(f"  random reads        {t_read * 1e3 / len(offsets):7.2f} usec/bit")
+
+        cached = [n % (64 << 23) for n in offsets]
+        [bv[n] for n in cached]
+        t_read = msec(lambda: [bv[n] for n in cached])
+        print(f"  reads, first 64 MiB {t_read * 1e3 / len(offsets):7.2f} usec/bit (page cache)")
+        bv.close()
+
+        small = os.path.join(tmp, "small.bits")
+        with open(small, "wb") as f:
+            f.write(os.urandom(64 << 20))
+
+        def read_int():
+            with open(small, "rb") as f:
+                return BitVector(int.from_bytes(f.read(), "little"), size=(64 << 23))
+
+        print("64 MiB file:")
+        print(f"  read into an int   {msec(read_int):7.1f} msec")
+        print(f"  BitVector.open     {msec(lambda: BitVector.open(small).close()):7.1f} msec")
+
+        with BitVector.open(small, mode="r+") as a:
+            b = BitVector.from_buffer(bytearray(os.urandom(64 << 20)), byteorder="little")
+            print(f"  a |= b in place    {msec(lambda: a.__ior__(b)):7.1f} msec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""BitVector <-> NumPy conversion versus per-bit indexing.
+
+$ python benchmarks/bench_numpy.py
+"""
+
+import random
+import time
+
+import numpy as np
+
+from bitvector import BitVector
+
+
+def clock(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+
+    print(f"{'size':>9} {'loop ms':>10} {'to_numpy ms':>12} {'from_numpy ms':>14}")
+
+    for size in [1 << 12, 1 << 16, 1 << 20]:
+        bv = BitVector(random.getrandbits(size), size=size)
+        _, loop = clock(lambda: np.array([bv[n] for n in range(size)], dtype=bool))
+        arr, to = clock(bv.to_numpy)
+        _, back = clock(BitVector.from_numpy, arr)
+        print(f"{size:>9} {loop:>10.2f} {to:>12.2f} {back:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Parsing packed headers: overlay and repoint versus copying each
+record into a new BitVector.
+
+$ python benchmarks/bench_overlay.py
+"""
+
+import time
+
+from bitvector import BitVector, BitField
+
+
+class UDPHeader(BitVector):
+    sport = BitField(48, 16)
+    dport = BitField(32, 16)
+    length = BitField(16, 16)
+    checksum = BitField(0, 16)
+
+
+def copy_each(buf: bytearray, count: int) -> int:
+    total = 0
+    for i in range(count):
+        hdr = UDPHeader(int.from_bytes(buf[i * 8 : i * 8 + 8], "big"), size=64)
+        total += hdr.dport
+    return total
+
+
+def from_buffer_each(buf: bytearray, count: int) -> int:
+    total = 0
+    view = memoryview(buf)
+    for i in range(count):
+        total += UDPHeader.from_buffer(view[i * 8 : i * 8 + 8]).dport
+    return total
+
+
+def overlay(buf: bytearray, count: int) -> int:
+    total = 0
+    for hdr in UDPHeader.iter_overlay(buf):
+        total += hdr.dport
+    return total
+
+
+def copy_each_rewrite(buf: bytearray, count: int) -> None:
+    for i in range(count):
+        hdr = UDPHeader(int.from_bytes(buf[i * 8 : i * 8 + 8], "big"), size=64)
+        hdr.dport = 80
+        buf[i * 8 : i * 8 + 8] = hdr.bytes
+
+
+def overlay_rewrite(buf: bytearray, count: int) -> None:
+    for hdr in UDPHeader.iter_overlay(buf):
+        hdr.dport = 80
+
+
+def main(count: int = 100_000) -> None:
+
+    buf = bytes(range(256)) * (count * 8 // 256)
+
+    cases = [
+        ("copy each", copy_each),
+        ("from_buffer each", from_buffer_each),
+        ("iter_overlay", overlay),
+        ("copy + write back", copy_each_rewrite),
+        ("iter_overlay write", overlay_rewrite),
+    ]
+
+    for name, func in cases:
+        data = bytearray(buf)
+        start = time.perf_counter()
+        func(data, count)
+        usec = (time.perf_counter() - start) / count * 1e6
+        print(f"{name:>20}: {usec:8.3f} usec/record")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Scaling of parallel popcount and OR-reduction from one worker to
+one per CPU: a 2**30-bit vector and 1000 vectors of 2**20 bits.
+
+$ python benchmarks/bench_parallel.py [workers]    # default os.cpu_count()
+"""
+
+import functools
+import operator
+import os
+import random
+import sys
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+from bitvector import BitVector, parallel
+from bitvector.shared import SharedBitVector
+
+
+def msec(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+
+    nworkers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+    rng = random.Random(0)
+
+    big = SharedBitVector(size=1 << 30, locks=0)
+    big.value = rng.getrandbits(1 << 30)
+    bitmaps = [BitVector(rng.getrandbits(1 << 20), size=1 << 20, backend="bytes") for _ in range(1000)]
+
+    print(f"serial: count 2**30 bits {msec(big.count):8.1f} msec", end=", ")
+    print(f"OR of 1000 x 2**20 bits {msec(lambda: functools.reduce(operator.or_, bitmaps)):8.1f} msec")
+
+    for workers in sorted({1, 2, 4, nworkers}):
+        with ProcessPoolExecutor(workers) as pool:
+            parallel.count(big, executor=pool)  # start the workers
+            t_count = msec(lambda: parallel.count(big, workers=workers, executor=pool))
+            t_reduce = msec(lambda: parallel.reduce(operator.or_, bitmaps, workers=workers, executor=pool))
+        print(f"{workers:2} workers: count {t_count:8.1f} msec, OR {t_reduce:8.1f} msec")
+
+    big.close()
+    big.unlink()
+
+
+if __name__ == "__main__":
+    main()
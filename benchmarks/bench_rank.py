@@ -0,0 +1,56 @@
+"""count(), rank() and select() on large vectors across bit densities,
+compared with masking and counting the value for every query.
+
+$ python benchmarks/bench_rank.py
+"""
+
+import random
+import time
+import timeit
+
+from bitvector import BitVector
+
+
+def random_value(size: int, density: float, rng: random.Random) -> int:
+    data = bytearray((size + 7) // 8)
+    for offset in rng.sample(range(size), int(size * density)):
+        data[offset >> 3] |= 1 << (offset & 0x7)
+    return int.from_bytes(data, "little")
+
+
+def usec(statement, number: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=3)) / number * 1e6
+
+
+def main(size: int = 4_000_000, queries: int = 2_000) -> None:
+
+    rng = random.Random(0)
+    offsets = [rng.randrange(size) for _ in range(queries)]
+
+    print(f"size={size} bits, times in usec")
+    print(f"{'density':>8} {'count':>9} {'build':>9} {'rank':>7} {'naive rank':>11} {'select':>7}")
+
+    for density in [0.001, 0.01, 0.1, 0.5, 0.9]:
+        bv = BitVector(random_value(size, density, rng), size=size)
+        value = bv.value
+        total = bv.count()
+        ranks = [rng.randrange(total) for _ in range(queries)]
+
+        t_count = usec(bv.count, 10)
+
+        start = time.perf_counter()
+        bv.rank(0)
+        t_build = (time.perf_counter() - start) * 1e6
+
+        it = iter(offsets * 1000)
+        t_rank = usec(lambda: bv.rank(next(it)), queries)
+        it = iter(offsets * 1000)
+        t_naive = usec(lambda: bin(value & ((1 << next(it)) - 1)).count("1"), 20)
+        it = iter(ranks * 1000)
+        t_select = usec(lambda: bv.select(next(it)), queries)
+
+        print(f"{density:>8} {t_count:>9.1f} {t_build:>9.1f} {t_rank:>7.2f} {t_naive:>11.1f} {t_select:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
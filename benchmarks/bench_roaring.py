@@ -0,0 +1,46 @@
+"""RoaringBitmap set algebra on sparse 2**32-bit segment bitmaps, with
+a dense BitVector of 2**28 bits for scale.
+
+$ python benchmarks/bench_roaring.py
+"""
+
+import random
+import time
+
+from bitvector import BitVector, RoaringBitmap
+
+
+def msec(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+
+    rng = random.Random(0)
+
+    for ones in [10_000, 1_000_000]:
+        a_values = [rng.getrandbits(32) for _ in range(ones)]
+        b_values = [rng.getrandbits(32) for _ in range(ones)]
+        b_values += a_values[: ones // 10]
+
+        t_build = msec(lambda: RoaringBitmap(a_values))
+        a, b = RoaringBitmap(a_values), RoaringBitmap(b_values)
+        probes = b_values[:10_000]
+
+        print(f"2**32 bits, {ones} ones: {a.nbytes / 1e6:.2f} MB (dense 536.87 MB)")
+        print(f"  build {t_build:9.1f} msec")
+        for name, func in [("&", lambda: a & b), ("|", lambda: a | b), ("^", lambda: a ^ b), ("-", lambda: a - b)]:
+            print(f"  a {name} b {msec(func):9.1f} msec")
+        print(f"  in    {msec(lambda: [n in a for n in probes]) * 1e3 / len(probes):9.2f} usec")
+        print(f"  iter  {msec(lambda: sum(1 for _ in a)):9.1f} msec")
+
+    size = 1 << 28
+    a = BitVector(rng.getrandbits(size), size=size)
+    b = BitVector(rng.getrandbits(size), size=size)
+    print(f"dense 2**28 bits: a & b {msec(lambda: a & b):.1f} msec, count {msec(a.count):.1f} msec")
+
+
+if __name__ == "__main__":
+    main()
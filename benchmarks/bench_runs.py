@@ -0,0 +1,52 @@
+"""Run iteration, free-run search and allocation on a fragmented
+64M-bit allocation bitmap.
+
+$ python benchmarks/bench_runs.py
+"""
+
+import os
+import time
+
+from bitvector import BitVector
+
+
+def fragmented(nbytes: int) -> bytes:
+    """Random bytes mapped to mostly 0x00 and 0xff with some mixed
+    bytes, giving free runs of geometrically distributed length.
+    """
+    table = bytes(0x00 if n < 120 else 0xFF if n < 240 else n for n in range(256))
+    return os.urandom(nbytes).translate(table)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1e3
+
+
+def main(size: int = 64 * 1024 * 1024) -> None:
+
+    data = fragmented(size // 8)
+
+    for backend in ["bytes", "int"]:
+        bv = BitVector(int.from_bytes(data, "little"), size=size, backend=backend)
+        print(f"backend={backend} size={size} bits")
+
+        if backend == "bytes":
+            runs, msec = timed(lambda: sum(1 for _ in bv.iter_runs(0)))
+            print(f"  iter_runs(0): {runs} runs in {msec:.0f} msec, {msec * 1e3 / runs:.2f} usec/run")
+
+        for length in [8, 64, 256, 1024]:
+            offset, msec = timed(lambda: bv.find_run(length))
+            print(f"  find_run({length:>4}) = {offset:>9}: {msec:8.2f} msec")
+
+        work = BitVector(bv.value, size=size, backend=backend)
+        count = 200
+        _, msec = timed(lambda: [work.allocate(64) for _ in range(count)])
+        print(f"  allocate(64) x{count}: {msec * 1e3 / count:10.1f} usec/call")
+        _, msec = timed(lambda: [work.free(n * 1024, 64) for n in range(count)])
+        print(f"  free(64) x{count}:     {msec * 1e3 / count:10.1f} usec/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Walking the set bits of a vector: iter_ones() and find_next_set()
+versus indexing every position.
+
+$ python benchmarks/bench_scan.py
+"""
+
+import random
+import time
+
+from bitvector import BitVector
+
+
+def indexing(bv: BitVector) -> int:
+    return sum(1 for i in range(len(bv)) if bv[i])
+
+
+def iter_ones(bv: BitVector) -> int:
+    return sum(1 for _ in bv.iter_ones())
+
+
+def find_next(bv: BitVector) -> int:
+    count = 0
+    offset = bv.find_first_set()
+    while offset >= 0:
+        count += 1
+        offset = bv.find_next_set(offset + 1)
+    return count
+
+
+def msec(func, bv: BitVector) -> float:
+    start = time.perf_counter()
+    func(bv)
+    return (time.perf_counter() - start) * 1e3
+
+
+def main(size: int = 1_000_000) -> None:
+
+    rng = random.Random(0)
+
+    print(f"size={size} bits, times in msec")
+    print(f"{'density':>8} {'indexing':>10} {'iter_ones':>10} {'find_next':>10} {'iter_zeros':>11}")
+
+    for density in [0.0001, 0.001, 0.01, 0.1, 0.5]:
+        data = bytearray(size // 8)
+        for offset in rng.sample(range(size), int(size * density)):
+            data[offset >> 3] |= 1 << (offset & 0x7)
+        bv = BitVector(int.from_bytes(data, "little"), size=size)
+
+        t_index = msec(indexing, bv) if density == 0.01 else float("nan")
+        t_iter = msec(iter_ones, bv)
+        t_find = msec(find_next, bv)
+        t_zeros = msec(lambda v: sum(1 for _ in v.iter_zeros()), bv)
+
+        print(f"{density:>8} {t_index:>10.1f} {t_iter:>10.2f} {t_find:>10.2f} {t_zeros:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""N worker processes marking random bits in one SharedBitVector, with
+and without striped locks, compared with pickling the whole value to
+every worker.
+
+$ python benchmarks/bench_shared.py [workers]    # default os.cpu_count()
+"""
+
+import os
+import pickle
+import random
+import sys
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+from bitvector import BitVector
+from bitvector.shared import SharedBitVector, attach
+
+
+SIZE = 1 << 26
+MARKS = 200_000
+
+
+def init(name, locks) -> None:
+    global shared
+    shared = attach(name, locks)
+
+
+def mark(seed: int) -> int:
+    rng = random.Random(seed)
+    for _ in range(MARKS):
+        shared[rng.randrange(SIZE)] = 1
+    return MARKS
+
+
+def unpickle(data: bytes) -> int:
+    return len(pickle.loads(data))
+
+
+def main() -> None:
+
+    nworkers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+    dense = BitVector(random.getrandbits(SIZE), size=SIZE)
+
+    for workers in sorted({1, max(1, nworkers // 2), nworkers}):
+        data = pickle.dumps(dense)
+        with ProcessPoolExecutor(workers) as pool:
+            start = time.perf_counter()
+            list(pool.map(unpickle, [data] * workers))
+            t_pickle = time.perf_counter() - start
+
+        print(f"{workers} workers, {SIZE} bits:")
+        print(f"  pickle value to each worker {t_pickle * 1e3:8.1f} msec")
+
+        for locks in [16, 0]:
+            with SharedBitVector(size=SIZE, locks=locks) as bv:
+                with ProcessPoolExecutor(workers, initializer=init, initargs=(bv.name, bv.locks)) as pool:
+                    start = time.perf_counter()
+                    marks = sum(pool.map(mark, range(workers)))
+                    elapsed = time.perf_counter() - start
+                label = f"{locks} lock stripes" if locks else "no locks"
+                print(f"  mark, {label:15} {marks / elapsed / 1e6:8.2f} M bits/s ({elapsed * 1e3:.0f} msec)")
+                bv.unlink()
+
+
+if __name__ == "__main__":
+    main()
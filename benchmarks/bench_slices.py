@@ -0,0 +1,31 @@
+"""Field access cost for BitVector slices of increasing width.
+
+$ python benchmarks/bench_slices.py
+"""
+
+import timeit
+
+from bitvector import BitVector
+
+
+def main(size: int = 4096, number: int = 20_000) -> None:
+
+    bv = BitVector(((1 << size) - 1) // 3, size=size)
+
+    print(f"{'width':>6} {'step':>5} {'get usec':>10} {'set usec':>10}")
+
+    for step in [1, 3, -1]:
+        for width in [1, 8, 32, 64, 256, 1024]:
+            if step > 0:
+                key = slice(size // 2, size // 2 + width * step, step)
+            else:
+                key = slice(size // 2 + width - 1, size // 2 - 1, step)
+            get = timeit.timeit(lambda: bv[key], number=number)
+            put = timeit.timeit(lambda: bv.__setitem__(key, 0x5A5A), number=number)
+            get_us = get / number * 1e6
+            set_us = put / number * 1e6
+            print(f"{width:>6} {step:>5} {get_us:>10.3f} {set_us:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Searching a sparse 256M-bit vector with the "summary" backend
+versus the flat "bytes" backend.
+
+$ python benchmarks/bench_summary.py
+"""
+
+import random
+import time
+
+from bitvector import BitVector
+
+
+def usec(func, number: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def walk(bv: BitVector) -> int:
+    count = 0
+    offset = bv.find_next_set(0)
+    while offset >= 0:
+        count += 1
+        offset = bv.find_next_set(offset + 1)
+    return count
+
+
+def main(size: int = 1 << 28, ones: int = 1000) -> None:
+
+    rng = random.Random(0)
+    offsets = rng.sample(range(size), ones)
+
+    print(f"size={size} bits, {ones} bits set, times in usec")
+
+    for backend in ["bytes", "summary"]:
+        bv = BitVector(0, size=size, backend=backend)
+        t_set = usec(lambda: [bv.__setitem__(n, 1) for n in offsets]) / ones
+        t_walk = usec(lambda: walk(bv))
+        t_iter = usec(lambda: sum(1 for _ in bv.iter_ones()))
+        t_last = usec(bv.find_last_set, 10)
+        bv.clear()
+        t_bool = usec(lambda: bool(bv), 10)
+        bv[size - 1] = 1
+        t_next = usec(lambda: bv.find_next_set(1), 10)
+
+        print(f"  {backend:>8}: set {t_set:8.2f}/bit  walk {t_walk:10.0f}  iter_ones {t_iter:10.0f}")
+        print(f"  {'':>8}  find_last_set {t_last:10.1f}  bool(empty) {t_bool:10.1f}  next(far) {t_next:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
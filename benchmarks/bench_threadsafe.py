@@ -0,0 +1,62 @@
+"""Throughput of threads setting bits in one vector: a plain BitVector
+(which loses updates), a ThreadSafeBitVector with a single lock and
+one with 16 lock stripes. Run it on both a regular and a free-threaded
+(python3.13t) build to compare scaling.
+
+$ python benchmarks/bench_threadsafe.py [threads]    # default os.cpu_count()
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+
+from bitvector import BitVector
+from bitvector.threadsafe import ThreadSafeBitVector
+
+
+SIZE = 1 << 20
+WRITES = 200_000
+
+
+def run(bv, nthreads: int) -> float:
+    chunks = [random.Random(n).sample(range(SIZE), WRITES // nthreads) for n in range(nthreads)]
+
+    def work(offsets):
+        setb = bv._setb
+        for offset in offsets:
+            setb(offset)
+
+    threads = [threading.Thread(target=work, args=(chunk,)) for chunk in chunks]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    expected = len(set().union(*chunks))
+    lost = expected - bv.count()
+    return WRITES / elapsed / 1e6, lost
+
+
+def main() -> None:
+
+    nthreads = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, {WRITES} writes")
+
+    for threads in sorted({1, 2, 4, nthreads}):
+        for label, make in [
+            ("BitVector, bytes", lambda: BitVector(size=SIZE, backend="bytes")),
+            ("BitVector, int", lambda: BitVector(size=SIZE)),
+            ("1 lock", lambda: ThreadSafeBitVector(size=SIZE, locks=1)),
+            ("16 stripes", lambda: ThreadSafeBitVector(size=SIZE, locks=16)),
+        ]:
+            rate, lost = run(make(), threads)
+            print(f"  {threads:2} threads, {label:16} {rate:6.2f} M writes/s, {lost} lost")
+
+
+if __name__ == "__main__":
+    main()
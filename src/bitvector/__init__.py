@@ -1,7 +1,46 @@
 """Bit Vector for Humans™"""
 
+import importlib
+import os
+
 from .bitvector import BitVector
 from .bitfield import BitField
 from .bitfield import ReadOnlyBitField
 
-__all__ = ["BitVector", "BitField", "ReadOnlyBitField"]
+__all__ = [
+    "BitVector",
+    "BitField",
+    "ReadOnlyBitField",
+    "BitVectorArray",
+    "RoaringBitmap",
+    "EWAHBitmap",
+    "FrozenBitVector",
+]
+
+# imported on first use so they do not slow down `import bitvector`
+_LAZY = {
+    "BitVectorArray": "bitvector.bitvectorarray:BitVectorArray",
+    "RoaringBitmap": "bitvector.roaring:RoaringBitmap",
+    "EWAHBitmap": "bitvector.ewah:EWAHBitmap",
+    "FrozenBitVector": "bitvector.frozen:FrozenBitVector",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module, _, attr = _LAZY[name].partition(":")
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = globals()[name] = getattr(importlib.import_module(module), attr)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+if os.environ.get("BITVECTOR_INSTRUMENT"):
+    from .instrument import _enable_from_environment
+
+    _enable_from_environment()
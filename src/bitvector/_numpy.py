@@ -0,0 +1,94 @@
+"""NumPy support for BitVector, imported on first use."""
+
+import operator
+
+from typing import Dict
+
+import numpy
+
+from .backends import ByteOrder, BytesBackend, bytes_to_int, layout_backend
+
+
+_BITORDER: Dict[str, ByteOrder] = {"lsb": "little", "msb": "big"}
+_WORD = {"lsb": "<u8", "msb": ">u8"}
+
+
+_UFUNCS = {
+    operator.and_: numpy.bitwise_and,
+    operator.or_: numpy.bitwise_or,
+    operator.xor: numpy.bitwise_xor,
+}
+
+
+class NumpyBackend(BytesBackend):
+    """Stores the vector in a NumPy uint8 array with the same layout
+    as the "bytes" backend. AND, OR and XOR between vectors of the same
+    size are computed with NumPy ufuncs rather than integer arithmetic.
+    """
+
+    name = "numpy"
+
+    @staticmethod
+    def allocate(meta) -> memoryview:
+        return numpy.zeros(meta.nbytes, dtype=numpy.uint8).data
+
+    @staticmethod
+    def binary_op(func, store: memoryview, other: memoryview, inplace: bool):
+        try:
+            ufunc = _UFUNCS[func]
+        except KeyError:
+            return NotImplemented
+
+        a = numpy.asarray(store)
+
+        if inplace:
+            ufunc(a, numpy.asarray(other), out=a)
+            return store
+
+        return memoryview(ufunc(a, numpy.asarray(other)))
+
+
+def to_numpy(bv, dtype, bit_order: str):
+    """Returns the bits of `bv` as a NumPy array, see BitVector.to_numpy."""
+    dtype = numpy.dtype(dtype)
+    data = bytes(bv.to_buffer("little", bit_order))
+
+    if dtype == numpy.bool_:
+        packed = numpy.frombuffer(data, dtype=numpy.uint8)
+        bits = numpy.unpackbits(packed, count=len(bv), bitorder=_BITORDER[bit_order])
+        return bits.view(numpy.bool_)
+
+    if dtype == numpy.uint8:
+        return numpy.frombuffer(data, dtype=numpy.uint8).copy()
+
+    if dtype == numpy.uint64:
+        data += bytes(-len(data) % 8)
+        return numpy.frombuffer(data, dtype=_WORD[bit_order]).astype(numpy.uint64)
+
+    raise TypeError(f"Unsupported dtype: {dtype}")
+
+
+def from_numpy(cls, arr, bit_order: str, size):
+    """Returns a new `cls` holding the bits of `arr`, see BitVector.from_numpy."""
+    layout_backend("little", bit_order)
+
+    arr = numpy.ascontiguousarray(arr).ravel()
+
+    if arr.dtype == numpy.bool_:
+        data = numpy.packbits(arr, bitorder=_BITORDER[bit_order]).tobytes()
+        nbits = len(arr)
+    elif arr.dtype == numpy.uint8:
+        data = arr.tobytes()
+        nbits = len(data) * 8
+    elif arr.dtype == numpy.uint64:
+        data = arr.astype(_WORD[bit_order]).tobytes()
+        nbits = len(data) * 8
+    else:
+        raise TypeError(f"Unsupported dtype: {arr.dtype}")
+
+    return cls(bytes_to_int(data, "little", bit_order), size=size or nbits)
+
+
+def uint64_column(words):
+    """Returns a NumPy uint64 copy of an array('Q')."""
+    return numpy.frombuffer(words, dtype=numpy.uint64).copy()
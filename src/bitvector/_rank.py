@@ -0,0 +1,297 @@
+"""Rank, select and scan support for BitVector.
+
+A RankDirectory holds a little-endian snapshot of the vector's bits.
+The first rank or select builds two levels of counts:
+
+- a superblock count, the number of ones before every 65536 bits,
+  kept in an array of 64-bit words
+- a block count, the number of ones between the start of the
+  superblock and every 512 bits, kept in an array of 16-bit words
+
+which is about 3% of the size of the vector. A rank is two table
+lookups and the popcount of less than one block, a select is a binary
+search of each level followed by a scan of a single block.
+
+The scanning functions find set or clear bits and runs of them in a
+snapshot with regular expression searches that skip runs of 0x00 or
+0xff bytes in C, so their cost grows with the number of bits or runs
+found rather than with the size of the vector. A snapshot is any
+bytes-like object, including the live buffer of a vector.
+"""
+
+import re
+import sys
+
+from array import array
+from bisect import bisect_right
+from typing import Iterator, Optional, Tuple, Union
+
+
+POPCOUNT = bytes(bin(n).count("1") for n in range(256))
+
+try:
+    popcount = int.bit_count
+except AttributeError:  # pragma: no cover Python < 3.10
+
+    def popcount(value: int) -> int:  # type: ignore[misc]
+        """Returns the number of ones in a non-negative integer."""
+        return bin(value).count("1")
+
+
+LOWBIT = bytes([8]) + bytes((n & -n).bit_length() - 1 for n in range(1, 256))
+INVERT = bytes(n ^ 0xFF for n in range(256))
+
+BLOCK_BYTES = 64
+BLOCKS_PER_SUPER = 128
+CHUNK_BYTES = 1 << 20
+
+Buffer = Union[bytes, memoryview]
+
+_NONZERO = re.compile(rb"[^\x00]")
+_NONZERO_RUN = re.compile(rb"[^\x00]+")
+_NONFULL = re.compile(rb"[^\xff]")
+
+
+class RankDirectory:
+    """Block and superblock counts of the set bits in `data`, built on
+    first use.
+    """
+
+    __slots__ = ("data", "supers", "blocks", "total")
+
+    supers: array
+    blocks: Optional[array]
+    total: int
+
+    def __init__(self, data: Buffer):
+        """
+        :param data: Buffer little-endian bits
+        """
+        self.data = data
+        self.blocks = None
+
+    def __sizeof__(self) -> int:
+        # a snapshot copied into bytes is retained, a view of the vector's buffer is not
+        size = object.__sizeof__(self)
+        if isinstance(self.data, bytes):
+            size += sys.getsizeof(self.data)
+        if self.blocks is not None:
+            size += sys.getsizeof(self.supers) + sys.getsizeof(self.blocks) + sys.getsizeof(self.total)
+        return size
+
+    def _build(self) -> array:
+        data = self.data
+        supers = array("Q")
+        blocks = array("H")
+        total = base = 0
+
+        for n, lo in enumerate(range(0, len(data), BLOCK_BYTES)):
+            if n % BLOCKS_PER_SUPER == 0:
+                supers.append(total)
+                base = total
+            blocks.append(total - base)
+            total += popcount(int.from_bytes(data[lo : lo + BLOCK_BYTES], "little"))
+
+        self.supers = supers
+        self.blocks = blocks
+        self.total = total
+        return blocks
+
+    def count(self) -> int:
+        """Returns the number of ones.
+
+        :return: int
+        """
+        if self.blocks is None:
+            self._build()
+
+        return self.total
+
+    def rank(self, offset: int) -> int:
+        """Returns the number of ones below `offset`.
+
+        :param offset: int 0 <= offset <= number of bits
+        :return: int
+        """
+        blocks = self.blocks
+        if blocks is None:
+            blocks = self._build()
+
+        block = offset >> 9
+
+        if block >= len(blocks):
+            return self.total
+
+        ones = self.supers[block >> 7] + blocks[block]
+        bits = offset & 0x1FF
+
+        if bits:
+            lo = block * BLOCK_BYTES
+            chunk = int.from_bytes(self.data[lo : lo + ((bits + 7) >> 3)], "little")
+            ones += popcount(chunk & ((1 << bits) - 1))
+
+        return ones
+
+    def select(self, k: int) -> int:
+        """Returns the offset of the one with rank `k`.
+
+        :param k: int 0 <= k < count()
+        :return: int
+        """
+        blocks = self.blocks
+        if blocks is None:
+            blocks = self._build()
+
+        sup = bisect_right(self.supers, k) - 1
+        k -= self.supers[sup]
+
+        lo = sup * BLOCKS_PER_SUPER
+        hi = min(lo + BLOCKS_PER_SUPER, len(blocks))
+        block = bisect_right(blocks, k, lo, hi) - 1
+        k -= blocks[block]
+
+        start = block * BLOCK_BYTES
+        for n, byte in enumerate(self.data[start : start + BLOCK_BYTES]):
+            ones = POPCOUNT[byte]
+            if k < ones:
+                break
+            k -= ones
+
+        for bit in range(8):
+            if byte >> bit & 1:
+                if not k:
+                    break
+                k -= 1
+
+        return (start + n) * 8 + bit
+
+
+def count_ones(data: Buffer) -> int:
+    """Returns the number of ones in `data`, counting a chunk at a time
+    so no int the size of `data` is created.
+
+    :param data: Buffer in any layout
+    :return: int
+    """
+    return sum(
+        popcount(int.from_bytes(data[lo : lo + CHUNK_BYTES], "little"))
+        for lo in range(0, len(data), CHUNK_BYTES)
+    )
+
+
+def find_next(data: Buffer, offset: int, value: int = 1) -> int:
+    """Returns the first offset at or after `offset` whose bit equals
+    `value`, or -1 if there is none. Bits past the end of the vector in
+    the last byte of `data` are not excluded.
+
+    :param data: Buffer little-endian bits
+    :param offset: int
+    :param value: int 1 or 0
+    :return: int
+    """
+    index = offset >> 3
+
+    if index >= len(data):
+        return -1
+
+    flip = 0 if value else 0xFF
+    byte = ((data[index] ^ flip) >> (offset & 0x7)) << (offset & 0x7)
+
+    if not byte:
+        match = (_NONZERO if value else _NONFULL).search(data, index + 1)
+        if match is None:
+            return -1
+        index = match.start()
+        byte = data[index] ^ flip
+
+    return index * 8 + LOWBIT[byte]
+
+
+def iter_set(data: Buffer, limit: int) -> Iterator[int]:
+    """Yields the offsets below `limit` of the ones in `data` in
+    increasing order.
+
+    :param data: Buffer little-endian bits
+    :param limit: int
+    :return: Iterator[int]
+    """
+    for match in _NONZERO_RUN.finditer(data):
+        end = match.end()
+        for lo in range(match.start(), end, 8):
+            word = int.from_bytes(data[lo : min(lo + 8, end)], "little")
+            base = lo * 8
+            while word:
+                low = word & -word
+                offset = base + low.bit_length() - 1
+                if offset >= limit:
+                    return
+                yield offset
+                word ^= low
+
+
+def iter_runs(data: Buffer, limit: int, value: int = 1, start: int = 0) -> Iterator[Tuple[int, int]]:
+    """Yields (offset, length) for each run of consecutive bits equal
+    to `value` between `start` and `limit`, in increasing order.
+
+    :param data: Buffer little-endian bits
+    :param limit: int
+    :param value: int 1 or 0
+    :param start: int
+    :return: Iterator[Tuple[int, int]]
+    """
+    offset = start
+
+    while offset < limit:
+        begin = find_next(data, offset, value)
+        if not 0 <= begin < limit:
+            return
+        end = find_next(data, begin, value ^ 1)
+        if not 0 <= end < limit:
+            end = limit
+        yield begin, end - begin
+        offset = end
+
+
+def find_run(data: Buffer, limit: int, length: int, value: int = 0, start: int = 0) -> int:
+    """Returns the offset of the first run of at least `length` bits
+    equal to `value` between `start` and `limit`, or -1 if there is
+    none.
+
+    A run of `length` bits covers at least (length - 7) // 8 whole
+    bytes of 0x00 (or 0xff), so long runs are found by searching for
+    those bytes as a literal string, which the regular expression
+    engine scans for quickly, and extending each match into its
+    neighbours; shorter runs are found by walking the runs in order.
+
+    :param data: Buffer little-endian bits
+    :param limit: int
+    :param length: int
+    :param value: int 1 or 0
+    :param start: int
+    :return: int
+    """
+    whole = (length - 7) // 8
+
+    if whole < 1:
+        for begin, size in iter_runs(data, limit, value, start):
+            if size >= length:
+                return begin
+        return -1
+
+    flip = 0xFF if value else 0
+    fill = re.escape(bytes([flip]))
+    pattern = re.compile(fill * whole + fill + b"*")
+
+    for match in pattern.finditer(data, start >> 3):
+        lo, hi = match.span()
+        begin = lo * 8
+        if lo:
+            begin -= 8 - (data[lo - 1] ^ flip).bit_length()
+        end = hi * 8
+        if hi < len(data):
+            end += LOWBIT[data[hi] ^ flip]
+        begin = max(begin, start)
+        if min(end, limit) - begin >= length:
+            return begin
+
+    return -1
@@ -0,0 +1,101 @@
+"""Slice engine for BitVector bit fields.
+
+All functions operate on plain integers so the cost of reading or
+writing a field depends on the width of the field and not on the
+number of Python level operations per bit:
+
+- contiguous (step 1) slices are a single shift and mask
+- strided slices gather/scatter the bits of the spanned field
+  using C-level string slicing
+- negative steps use the same path, which reverses the bits
+"""
+
+from typing import Tuple
+
+
+def span(start: int, stop: int, step: int) -> Tuple[int, int, int]:
+    """Returns (count, low, width) for the normalized slice.
+
+    `count` is the number of bits addressed by the slice, `low` is the
+    lowest addressed offset and `width` is the number of bits between
+    the lowest and highest addressed offsets (inclusive).
+
+    :param start: int
+    :param stop: int
+    :param step: int
+    :return: Tuple[int, int, int]
+    """
+    count = len(range(start, stop, step))
+
+    if count == 0:
+        return 0, 0, 0
+
+    if step > 0:
+        return count, start, (count - 1) * step + 1
+
+    low = start + (count - 1) * step
+
+    return count, low, start - low + 1
+
+
+def get_slice(value: int, start: int, stop: int, step: int) -> int:
+    """Extracts the bits of `value` addressed by the normalized slice
+    and returns them packed into an integer, the first addressed bit
+    becoming bit zero of the result.
+
+    :param value: int
+    :param start: int
+    :param stop: int
+    :param step: int
+    :return: int
+    """
+    count, low, width = span(start, stop, step)
+
+    if count == 0:
+        return 0
+
+    field = (value >> low) & ((1 << width) - 1)
+
+    if step == 1:
+        return field
+
+    bits = format(field, f"0{width}b")
+
+    if step > 0:
+        return int(bits[::step], 2)
+
+    return int(bits[::-step][::-1], 2)
+
+
+def set_slice(value: int, start: int, stop: int, step: int, bits: int) -> int:
+    """Returns `value` with the bits addressed by the normalized slice
+    replaced by the low bits of `bits`, bit zero of `bits` landing on
+    the first addressed offset.
+
+    :param value: int
+    :param start: int
+    :param stop: int
+    :param step: int
+    :param bits: int
+    :return: int
+    """
+    count, low, width = span(start, stop, step)
+
+    if count == 0:
+        return value
+
+    bits &= (1 << count) - 1
+    field_mask = ((1 << width) - 1) << low
+
+    if step == 1:
+        return (value & ~field_mask) | (bits << low)
+
+    field = bytearray(format((value & field_mask) >> low, f"0{width}b"), "ascii")
+    update = format(bits, f"0{count}b")
+
+    if step > 0:
+        field[::step] = update.encode("ascii")
+    else:
+        field[::-step] = update[::-1].encode("ascii")
+
+    return (value & ~field_mask) | (int(field, 2) << low)
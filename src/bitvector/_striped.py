@@ -0,0 +1,156 @@
+"""Striped locking for BitVectors written concurrently.
+
+`StripedLocks` is a mixin for BitVector subclasses that keep a tuple
+of reentrant locks in a `_locks` slot. Bit `n` of the vector belongs
+to stripe (n // 64) % len(locks), so writers of different words rarely
+wait on each other while writers of the same byte always serialize:
+
+- single bit writes hold the lock of the bit's stripe
+- slice and BitField writes hold the locks of the stripes they span
+- whole-vector writes, including in-place operators, hold every lock
+
+Locks are always acquired in increasing stripe order. A `_locks` of
+None disables locking.
+"""
+
+import functools
+
+from typing import cast, Optional, Sequence, TYPE_CHECKING
+
+from .bitvector import BitVector
+from ._slice import span
+
+
+if TYPE_CHECKING:
+    # type-check the mixin as the BitVector subclass it is mixed into
+    _Base = BitVector
+else:
+    _Base = object
+
+
+_VALUE = cast(property, vars(BitVector)["value"])
+
+
+class _Hold:
+    """Acquires several locks in order and releases them in reverse."""
+
+    __slots__ = ("locks",)
+
+    def __init__(self, locks: Sequence):
+        self.locks = locks
+
+    def __enter__(self) -> None:
+        for lock in self.locks:
+            lock.acquire()
+
+    def __exit__(self, *exc_info) -> None:
+        for lock in reversed(self.locks):
+            lock.release()
+
+
+_NOTHING = _Hold(())
+
+
+class StripedLocks(_Base):
+    """Mixin serializing concurrent writes to a BitVector subclass,
+    see `bitvector._striped`.
+    """
+
+    __slots__ = ()
+
+    _locks: Optional[tuple]
+
+    def _hold(self, low: int = 0, width: int = -1) -> _Hold:
+        """Returns a context manager holding the locks of the stripes
+        spanned by `width` bits starting at `low`, or every lock if
+        width is negative.
+
+        :param low: int
+        :param width: int
+        :return: _Hold
+        """
+        locks = self._locks
+
+        if locks is None:
+            return _NOTHING
+
+        first, last = low >> 6, (low + width - 1) >> 6
+
+        if width < 0 or last - first + 1 >= len(locks):
+            return _Hold(locks)
+
+        stripes = sorted({word % len(locks) for word in range(first, last + 1)})
+        return _Hold([locks[stripe] for stripe in stripes])
+
+    # single bit writes call BitVector directly, super() is measurably
+    # slower on this path
+
+    def _setb(self, offset: int) -> None:
+        locks = self._locks
+        if locks is None:
+            return BitVector._setb(self, offset)
+        with locks[(offset >> 6) % len(locks)]:
+            BitVector._setb(self, offset)
+
+    def _clrb(self, offset: int) -> None:
+        locks = self._locks
+        if locks is None:
+            return BitVector._clrb(self, offset)
+        with locks[(offset >> 6) % len(locks)]:
+            BitVector._clrb(self, offset)
+
+    def toggle(self, offset: int) -> int:
+        locks = self._locks
+        if locks is None:
+            return BitVector.toggle(self, offset)
+        with locks[(offset >> 6) % len(locks)]:
+            return BitVector.toggle(self, offset)
+
+    def __setitem__(self, key, value) -> None:
+        if key.__class__ is slice:
+            _, low, width = span(*key.indices(self._meta.size))
+            with self._hold(low, width):
+                BitVector.__setitem__(self, key, value)
+            return
+        BitVector.__setitem__(self, key, value)
+
+    @property
+    def value(self) -> int:
+        """The integer value of this BitVector."""
+        return _VALUE.__get__(self)
+
+    @value.setter
+    def value(self, new_value: int) -> None:
+        with self._hold():
+            _VALUE.__set__(self, new_value)
+
+
+def _exclusive(name: str):
+    method = getattr(BitVector, name)
+
+    @functools.wraps(method)
+    def exclusive(self, *args, **kwargs):
+        with self._hold():
+            return getattr(super(StripedLocks, self), name)(*args, **kwargs)
+
+    return exclusive
+
+
+for _name in [
+    "clear",
+    "set",
+    "pack",
+    "allocate",
+    "free",
+    "__iadd__",
+    "__isub__",
+    "__imul__",
+    "__itruediv__",
+    "__ifloordiv__",
+    "__iand__",
+    "__ior__",
+    "__ixor__",
+    "__ilshift__",
+    "__irshift__",
+]:
+    setattr(StripedLocks, _name, _exclusive(_name))
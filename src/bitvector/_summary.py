@@ -0,0 +1,280 @@
+"""Hierarchical summary backend for large, sparse BitVectors.
+
+The "summary" backend keeps the vector in 64-bit words together with
+summary levels above them, each holding one bit per word of the level
+below that is not zero:
+
+    levels[0]   the vector, bit n is bit n % 64 of word n // 64
+    levels[1]   bit w is set if levels[0][w] != 0
+    ...
+    levels[-1]  a single word
+
+Every mutating backend method keeps the summaries up to date, so
+finding the next set bit, testing for emptiness and iterating the set
+bits skip empty regions by descending the levels, in time logarithmic
+in the size of the vector rather than proportional to it:
+
+```python
+> bv = BitVector(size=1 << 32, backend="summary")
+> bv[3_000_000_000] = 1
+> bv.find_next_set(0)
+3000000000
+```
+"""
+
+import sys
+
+from array import array
+from typing import Iterator, List
+
+
+Levels = List[array]
+
+_NONZERO = bytes([0]) + bytes([1]) * 255
+_DIGITS = b"01" + bytes(254)
+
+
+def _words(data: bytes) -> array:
+    words = array("Q")
+    words.frombytes(data)
+    if sys.byteorder == "big":  # pragma: no cover
+        words.byteswap()
+    return words
+
+
+def _bytes(words: array) -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover
+        words = array("Q", words)
+        words.byteswap()
+    return words.tobytes()
+
+
+def _lowbit(word: int) -> int:
+    return (word & -word).bit_length() - 1
+
+
+def summarize(words: array) -> array:
+    """Returns the summary of `words`, one bit per non-zero word.
+
+    Non-zero bytes are translated to ones and OR-ed into the low byte
+    of each word with shifts over the whole level, so building a
+    summary takes a handful of C level passes.
+
+    :param words: array('Q')
+    :return: array('Q')
+    """
+    nwords = len(words)
+    flags = int.from_bytes(words.tobytes().translate(_NONZERO), "little")
+    flags |= flags >> 8
+    flags |= flags >> 16
+    flags |= flags >> 32
+    digits = flags.to_bytes(nwords * 8, "little")[::8].translate(_DIGITS)
+    value = int(digits[::-1], 2) if nwords else 0
+    return _words(value.to_bytes(((nwords + 63) // 64) * 8, "little"))
+
+
+def build(leaf: array) -> Levels:
+    """Returns the leaf words and all of their summary levels.
+
+    :param leaf: array('Q')
+    :return: List[array]
+    """
+    levels = [leaf]
+    while len(levels[-1]) > 1:
+        levels.append(summarize(levels[-1]))
+    return levels
+
+
+def _mark(levels: Levels, index: int, nonzero: bool) -> None:
+    """Updates the summaries after word `index` of the leaf level became
+    zero or non-zero.
+    """
+    for level in levels[1:]:
+        word, bit = index >> 6, 1 << (index & 0x3F)
+        current = level[word]
+        updated = current | bit if nonzero else current & ~bit
+        level[word] = updated
+        # the level above only changes when this word changes to or from zero
+        if bool(current) == bool(updated):
+            return
+        index = word
+
+
+def next_word(levels: Levels, index: int) -> int:
+    """Returns the index of the first non-zero leaf word at or after
+    `index`, or -1 if there is none.
+
+    Climbs the summaries until one has a set bit past the words already
+    ruled out, then descends to the leaf through the lowest set bits.
+
+    :param levels: List[array]
+    :param index: int
+    :return: int
+    """
+    leaf = levels[0]
+
+    if index >= len(leaf):
+        return -1
+
+    if leaf[index]:
+        return index
+
+    index += 1
+    depth = 1
+
+    while depth < len(levels):
+        level = levels[depth]
+        word = index >> 6
+        if word >= len(level):
+            return -1
+        bits = level[word] >> (index & 0x3F) << (index & 0x3F)
+        if bits:
+            index = (word << 6) + _lowbit(bits)
+            break
+        index = word + 1
+        depth += 1
+    else:
+        return -1
+
+    while depth > 1:
+        depth -= 1
+        index = (index << 6) + _lowbit(levels[depth][index])
+
+    return index
+
+
+class SummaryBackend:
+    """Stores the vector in 64-bit words with hierarchical summaries,
+    see `bitvector._summary`.
+
+    Single bit and field writes update the summaries of the words they
+    touch; whole-vector writes rebuild them. Besides the `Backend`
+    protocol it provides `next_set`, `last_set`, `iter_set` and
+    `nonzero`, which BitVector uses to search the vector.
+    """
+
+    name = "summary"
+    binary_op = None
+
+    @staticmethod
+    def new(meta, value: int) -> Levels:
+        nwords = (meta.size + 63) // 64
+
+        if value:
+            return build(_words(value.to_bytes(nwords * 8, "little")))
+
+        levels = [array("Q", [0]) * nwords]
+        while nwords > 1:
+            nwords = (nwords + 63) // 64
+            levels.append(array("Q", [0]) * nwords)
+        return levels
+
+    @staticmethod
+    def to_int(store: Levels) -> int:
+        return int.from_bytes(_bytes(store[0]), "little")
+
+    @staticmethod
+    def assign(store: Levels, meta, value: int) -> Levels:
+        store[:] = SummaryBackend.new(meta, value)
+        return store
+
+    @staticmethod
+    def getbit(store: Levels, offset: int) -> int:
+        return (store[0][offset >> 6] >> (offset & 0x3F)) & 0x1
+
+    @staticmethod
+    def setbit(store: Levels, offset: int) -> Levels:
+        leaf, index = store[0], offset >> 6
+        word = leaf[index]
+        leaf[index] = word | (1 << (offset & 0x3F))
+        if not word:
+            _mark(store, index, True)
+        return store
+
+    @staticmethod
+    def clrbit(store: Levels, offset: int) -> Levels:
+        leaf, index = store[0], offset >> 6
+        word = leaf[index] & ~(1 << (offset & 0x3F))
+        leaf[index] = word
+        if not word:
+            _mark(store, index, False)
+        return store
+
+    @staticmethod
+    def flipbit(store: Levels, offset: int) -> Levels:
+        if SummaryBackend.getbit(store, offset):
+            return SummaryBackend.clrbit(store, offset)
+        return SummaryBackend.setbit(store, offset)
+
+    @staticmethod
+    def getfield(store: Levels, low: int, width: int) -> int:
+        lo, hi = low >> 6, (low + width + 63) >> 6
+        field = int.from_bytes(_bytes(store[0][lo:hi]), "little")
+        return (field >> (low & 0x3F)) & ((1 << width) - 1)
+
+    @staticmethod
+    def setfield(store: Levels, low: int, width: int, bits: int) -> Levels:
+        leaf = store[0]
+        lo, hi = low >> 6, (low + width + 63) >> 6
+        shift = low & 0x3F
+        mask = ((1 << width) - 1) << shift
+        field = int.from_bytes(_bytes(leaf[lo:hi]), "little")
+        field = (field & ~mask) | ((bits << shift) & mask)
+        words = _words(field.to_bytes((hi - lo) * 8, "little"))
+
+        if hi - lo > max(64, len(leaf) >> 4):
+            leaf[lo:hi] = words
+            store[1:] = build(leaf)[1:]
+            return store
+
+        for index, word in enumerate(words, lo):
+            previous = leaf[index]
+            leaf[index] = word
+            if bool(previous) != bool(word):
+                _mark(store, index, bool(word))
+
+        return store
+
+    @staticmethod
+    def nonzero(store: Levels) -> bool:
+        return store[-1][0] != 0
+
+    @staticmethod
+    def next_set(store: Levels, offset: int) -> int:
+        leaf, index = store[0], offset >> 6
+
+        if index >= len(leaf):
+            return -1
+
+        word = leaf[index] >> (offset & 0x3F)
+        if word:
+            return offset + _lowbit(word)
+
+        index = next_word(store, index + 1)
+        if index < 0:
+            return -1
+
+        return (index << 6) + _lowbit(leaf[index])
+
+    @staticmethod
+    def last_set(store: Levels) -> int:
+        index = 0
+        for level in reversed(store):
+            word = level[index]
+            if not word:
+                return -1
+            index = (index << 6) + word.bit_length() - 1
+        return index
+
+    @staticmethod
+    def iter_set(store: Levels) -> Iterator[int]:
+        leaf = store[0]
+        index = next_word(store, 0)
+        while index >= 0:
+            word = leaf[index]
+            base = index << 6
+            while word:
+                low = word & -word
+                yield base + low.bit_length() - 1
+                word ^= low
+            index = next_word(store, index + 1)
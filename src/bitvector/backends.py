@@ -0,0 +1,585 @@
+"""Storage backends for BitVector.
+
+A backend is a stateless class whose static methods operate on the
+storage object kept by a BitVector, see `Backend` for the protocol.
+Mutating methods return the storage to keep, which lets immutable
+storage (a Python int) and mutable storage (a bytearray or an array
+of words) share one interface.
+
+Backends are looked up by name in a registry. A registry entry may be
+a "module:attribute" string, which is imported the first time the
+backend is used so optional dependencies do not slow down
+`import bitvector`:
+
+```python
+> from bitvector.backends import register_backend
+>
+> register_backend("mine", "mypackage.storage:MyBackend")
+> bv = BitVector(size=1024, backend="mine")
+```
+
+Whole-vector operations between vectors of the same size and backend
+use the backend's `binary_op` when it provides one. Anything else,
+including operations mixing backends, is computed on the integer value
+that every backend can produce, which is the cheapest representation
+they have in common, and the result is stored with the backend of the
+left operand.
+"""
+
+import importlib
+import operator
+import struct
+import sys
+
+from array import array
+from typing import cast, Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+
+ByteOrder = Literal["little", "big"]
+
+try:
+    from typing import Protocol
+except ImportError:  # pragma: no cover
+    Protocol = object  # type: ignore
+
+
+class Backend(Protocol):
+    """Protocol implemented by BitVector storage backends.
+
+    Values handed to a backend are already masked to the vector size
+    and offsets are already bounds checked.
+    """
+
+    name: str
+
+    @property
+    def binary_op(self) -> Optional[Callable[..., Any]]:
+        """Optional native whole-vector operation, None if not provided.
+        Called as binary_op(func, store, other, inplace) with `func`
+        from the operator module and returns the resulting storage or
+        NotImplemented to fall back to integer arithmetic.
+        """
+
+    #: Optional searches used by BitVector when present:
+    #: next_set(store, offset) returns the first set bit at or after
+    #: `offset` or -1, last_set(store) the highest set bit or -1,
+    #: iter_set(store) iterates the set bits in increasing order and
+    #: nonzero(store) tests whether any bit is set.
+
+    def new(self, meta, value: int) -> Any:
+        """Returns storage initialized with `value`."""
+
+    def to_int(self, store: Any) -> int:
+        """Returns the integer value of the storage."""
+
+    def assign(self, store: Any, meta, value: int) -> Any:
+        """Replaces the contents of the storage with `value`."""
+
+    def getbit(self, store: Any, offset: int) -> int:
+        """Returns the bit at `offset`."""
+
+    def setbit(self, store: Any, offset: int) -> Any:
+        """Sets the bit at `offset`."""
+
+    def clrbit(self, store: Any, offset: int) -> Any:
+        """Clears the bit at `offset`."""
+
+    def flipbit(self, store: Any, offset: int) -> Any:
+        """Inverts the bit at `offset`."""
+
+    def getfield(self, store: Any, low: int, width: int) -> int:
+        """Returns `width` bits starting at `low`."""
+
+    def setfield(self, store: Any, low: int, width: int, bits: int) -> Any:
+        """Replaces `width` bits starting at `low` with `bits`."""
+
+
+class IntBackend:
+    """Stores the vector as a single Python int.
+
+    Whole-vector operations are as fast as CPython's arbitrary
+    precision arithmetic, but every write allocates a new int the
+    width of the vector.
+    """
+
+    name = "int"
+    binary_op = None
+
+    @staticmethod
+    def new(meta, value: int) -> int:
+        return value
+
+    @staticmethod
+    def to_int(store: int) -> int:
+        return store
+
+    @staticmethod
+    def assign(store: int, meta, value: int) -> int:
+        return value
+
+    @staticmethod
+    def getbit(store: int, offset: int) -> int:
+        return (store >> offset) & 0x1
+
+    @staticmethod
+    def setbit(store: int, offset: int) -> int:
+        return store | (1 << offset)
+
+    @staticmethod
+    def clrbit(store: int, offset: int) -> int:
+        return store & ~(1 << offset)
+
+    @staticmethod
+    def flipbit(store: int, offset: int) -> int:
+        return store ^ (1 << offset)
+
+    @staticmethod
+    def getfield(store: int, low: int, width: int) -> int:
+        return (store >> low) & ((1 << width) - 1)
+
+    @staticmethod
+    def setfield(store: int, low: int, width: int, bits: int) -> int:
+        mask = ((1 << width) - 1) << low
+        return (store & ~mask) | ((bits << low) & mask)
+
+
+#: Bytes combined at a time by in-place operators on byte buffers.
+CHUNK_BYTES = 1 << 20
+
+_BITWISE = (operator.and_, operator.or_, operator.xor)
+
+
+class BytesBackend:
+    """Stores the vector in a mutable byte buffer, least significant
+    byte first, bit zero being the least significant bit of byte zero.
+
+    Single bit writes update one byte in place and field access only
+    touches the bytes spanned by the field. In-place AND, OR and XOR
+    between vectors of the same size work through the buffers a chunk
+    at a time; other whole-vector operations convert to and from an
+    int.
+    """
+
+    name = "bytes"
+    byteorder: ByteOrder = "little"
+    bit_order = "lsb"
+
+    @staticmethod
+    def binary_op(func, store: memoryview, other: memoryview, inplace: bool):
+        # bitwise operations combine byte n with byte n whatever the layout
+        if not inplace or func not in _BITWISE:
+            return NotImplemented
+
+        for lo in range(0, len(store), CHUNK_BYTES):
+            hi = min(lo + CHUNK_BYTES, len(store))
+            bits = func(int.from_bytes(store[lo:hi], "little"), int.from_bytes(other[lo:hi], "little"))
+            store[lo:hi] = bits.to_bytes(hi - lo, "little")
+
+        return store
+
+    @staticmethod
+    def allocate(meta) -> memoryview:
+        return memoryview(bytearray(meta.nbytes))
+
+    @classmethod
+    def new(cls, meta, value: int) -> memoryview:
+        store = cls.allocate(meta)
+        if value:
+            cls.assign(store, meta, value)
+        return store
+
+    @staticmethod
+    def to_int(store: memoryview) -> int:
+        return int.from_bytes(store, "little")
+
+    @staticmethod
+    def assign(store: memoryview, meta, value: int) -> memoryview:
+        store[:] = value.to_bytes(len(store), "little")
+        return store
+
+    @staticmethod
+    def getbit(store: memoryview, offset: int) -> int:
+        return (store[offset >> 3] >> (offset & 0x7)) & 0x1
+
+    @staticmethod
+    def setbit(store: memoryview, offset: int) -> memoryview:
+        store[offset >> 3] |= 1 << (offset & 0x7)
+        return store
+
+    @staticmethod
+    def clrbit(store: memoryview, offset: int) -> memoryview:
+        store[offset >> 3] &= ~(1 << (offset & 0x7)) & 0xFF
+        return store
+
+    @staticmethod
+    def flipbit(store: memoryview, offset: int) -> memoryview:
+        store[offset >> 3] ^= 1 << (offset & 0x7)
+        return store
+
+    @staticmethod
+    def getfield(store: memoryview, low: int, width: int) -> int:
+        lo, hi = low >> 3, (low + width + 7) >> 3
+        field = int.from_bytes(store[lo:hi], "little")
+        return (field >> (low & 0x7)) & ((1 << width) - 1)
+
+    @staticmethod
+    def setfield(store: memoryview, low: int, width: int, bits: int) -> memoryview:
+        lo, hi = low >> 3, (low + width + 7) >> 3
+        shift = low & 0x7
+        mask = ((1 << width) - 1) << shift
+        field = int.from_bytes(store[lo:hi], "little")
+        field = (field & ~mask) | ((bits << shift) & mask)
+        store[lo:hi] = field.to_bytes(hi - lo, "little")
+        return store
+
+
+class WordsBackend(BytesBackend):
+    """Stores the vector in an `array('Q')` of 64-bit words.
+
+    Bits are addressed through a byte view of the words; on little
+    endian hosts bit `n` of the vector is bit `n % 64` of word `n // 64`.
+    """
+
+    name = "words"
+
+    @staticmethod
+    def allocate(meta) -> memoryview:
+        return memoryview(array("Q", bytes(((meta.size + 63) // 64) * 8))).cast("B")
+
+
+class BufferWindow:
+    """A fixed-size window onto a buffer that can be moved without
+    allocating a new view.
+
+    Windows stand in for the memoryview kept by byte buffer backends:
+    they support len(), bytes() and integer or slice indexing relative
+    to the start of the window, so a BitVector overlaid on a window
+    reads and writes the underlying buffer directly. Slices are clipped
+    to the window like those of a memoryview, integer indices are not
+    bounds checked against it.
+    """
+
+    __slots__ = ("_view", "_offset", "_nbytes")
+
+    _view: memoryview
+
+    def __init__(self, obj, offset: int, nbytes: int):
+        """
+        :param obj: buffer
+        :param offset: int byte offset of the window in the buffer
+        :param nbytes: int size of the window in bytes
+
+        Raises:
+        - ValueError if the window does not fit in the buffer
+        """
+        self._nbytes = nbytes
+        self.move(offset, obj)
+
+    @property
+    def offset(self) -> int:
+        """Byte offset of the window in the buffer."""
+        return self._offset
+
+    @property
+    def obj(self):
+        """The buffer the window is placed on."""
+        return self._view.obj
+
+    def move(self, offset: int, obj=None) -> None:
+        """Moves the window to `offset`, in `obj` if given or else in
+        the current buffer.
+
+        :param offset: int
+        :param obj: buffer
+
+        Raises:
+        - ValueError if the window does not fit in the buffer
+        """
+        view = self._view if obj is None else memoryview(obj).cast("B")
+
+        if offset < 0 or offset + self._nbytes > len(view):
+            raise ValueError(f"Window of {self._nbytes} bytes at offset {offset} exceeds buffer of {len(view)} bytes")
+
+        self._view = view
+        self._offset = offset
+
+    def __len__(self) -> int:
+        return self._nbytes
+
+    def __bytes__(self) -> bytes:
+        return bytes(self._view[self._offset : self._offset + self._nbytes])
+
+    # Backends only index with in-range offsets and unit step slices,
+    # but chunked scans like count_ones slice past the end of the window.
+
+    def __getitem__(self, key):
+        base = self._offset
+        if key.__class__ is slice:
+            stop = self._nbytes if key.stop is None else min(key.stop, self._nbytes)
+            return self._view[base + (key.start or 0) : base + stop]
+        return self._view[base + key]
+
+    def __setitem__(self, key, value) -> None:
+        base = self._offset
+        if key.__class__ is slice:
+            stop = self._nbytes if key.stop is None else min(key.stop, self._nbytes)
+            self._view[base + (key.start or 0) : base + stop] = value
+        else:
+            self._view[base + key] = value
+
+
+_REFLECT = bytes(int(f"{n:08b}"[::-1], 2) for n in range(256))
+
+
+class LayoutBackend(BytesBackend):
+    """Stores the vector in a byte buffer with a configurable layout.
+
+    `byteorder` is "little" when bit zero lives in the first byte of
+    the buffer and "big" when it lives in the last byte. `bit_order`
+    is "lsb" when the lowest numbered bit of each byte is its least
+    significant bit and "msb" when it is the most significant bit.
+
+    These backends exist so that foreign buffers can be wrapped in
+    place by `BitVector.from_buffer`; they are slower than "bytes".
+    """
+
+    name = "bytes-big"
+    byteorder: ByteOrder = "big"
+    bit_order = "lsb"
+
+    @classmethod
+    def _index(cls, store: memoryview, offset: int) -> int:
+        if cls.byteorder == "big":
+            return len(store) - 1 - (offset >> 3)
+        return offset >> 3
+
+    @classmethod
+    def _bit(cls, offset: int) -> int:
+        if cls.bit_order == "msb":
+            return 0x80 >> (offset & 0x7)
+        return 1 << (offset & 0x7)
+
+    @classmethod
+    def _read(cls, store: memoryview, lo: int, hi: int) -> int:
+        if cls.byteorder == "big":
+            lo, hi = len(store) - hi, len(store) - lo
+        if cls.bit_order == "msb":
+            return int.from_bytes(bytes(store[lo:hi]).translate(_REFLECT), cls.byteorder)
+        return int.from_bytes(store[lo:hi], cls.byteorder)
+
+    @classmethod
+    def _write(cls, store: memoryview, lo: int, hi: int, value: int) -> None:
+        data = value.to_bytes(hi - lo, cls.byteorder)
+        if cls.bit_order == "msb":
+            data = data.translate(_REFLECT)
+        if cls.byteorder == "big":
+            lo, hi = len(store) - hi, len(store) - lo
+        store[lo:hi] = data
+
+    @classmethod
+    def to_int(cls, store: memoryview) -> int:
+        return cls._read(store, 0, len(store))
+
+    @classmethod
+    def assign(cls, store: memoryview, meta, value: int) -> memoryview:
+        cls._write(store, 0, len(store), value)
+        return store
+
+    @classmethod
+    def getbit(cls, store: memoryview, offset: int) -> int:
+        return 1 if store[cls._index(store, offset)] & cls._bit(offset) else 0
+
+    @classmethod
+    def setbit(cls, store: memoryview, offset: int) -> memoryview:
+        store[cls._index(store, offset)] |= cls._bit(offset)
+        return store
+
+    @classmethod
+    def clrbit(cls, store: memoryview, offset: int) -> memoryview:
+        store[cls._index(store, offset)] &= ~cls._bit(offset) & 0xFF
+        return store
+
+    @classmethod
+    def flipbit(cls, store: memoryview, offset: int) -> memoryview:
+        store[cls._index(store, offset)] ^= cls._bit(offset)
+        return store
+
+    @classmethod
+    def getfield(cls, store: memoryview, low: int, width: int) -> int:
+        lo, hi = low >> 3, (low + width + 7) >> 3
+        return (cls._read(store, lo, hi) >> (low & 0x7)) & ((1 << width) - 1)
+
+    @classmethod
+    def setfield(cls, store: memoryview, low: int, width: int, bits: int) -> memoryview:
+        lo, hi = low >> 3, (low + width + 7) >> 3
+        shift = low & 0x7
+        mask = ((1 << width) - 1) << shift
+        field = (cls._read(store, lo, hi) & ~mask) | ((bits << shift) & mask)
+        cls._write(store, lo, hi, field)
+        return store
+
+
+class ReflectedBackend(LayoutBackend):
+    """Byte buffer, first byte first, most significant bit first."""
+
+    name = "bytes-msb"
+    byteorder = "little"
+    bit_order = "msb"
+
+
+class BigReflectedBackend(LayoutBackend):
+    """Byte buffer, last byte first, most significant bit first."""
+
+    name = "bytes-big-msb"
+    byteorder = "big"
+    bit_order = "msb"
+
+
+_LAYOUTS: Dict[Tuple[str, str], str] = {
+    (BytesBackend.byteorder, BytesBackend.bit_order): BytesBackend.name,
+    (LayoutBackend.byteorder, LayoutBackend.bit_order): LayoutBackend.name,
+    (ReflectedBackend.byteorder, ReflectedBackend.bit_order): ReflectedBackend.name,
+    (BigReflectedBackend.byteorder, BigReflectedBackend.bit_order): BigReflectedBackend.name,
+}
+
+
+def layout_backend(byteorder: str, bit_order: str) -> str:
+    """Returns the name of the byte buffer backend for the layout.
+
+    :param byteorder: str "little" or "big"
+    :param bit_order: str "lsb" or "msb"
+    :return: str
+
+    Raises:
+    - ValueError for an unknown layout
+    """
+    try:
+        return _LAYOUTS[byteorder, bit_order]
+    except KeyError:
+        raise ValueError(f"Unknown layout: {byteorder!r}, {bit_order!r}") from None
+
+
+# bytes of the hidden object behind a memoryview of an exporter, shared
+# by the views sliced from it: its header, flags, export count, Py_buffer
+# and GC header. These are CPython's private structs, so the tests check
+# the sum against tracemalloc.
+_MANAGED_BUFFER = struct.calcsize("PPinPPnniiPPPPP") + struct.calcsize("PP")
+
+
+def store_sizeof(store: Any) -> int:
+    """Returns the bytes retained by a backend's storage object.
+
+    A memoryview is counted together with the object it views, and the
+    bookkeeping shared by the views of that object, when it spans all
+    of the object, as it does for buffers a backend allocates. Views of
+    part of a buffer, like BufferWindows, count only themselves. Lists
+    and tuples, like the summary levels, count their items.
+    Memory-mapped files and shared memory are outside the Python heap
+    and count only their Python objects, and NumPy's own record of an
+    exported array, about 70 bytes, is not included.
+
+    :param store: Any
+    :return: int
+    """
+    if isinstance(store, memoryview):
+        size = sys.getsizeof(store)
+        owner = store.obj
+        if owner is not None and store.nbytes == memoryview(owner).nbytes:
+            size += _MANAGED_BUFFER + sys.getsizeof(owner)
+        return size
+
+    if isinstance(store, (list, tuple)):
+        return sys.getsizeof(store) + sum(store_sizeof(item) for item in store)
+
+    return sys.getsizeof(store)
+
+
+def int_to_bytes(value: int, nbytes: int, byteorder: str, bit_order: str) -> bytes:
+    """Returns `value` as `nbytes` bytes in the requested layout.
+
+    :param value: int
+    :param nbytes: int
+    :param byteorder: str "little" or "big"
+    :param bit_order: str "lsb" or "msb"
+    :return: bytes
+    """
+    layout_backend(byteorder, bit_order)
+    data = value.to_bytes(nbytes, cast(ByteOrder, byteorder))
+    if bit_order == "msb":
+        data = data.translate(_REFLECT)
+    return data
+
+
+def bytes_to_int(data: bytes, byteorder: str, bit_order: str) -> int:
+    """Returns the integer value of `data` in the requested layout.
+
+    :param data: bytes
+    :param byteorder: str "little" or "big"
+    :param bit_order: str "lsb" or "msb"
+    :return: int
+    """
+    layout_backend(byteorder, bit_order)
+    if bit_order == "msb":
+        data = bytes(data).translate(_REFLECT)
+    return int.from_bytes(data, cast(ByteOrder, byteorder))
+
+
+_REGISTRY: Dict[str, Union[type, str]] = {
+    IntBackend.name: IntBackend,
+    BytesBackend.name: BytesBackend,
+    WordsBackend.name: WordsBackend,
+    LayoutBackend.name: LayoutBackend,
+    ReflectedBackend.name: ReflectedBackend,
+    BigReflectedBackend.name: BigReflectedBackend,
+    "numpy": "bitvector._numpy:NumpyBackend",
+    "summary": "bitvector._summary:SummaryBackend",
+}
+
+
+def register_backend(name: str, backend: Union[type, str]) -> None:
+    """Registers a storage backend under `name`.
+
+    The backend is either a class implementing the `Backend` protocol
+    or a "module:attribute" string naming one, which is imported when
+    the backend is first used.
+
+    :param name: str
+    :param backend: Union[type, str]
+
+    Raises:
+    - ValueError if name is already registered
+    """
+    if name in _REGISTRY:
+        raise ValueError(f"Backend already registered: {name!r}")
+
+    _REGISTRY[name] = backend
+
+
+def get_backend(name: str) -> Backend:
+    """Returns the backend class registered as `name`, importing it
+    if this is the first use of a lazily registered backend.
+
+    :param name: str
+    :return: Backend
+
+    Raises:
+    - ValueError if name is not registered
+    - ImportError if a lazily registered backend cannot be imported
+    """
+    try:
+        backend = _REGISTRY[name]
+    except KeyError:
+        raise ValueError(f"Unknown backend: {name!r}") from None
+
+    if isinstance(backend, str):
+        module, _, attr = backend.partition(":")
+        backend = _REGISTRY[name] = getattr(importlib.import_module(module), attr)
+
+    return cast(Backend, backend)
+
+
+def backend_names() -> List[str]:
+    """Returns the names of all registered backends.
+
+    :return: List[str]
+    """
+    return list(_REGISTRY)
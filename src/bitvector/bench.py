@@ -0,0 +1,272 @@
+"""Benchmark suite with JSON baselines and regression gating.
+
+Times every family of BitVector operations across vector sizes and
+densities of set bits, writes the results to JSON and compares them
+with a stored baseline:
+
+```console
+$ python -m bitvector.bench --output baseline.json
+$ python -m bitvector.bench --baseline baseline.json --tolerance 0.25
+```
+
+The second command exits with status 1 if any benchmark is more than
+25% slower than in the baseline, so it can gate a CI job. Results are
+keyed "family/size/density", the best seconds per call of several
+repeats, and only keys present in both files are compared.
+"""
+
+import argparse
+import json
+import operator
+import platform
+import random
+import sys
+import time
+import timeit
+
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .bitvector import BitVector
+from .bitfield import BitField
+
+
+SIZES = [8, 64, 1024, 1 << 16, 1 << 20, 1 << 24]
+DENSITIES = [0.01, 0.5]
+
+Results = Dict[str, float]
+Regression = Tuple[str, float, float, float]
+
+
+class _Record(BitVector):
+    low = BitField(0, 4)
+    mid = BitField(3, 5)
+
+
+def random_value(size: int, density: float, rng: random.Random) -> int:
+    """Returns a random `size` bit value with about `density` of its bits
+    set, the nearest power of two fraction, by AND-ing random values.
+
+    :param size: int
+    :param density: float 0 < density <= 1
+    :param rng: random.Random
+    :return: int
+    """
+    value = (1 << size) - 1
+    fraction = 1.0
+    while fraction * 0.75 > density:
+        value &= rng.getrandbits(size)
+        fraction /= 2
+    return value
+
+
+def families(size: int, density: float, backend: str = "int") -> Dict[str, Callable[[], object]]:
+    """Returns the benchmarked operations on vectors of `size` bits with
+    `density` of their bits set, by family name.
+
+    :param size: int
+    :param density: float
+    :param backend: str
+    :return: Dict[str, Callable[[], object]]
+    """
+    rng = random.Random(size)
+    a = BitVector(random_value(size, density, rng), size=size, backend=backend)
+    b = BitVector(random_value(size, density, rng), size=size, backend=backend)
+    # written to by the benchmarks, so a and b stay the same
+    w = BitVector(a.value, size=size, backend=backend)
+    record = _Record(a.value, size=size, backend=backend)
+    offset, low, high = size // 3, size // 4, size // 4 + min(size // 2, 64)
+    value = b.value
+
+    funcs = {
+        "getitem-int": lambda: a[offset],
+        "getitem-slice": lambda: a[low:high],
+        "getitem-step": lambda: a[::3],
+        "setitem-int": lambda: w.__setitem__(offset, 1),
+        "setitem-slice": lambda: w.__setitem__(slice(low, high), 0x5A),
+        "and": lambda: a & b,
+        "or": lambda: a | b,
+        "xor": lambda: a ^ b,
+        "invert": lambda: ~a,
+        "iand": lambda: w.__iand__(value),
+        "ior": lambda: w.__ior__(value),
+        "add": lambda: a + b,
+        "sub": lambda: a - b,
+        "lshift": lambda: a << 3,
+        "rshift": lambda: a >> 3,
+        "eq": lambda: a == b,
+        "lt": lambda: a < b,
+        "count": a.count,
+        "find-first-set": a.find_first_set,
+        "value": lambda: a.value,
+        "bytes": lambda: a.bytes,
+        "bitfield-get": lambda: record.mid,
+        "bitfield-set": lambda: setattr(record, "mid", 7),
+    }
+
+    if size <= 1 << 20:
+        funcs["iter-ones"] = lambda: sum(1 for _ in a.iter_ones())
+
+    return funcs
+
+
+def calibrate(func: Callable[[], object], min_time: float = 0.02) -> Tuple[timeit.Timer, int, float]:
+    """Returns a timer for `func`, the number of calls taking at least
+    `min_time` seconds and the seconds they took.
+
+    :param func: Callable[[], object]
+    :param min_time: float
+    :return: Tuple[timeit.Timer, int, float]
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            return timer, number, elapsed
+        number *= max(2, min(10, int(min_time / max(elapsed, 1e-9))))
+
+
+def run(
+    sizes: Iterable[int] = SIZES,
+    densities: Iterable[float] = DENSITIES,
+    backend: str = "int",
+    select: Optional[str] = None,
+    min_time: float = 0.02,
+    repeat: int = 5,
+    log: Optional[Callable[[str], None]] = None,
+) -> Results:
+    """Runs the benchmarks and returns the best seconds per call by key.
+
+    The repeats are interleaved, every benchmark being timed once per
+    round, so a burst of load on the machine slows one sample of many
+    benchmarks rather than every sample of a few.
+
+    :param sizes: Iterable[int]
+    :param densities: Iterable[float]
+    :param backend: str
+    :param select: Optional[str] only run families containing this text
+    :param min_time: float seconds per sample
+    :param repeat: int samples per benchmark
+    :param log: Optional[Callable[[str], None]] called with each result
+    :return: Dict[str, float]
+    """
+    timers = {}
+    results = {}
+
+    for size in sizes:
+        for density in densities:
+            for family, func in families(size, density, backend).items():
+                if select and select not in family:
+                    continue
+                key = f"{family}/{size}/{density:g}"
+                timer, number, elapsed = calibrate(func, min_time)
+                timers[key] = (timer, number)
+                results[key] = elapsed / number
+
+    for _ in range(repeat - 1):
+        for key, (timer, number) in timers.items():
+            results[key] = min(results[key], timer.timeit(number) / number)
+
+    if log:
+        for key, seconds in results.items():
+            log(f"{key:40} {seconds * 1e6:14.3f} usec")
+
+    return results
+
+
+def compare(results: Results, baseline: Results, tolerance: float = 0.25) -> List[Regression]:
+    """Returns (key, baseline, result, ratio) for every benchmark more
+    than `tolerance` slower than its baseline, worst first.
+
+    :param results: Dict[str, float]
+    :param baseline: Dict[str, float]
+    :param tolerance: float allowed fractional slowdown
+    :return: List[Tuple[str, float, float, float]]
+    """
+    regressions = []
+
+    for key, seconds in results.items():
+        base = baseline.get(key)
+        if base and seconds / base > 1 + tolerance:
+            regressions.append((key, base, seconds, seconds / base))
+
+    return sorted(regressions, key=operator.itemgetter(3), reverse=True)
+
+
+def _environment(backend: str) -> Dict[str, str]:
+    try:
+        from importlib.metadata import version
+
+        package = version("bitvector-for-humans")
+    except Exception:
+        package = "unknown"
+
+    return {
+        "bitvector": package,
+        "backend": backend,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def _size(text: str) -> int:
+    """Parses "1024", "1<<10" or "2**10"."""
+    if "<<" in text:
+        base, shift = text.split("<<")
+        return int(base) << int(shift)
+    if "**" in text:
+        base, exponent = text.split("**")
+        return int(base) ** int(exponent)
+    return int(text)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point, returns the exit status.
+
+    :param argv: Optional[Sequence[str]]
+    :return: int
+    """
+    parser = argparse.ArgumentParser(prog="python -m bitvector.bench", description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="comma separated, 1<<20 or 2**20 allowed")
+    parser.add_argument("--densities", default=",".join(map(str, DENSITIES)), help="comma separated fractions")
+    parser.add_argument("--backend", default="int")
+    parser.add_argument("--select", help="only run families containing this text")
+    parser.add_argument("--min-time", type=float, default=0.02, help="seconds per sample")
+    parser.add_argument("--repeat", type=int, default=5, help="samples per benchmark")
+    parser.add_argument("--output", "-o", help="write results to this JSON file")
+    parser.add_argument("--baseline", "-b", help="compare with results in this JSON file")
+    parser.add_argument("--tolerance", "-t", type=float, default=0.25, help="allowed slowdown, 0.25 is 25%%")
+    parser.add_argument("--quiet", "-q", action="store_true")
+    args = parser.parse_args(argv)
+
+    sizes = [_size(item) for item in args.sizes.split(",")]
+    densities = [float(item) for item in args.densities.split(",")]
+    log = None if args.quiet else print
+
+    results = run(sizes, densities, args.backend, args.select, args.min_time, args.repeat, log)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"environment": _environment(args.backend), "results": results}, f, indent=1, sort_keys=True)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+
+    regressions = compare(results, baseline, args.tolerance)
+
+    for key, base, seconds, ratio in regressions:
+        print(f"REGRESSION {key:40} {base * 1e6:12.3f} -> {seconds * 1e6:12.3f} usec ({ratio:.2f}x)")
+
+    compared = len(results.keys() & baseline.keys())
+    print(f"{len(regressions)} of {compared} benchmarks regressed beyond {args.tolerance:.0%}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
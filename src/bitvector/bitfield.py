@@ -1,5 +1,11 @@
 """Access Bits in a BitVector"""
 
+from array import array
+from typing import overload, Any, Iterable, TypeVar
+
+
+_Field = TypeVar("_Field", bound="ReadOnlyBitField")
+
 
 class ReadOnlyBitField:
     """Read-only data descriptor for accessing named fields in a BitVector."""
@@ -14,12 +20,61 @@ class ReadOnlyBitField:
     def __set__(self, obj, value) -> None:
         raise TypeError(f"Read-only field '{self.name}'")
 
-    def __get__(self, obj, type=None) -> int:
+    @overload
+    def __get__(self: _Field, obj: None, type=None) -> _Field: ...
+
+    @overload
+    def __get__(self, obj: Any, type=None) -> int: ...
+
+    def __get__(self, obj, type=None):
+        if obj is None:
+            return self
         return obj[self.field]
 
     def __set_name__(self, owner, name) -> None:
         self.name = name
 
+    def column(self, records, numpy: bool = False):
+        """Returns the value of this field for every record.
+
+        `records` is a BitVectorArray or an iterable of BitVectors or
+        integer register values. The field is decoded with a shift and
+        mask of each record's value, or of the whole array at once for
+        a BitVectorArray, without creating per-record objects.
+
+        ```python
+        > MyBV.byte3.column(records)
+        array('Q', [85, 0, 17, ...])
+        ```
+
+        Fields up to 64 bits wide are returned as an `array('Q')`, or a
+        NumPy uint64 array if `numpy` is True, wider fields as a list.
+
+        :param records: Union[BitVectorArray, Iterable[Union[BitVector, int]]]
+        :param numpy: bool
+        :return: Union[array, numpy.ndarray, List[int]]
+        """
+        from .bitvectorarray import BitVectorArray
+
+        if isinstance(records, BitVectorArray):
+            return records.column(self.field, numpy=numpy)
+
+        low, width = self.field.start, self.field.stop - self.field.start
+        mask = (1 << width) - 1
+        values = [(getattr(r, "value", r) >> low) & mask for r in records]
+
+        if width > 64:
+            if numpy:
+                raise ValueError("NumPy columns are limited to 64 bits")
+            return values
+
+        if numpy:
+            from ._numpy import uint64_column
+
+            return uint64_column(array("Q", values))
+
+        return array("Q", values)
+
 
 class BitField(ReadOnlyBitField):
     """Data descriptor for accessing named fields in a BitVector.
@@ -46,3 +101,29 @@ class BitField(ReadOnlyBitField):
 
     def __set__(self, obj, value) -> None:
         obj[self.field] = value
+
+    def set_column(self, records, values: Iterable[int]) -> None:
+        """Assigns one value of this field to every record.
+
+        `records` is a BitVectorArray, updated with a single pass over
+        its storage, or an iterable of BitVectors.
+
+        :param records: Union[BitVectorArray, Iterable[BitVector]]
+        :param values: Iterable[int]
+
+        Raises:
+        - ValueError if the number of values differs from the number of records
+        """
+        from .bitvectorarray import BitVectorArray
+
+        if isinstance(records, BitVectorArray):
+            records.set_column(self.field, values)
+            return
+
+        records, values = list(records), list(values)
+
+        if len(records) != len(values):
+            raise ValueError(f"Expected {len(records)} values, got {len(values)}")
+
+        for record, value in zip(records, values):
+            record[self.field] = value
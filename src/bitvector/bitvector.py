@@ -1,9 +1,107 @@
 """A vector of bits for Humans™!"""
 
 import functools
+import io
+import mmap
 import operator
+import os
+import sys
 
-from typing import cast, Union
+from typing import cast, Dict, Iterator, Optional, Tuple, Type, Union, TYPE_CHECKING
+
+from .codec import RecordCodec
+from .backends import Backend, BufferWindow, IntBackend, get_backend, int_to_bytes, layout_backend, store_sizeof
+from ._rank import INVERT, Buffer, RankDirectory, count_ones, find_next, find_run, iter_runs, iter_set, popcount
+from ._slice import get_slice, set_slice, span
+
+if TYPE_CHECKING:
+    from .frozen import FrozenBitVector
+
+
+#: Wider masks are rebuilt on each use rather than kept alive by the
+#: interned Metadata.
+MASK_CACHE_BITS = 1 << 20
+
+
+class Metadata:
+    """Size dependent attributes shared by every BitVector of a given
+    size and storage backend.
+
+    Instances are interned by `metadata` so vectors of the same size
+    refer to a single Metadata object rather than carrying their own
+    copies of the mask, length and display widths. The mask, an int
+    as wide as the vector, is computed on first use so vectors too
+    large to hold in memory, like memory-mapped files, can be created,
+    and is only kept for vectors of up to MASK_CACHE_BITS bits.
+    """
+
+    __slots__ = ("size", "mask", "nibbles", "nbytes", "backend")
+
+    def __init__(self, size: int, backend: Backend = IntBackend):
+        """
+        :param size: int
+        :param backend: Backend
+        """
+        self.size = size
+        self.nibbles = (size + 3) // 4
+        self.nbytes = (size + 7) // 8
+        self.backend = backend
+
+    def __getattr__(self, name: str):
+        # only called while the mask slot is unset
+        if name != "mask":
+            raise AttributeError(name)
+        mask = (1 << self.size) - 1
+        if self.size <= MASK_CACHE_BITS:
+            self.mask = mask
+        return mask
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={self.size}, backend={self.backend.name!r})"
+
+
+_METADATA: Dict[Tuple[int, str], Metadata] = {}
+
+
+def metadata(size: int, backend: str = "int") -> Metadata:
+    """Returns the interned Metadata for vectors of `size` bits stored
+    with the named `backend`.
+
+    :param size: int
+    :param backend: str
+    :return: Metadata
+
+    Raises:
+    - ValueError if size <= 0
+    - ValueError if backend is unknown
+    - ImportError if the backend's optional dependencies are missing
+    """
+    try:
+        return _METADATA[size, backend]
+    except KeyError:
+        pass
+
+    if size <= 0:
+        raise ValueError("Size must greater than zero.")
+
+    backend_cls = get_backend(backend)
+
+    return _METADATA.setdefault((size, backend), Metadata(size, backend_cls))
+
+
+@functools.lru_cache(maxsize=None)
+def _frozen_type() -> Type["FrozenBitVector"]:
+    # imported on first use, bitvector.frozen subclasses BitVector
+    from .frozen import FrozenBitVector
+
+    return FrozenBitVector
+
+
+_MMAP_MODES = {
+    "r": ("rb", mmap.ACCESS_READ),
+    "r+": ("r+b", mmap.ACCESS_WRITE),
+    "w+": ("w+b", mmap.ACCESS_WRITE),
+}
 
 
 @functools.total_ordering
@@ -13,8 +111,25 @@ class BitVector:
     or using a slice (via conventional square brackets
     notation).
 
+    The bits are kept by a storage backend chosen when the
+    vector is created, see `bitvector.backends`.
     """
 
+    __slots__ = ("_meta", "_value", "_rank")
+
+    _rank: Optional[RankDirectory]
+
+    _codec = RecordCodec()
+
+    def __init_subclass__(cls, codegen: bool = True, **kwargs):
+        """Compiles the BitFields declared by a subclass into a RecordCodec,
+        see `bitvector.codec`.
+
+        :param codegen: bool generate specialized code for the codec
+        """
+        super().__init_subclass__(**kwargs)
+        cls._codec = RecordCodec.from_class(cls, codegen=codegen)
+
     @classmethod
     def zeros(cls, size: int = 128):
         """Create a BitVector initialized with zeros.
@@ -35,56 +150,413 @@ class BitVector:
         bv.set()
         return bv
 
-    def __init__(self, value: int = 0, size: int = 128):
+    @classmethod
+    def from_buffer(cls, obj, byteorder: str = "big", bit_order: str = "lsb"):
+        """Create a BitVector that wraps the bytes of `obj` without copying.
+
+        `obj` is any object supporting the buffer protocol (bytes,
+        bytearray, memoryview, array, mmap, ...). The vector is the
+        size of the buffer in bits and reads and writes go directly to
+        the buffer; a read-only buffer gives a read-only vector.
+
+        `byteorder` is "big" when bit zero lives in the last byte, as
+        with the `bytes` property, and "little" when it lives in the
+        first byte. `bit_order` is "lsb" when the lowest numbered bit
+        of each byte is its least significant bit and "msb" when it is
+        the most significant bit.
+
+        :param obj: buffer
+        :param byteorder: str
+        :param bit_order: str
+        :return: BitVector
+
+        Raises:
+        - ValueError if the buffer is empty or the layout is unknown
+        - TypeError if obj does not support the buffer protocol
+        """
+        view = memoryview(obj).cast("B")
+        bv = cls.__new__(cls)
+        bv._meta = metadata(len(view) * 8, layout_backend(byteorder, bit_order))
+        bv._value = view
+        return bv
+
+    @classmethod
+    def overlay(
+        cls,
+        obj,
+        offset: int = 0,
+        size: Optional[int] = None,
+        byteorder: str = "big",
+        bit_order: str = "lsb",
+    ):
+        """Create a BitVector that overlays `size` bits of `obj`
+        starting at byte `offset`, without copying.
+
+        Like `from_buffer`, reads and writes go directly to the buffer,
+        and an overlay can be moved to another offset or buffer with
+        `repoint` without allocating a new vector. This makes a subclass
+        declaring BitFields a zero-copy view of a packet header:
+
+        ```python
+        > class UDPHeader(BitVector):
+        >     sport = BitField(48, 16)
+        >     dport = BitField(32, 16)
+        >     length = BitField(16, 16)
+        >     checksum = BitField(0, 16)
+        >
+        > udp = UDPHeader.overlay(packet, offset=20)
+        > udp.dport
+        53
+        ```
+
+        The size defaults to the extent of the class's BitFields
+        rounded up to a whole number of bytes.
+
+        :param obj: buffer
+        :param offset: int byte offset
+        :param size: Optional[int] multiple of 8 bits
+        :param byteorder: str
+        :param bit_order: str
+        :return: BitVector
+
+        Raises:
+        - ValueError if size is not a positive multiple of 8
+        - ValueError if the overlay does not fit in the buffer
+        - ValueError if the layout is unknown
+        - TypeError if obj does not support the buffer protocol
+        """
+        if size is None:
+            size = (cls._codec.extent + 7) & ~0x7
+
+        if size <= 0 or size & 0x7:
+            raise ValueError(f"Overlay size must be a positive multiple of 8, got {size}")
+
+        meta = metadata(size, layout_backend(byteorder, bit_order))
+        bv = cls.__new__(cls)
+        bv._meta = meta
+        bv._value = BufferWindow(obj, offset, meta.nbytes)
+        return bv
+
+    @classmethod
+    def iter_overlay(cls, obj, stride: Optional[int] = None, offset: int = 0, **kwargs):
+        """Yields a single overlay moved to successive records of `obj`.
+
+        The overlay starts at byte `offset` and advances `stride` bytes,
+        defaulting to the size of the overlay, for as long as it fits in
+        the buffer. The same object is yielded every time; copy it to
+        keep a record. Keyword arguments are passed to `overlay`.
+
+        :param obj: buffer
+        :param stride: Optional[int] bytes
+        :param offset: int
+        :return: Iterator[BitVector]
+
+        Raises:
+        - ValueError if stride is not positive
+        """
+        bv = cls.overlay(obj, offset, **kwargs)
+        window = bv._value
+        stride = stride or bv._meta.nbytes
+
+        if stride <= 0:
+            raise ValueError(f"stride must be positive, got {stride}")
+
+        for start in range(offset, memoryview(obj).nbytes - len(window) + 1, stride):
+            window.move(start)
+            bv._rank = None
+            yield bv
+
+    @classmethod
+    def open(
+        cls,
+        path,
+        size: Optional[int] = None,
+        mode: str = "r",
+        byteorder: str = "little",
+        bit_order: str = "lsb",
+    ):
+        """Create a BitVector backed by a memory mapping of the file at
+        `path`.
+
+        Like `from_buffer`, reads and writes go directly to the mapped
+        file, so indexing, slicing and BitField access only touch the
+        pages holding the bits involved, and in-place AND, OR and XOR
+        with a vector of the same size and layout work through the file
+        a chunk at a time. Call `flush` to write changes to disk and
+        `close` to unmap the file, or use the vector as a context
+        manager:
+
+        ```python
+        > with BitVector.open("seen.bits", size=1 << 36, mode="w+") as seen:
+        >     seen[123_456_789_012] = 1
+        ```
+
+        Mode "r" maps the file read-only, "r+" read-write and "w+"
+        creates or truncates the file to `size` bits, all zero. The
+        size defaults to the size of the file in bits. The layout
+        defaults to the first byte of the file holding bits 0-7, least
+        significant bit first, which is the layout of the "bytes"
+        backend.
+
+        :param path: str or os.PathLike
+        :param size: Optional[int] multiple of 8 bits
+        :param mode: str "r", "r+" or "w+"
+        :param byteorder: str
+        :param bit_order: str
+        :return: BitVector
+
+        Raises:
+        - ValueError if mode or the layout is unknown
+        - ValueError if size is not a positive multiple of 8
+        - ValueError if size exceeds the file
+        - OSError if the file cannot be opened or mapped
+        """
+        try:
+            file_mode, access = _MMAP_MODES[mode]
+        except KeyError:
+            raise ValueError(f"Unknown mode: {mode!r}") from None
+
+        backend = layout_backend(byteorder, bit_order)
+
+        if size is None and mode == "w+":
+            raise ValueError("Mode 'w+' requires a size")
+
+        if size is not None and (size <= 0 or size & 0x7):
+            raise ValueError(f"File size must be a positive multiple of 8, got {size}")
+
+        with io.open(path, file_mode) as f:
+            if mode == "w+" and size is not None:
+                f.truncate(size // 8)
+            nbytes = os.fstat(f.fileno()).st_size
+            if size is None:
+                size = nbytes * 8
+            meta = metadata(size, backend)
+            if meta.nbytes > nbytes:
+                raise ValueError(f"Size of {size} bits exceeds file of {nbytes} bytes")
+            mapping = mmap.mmap(f.fileno(), meta.nbytes, access=access)
+
+        bv = cls.__new__(cls)
+        bv._meta = meta
+        bv._value = memoryview(mapping)
+        bv._rank = None
+        return bv
+
+    @classmethod
+    def from_numpy(cls, arr, bit_order: str = "lsb", size: Optional[int] = None):
+        """Create a BitVector from a NumPy array (requires NumPy).
+
+        A bool array holds one bit per element, element zero becoming
+        bit zero. A uint8 or uint64 array holds packed bits with
+        `bit_order` selecting whether the lowest numbered bit of each
+        byte or word is its least ("lsb") or most ("msb") significant
+        bit, so `np.packbits(a)` is read with bit_order="msb".
+
+        The size defaults to the number of bits in the array.
+
+        :param arr: numpy.ndarray
+        :param bit_order: str
+        :param size: Optional[int]
+        :return: BitVector
+
+        Raises:
+        - TypeError for other dtypes
+        - ValueError if bit_order is unknown
+        - ImportError if NumPy is not installed
+        """
+        from ._numpy import from_numpy
+
+        return from_numpy(cls, arr, bit_order, size)
+
+    def __init__(self, value: int = 0, size: int = 128, backend: str = "int"):
         """Initialize a BitVector with integer value and size in bits.
 
+        The default "int" backend keeps the bits in a Python int, the
+        "bytes" and "words" backends keep them in a mutable buffer so
+        single bit updates do not copy the whole vector.
+
         :param value: int
         :param size: int
+        :param backend: str
 
         Raises:
         - ValueError if size <= 0
+        - ValueError if backend is unknown
+        """
+        meta = self._meta = metadata(size, backend)
+        value = int(value)
+        if value < 0 or value >> size:
+            value &= meta.mask
+        self._value = meta.backend.new(meta, value)
+        self._rank = None
+
+    def __getstate__(self) -> tuple:
+        meta = self._meta
+        value = meta.backend.to_int(self._value)
+        return (meta.size, value, getattr(self, "__dict__", None), meta.backend.name)
+
+    def __setstate__(self, state: tuple) -> None:
+        size, value, attrs, backend = state
+        meta = self._meta = metadata(size, backend)
+        self._value = meta.backend.new(meta, value)
+        self._rank = None
+        if attrs:
+            self.__dict__.update(attrs)
+
+    @classmethod
+    def _copy(cls, bv: "BitVector"):
+        """Returns a new instance of `cls` with the size, backend and bits
+        of `bv`. An int store is immutable and shared; buffers are
+        copied.
+        """
+        meta = bv._meta
+        store = bv._value
+        new = cls.__new__(cls)
+        new._meta = meta
+        new._rank = None
+
+        if isinstance(store, memoryview) and hasattr(meta.backend, "allocate"):
+            copy = meta.backend.allocate(meta)
+            if len(copy) == len(store):
+                copy[:] = store
+            else:
+                # a view padded past the vector, like a BitVectorArray row
+                copy = meta.backend.new(meta, meta.backend.to_int(store))
+            store = copy
+        elif not isinstance(store, int):
+            store = meta.backend.new(meta, meta.backend.to_int(store))
+
+        new._value = store
+        return new
+
+    def freeze(self, cls: Optional[Type["FrozenBitVector"]] = None) -> "FrozenBitVector":
+        """Returns an immutable, hashable copy of this BitVector, see
+        `bitvector.frozen`. A vector kept in an int shares it with the
+        copy, so freezing costs a small constant time; a buffer is copied.
+
+        :param cls: Optional[Type[FrozenBitVector]] subclass to create
+        :return: FrozenBitVector
+        """
+        return (cls or _frozen_type())._copy(self)
+
+    def repoint(self, offset: int, obj=None):
+        """Moves an overlay to byte `offset` of `obj`, or of the buffer
+        it already overlays, and returns self.
+
+        :param offset: int
+        :param obj: buffer
+        :return: BitVector
+
+        Raises:
+        - TypeError if this BitVector was not created by `overlay`
+        - ValueError if the overlay does not fit in the buffer
+        """
+        try:
+            self._value.move(offset, obj)
+        except AttributeError:
+            raise TypeError(f"{self.__class__.__name__} is not an overlay") from None
+        self._rank = None
+        return self
+
+    def __mapping(self) -> mmap.mmap:
+        mapping = getattr(self._value, "obj", None)
+        if not isinstance(mapping, mmap.mmap):
+            raise TypeError(f"{self.__class__.__name__} is not memory-mapped")
+        return mapping
+
+    def flush(self) -> None:
+        """Writes changes to a memory-mapped BitVector back to its file.
+
+        Raises:
+        - TypeError if this BitVector does not wrap an mmap
+        """
+        mapping = self.__mapping()
+        if not self._value.readonly:
+            mapping.flush()
+
+    def close(self) -> None:
+        """Flushes and unmaps a memory-mapped BitVector, which cannot be
+        used afterwards.
+
+        Raises:
+        - TypeError if this BitVector does not wrap an mmap
+        - BufferError if views of the mapping are still in use
         """
-        if size <= 0:
-            raise ValueError("Size must greater than zero.")
+        mapping = self.__mapping()
+        self.flush()
+        self._rank = None
+        self._value.release()
+        mapping.close()
 
-        self.MAX = (1 << size) - 1
-        self.value = value
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def MAX(self) -> int:
+        """The largest integer value this BitVector can hold."""
+        return self._meta.mask
+
+    @property
+    def backend(self) -> str:
+        """Name of the storage backend of this BitVector."""
+        return self._meta.backend.name
 
     @property
     def value(self) -> int:
         """The integer value of this BitVector."""
-        return getattr(self, "_value", 0)
+        return self._meta.backend.to_int(self._value)
 
     @value.setter
     def value(self, new_value: int) -> None:
-        self._value = int(new_value) & self.MAX
+        meta = self._meta
+        new_value = int(new_value)
+        if new_value < 0 or new_value >> meta.size:
+            new_value &= meta.mask
+        self._value = meta.backend.assign(self._value, meta, new_value)
+        self._rank = None
 
     def clear(self):
         """Clears all bits in the vector to zero."""
-        self._value = 0
+        meta = self._meta
+        self._value = meta.backend.assign(self._value, meta, 0)
+        self._rank = None
 
     def set(self):
         """Sets all bits in the vector to one."""
-        self._value = self.MAX
+        meta = self._meta
+        self._value = meta.backend.assign(self._value, meta, meta.mask)
+        self._rank = None
 
     def _getb(self, offset: int) -> int:
         """Retrieves the bit value at offset."""
+        meta = self._meta
 
-        if offset > len(self) - 1:
+        if not 0 <= offset < meta.size:
             raise IndexError(offset)
 
-        return (self.value >> offset) & 0x1
+        return meta.backend.getbit(self._value, offset)
 
     def _setb(self, offset: int) -> None:
         """Sets the bit value at offset."""
-        if offset > (len(self) - 1):
+        meta = self._meta
+
+        if not 0 <= offset < meta.size:
             raise IndexError(offset)
 
-        self.value |= (1 << offset) & self.MAX
+        self._value = meta.backend.setbit(self._value, offset)
+        self._rank = None
 
     def _clrb(self, offset: int) -> None:
         """Clears the bit value at offset."""
-        self.value &= ~(1 << offset)
+        meta = self._meta
+
+        if not 0 <= offset < meta.size:
+            raise IndexError(offset)
+
+        self._value = meta.backend.clrbit(self._value, offset)
+        self._rank = None
 
     def _setval(self, offset: int, value: int):
         if value:
@@ -99,24 +571,302 @@ class BitVector:
         :return: int
         """
         prev = self._getb(offset)
-        self.value ^= (1 << offset) & self.MAX
+        self._value = self._meta.backend.flipbit(self._value, offset)
+        self._rank = None
         return prev
 
+    def count(self) -> int:
+        """Returns the number of bits set to one."""
+        meta = self._meta
+
+        if hasattr(meta.backend, "byteorder"):
+            return count_ones(self._value)
+
+        return popcount(self.value)
+
+    def __directory(self) -> RankDirectory:
+        """Returns the rank/select directory of this BitVector, taking a
+        snapshot of the bits on first use after the vector was last
+        modified. A vector kept in a little-endian, lsb first buffer is
+        scanned in place rather than copied.
+        """
+        directory = getattr(self, "_rank", None)
+        if directory is None:
+            meta = self._meta
+            store = self._value
+            data: Buffer
+            backend = meta.backend
+            if isinstance(store, memoryview) and (
+                getattr(backend, "byteorder", None) == "little" and getattr(backend, "bit_order", None) == "lsb"
+            ):
+                data = store
+            else:
+                data = self.value.to_bytes(meta.nbytes, "little")
+            directory = self._rank = RankDirectory(data)
+        return directory
+
+    def rank(self, offset: int) -> int:
+        """Returns the number of bits set to one below `offset`.
+
+        The first call builds a directory of block counts that makes
+        later calls constant time until the vector is modified. Writes
+        made to a wrapped buffer other than through this BitVector are
+        not seen by the directory; assign `value` to rebuild it.
+
+        :param offset: int 0 <= offset <= len(self)
+        :return: int
+
+        Raises:
+        - IndexError if offset is out of range
+        """
+        if not 0 <= offset <= self._meta.size:
+            raise IndexError(offset)
+
+        return self.__directory().rank(offset)
+
+    def select(self, k: int) -> int:
+        """Returns the offset of the k-th bit set to one, counting from
+        zero, so that `rank(select(k)) == k`. Uses the same directory
+        as `rank`.
+
+        :param k: int 0 <= k < count()
+        :return: int
+
+        Raises:
+        - IndexError if fewer than k + 1 bits are set
+        """
+        directory = self.__directory()
+
+        if not 0 <= k < directory.count():
+            raise IndexError(k)
+
+        return directory.select(k)
+
+    def iter_ones(self) -> Iterator[int]:
+        """Yields the offsets of the bits set to one in increasing order.
+
+        Runs of zero bytes are skipped in C, so walking a sparse vector
+        costs time proportional to the number of ones. The vector should
+        not be modified while iterating.
+
+        :return: Iterator[int]
+        """
+        native = getattr(self._meta.backend, "iter_set", None)
+
+        if native:
+            return native(self._value)
+
+        return iter_set(self.__directory().data, self._meta.size)
+
+    def iter_zeros(self) -> Iterator[int]:
+        """Yields the offsets of the bits set to zero in increasing order,
+        see `iter_ones`.
+
+        :return: Iterator[int]
+        """
+        return iter_set(bytes(self.__directory().data).translate(INVERT), self._meta.size)
+
+    def __find(self, offset: int, value: int) -> int:
+        size = self._meta.size
+
+        if not 0 <= offset <= size:
+            raise IndexError(offset)
+
+        native = getattr(self._meta.backend, "next_set", None) if value else None
+
+        if native:
+            return native(self._value, offset)
+
+        found = find_next(self.__directory().data, offset, value)
+
+        return found if found < size else -1
+
+    def find_first_set(self) -> int:
+        """Returns the offset of the lowest bit set to one, or -1 if no
+        bits are set.
+
+        :return: int
+        """
+        return self.__find(0, 1)
+
+    def find_next_set(self, offset: int) -> int:
+        """Returns the offset of the first bit set to one at or after
+        `offset`, or -1 if there is none.
+
+        :param offset: int 0 <= offset <= len(self)
+        :return: int
+
+        Raises:
+        - IndexError if offset is out of range
+        """
+        return self.__find(offset, 1)
+
+    def find_last_set(self) -> int:
+        """Returns the offset of the highest bit set to one, or -1 if no
+        bits are set.
+
+        :return: int
+        """
+        native = getattr(self._meta.backend, "last_set", None)
+
+        if native:
+            return native(self._value)
+
+        return self.value.bit_length() - 1
+
+    def find_first_zero(self) -> int:
+        """Returns the offset of the lowest bit set to zero, or -1 if all
+        bits are set.
+
+        :return: int
+        """
+        return self.__find(0, 0)
+
+    def find_next_zero(self, offset: int) -> int:
+        """Returns the offset of the first bit set to zero at or after
+        `offset`, or -1 if there is none.
+
+        :param offset: int 0 <= offset <= len(self)
+        :return: int
+
+        Raises:
+        - IndexError if offset is out of range
+        """
+        return self.__find(offset, 0)
+
+    def find_last_zero(self) -> int:
+        """Returns the offset of the highest bit set to zero, or -1 if
+        all bits are set.
+
+        :return: int
+        """
+        return (~self.value & self._meta.mask).bit_length() - 1
+
+    def iter_runs(self, value: int = 1) -> Iterator[Tuple[int, int]]:
+        """Yields (offset, length) for each run of consecutive bits equal
+        to `value` in increasing order of offset.
+
+        Each run boundary is found with a byte search, so the cost grows
+        with the number of runs rather than the size of the vector. The
+        vector should not be modified while iterating.
+
+        :param value: int 1 or 0
+        :return: Iterator[Tuple[int, int]]
+        """
+        return iter_runs(self.__directory().data, self._meta.size, 1 if value else 0)
+
+    def find_run(self, length: int, value: int = 0, start: int = 0) -> int:
+        """Returns the offset of the first run of at least `length`
+        consecutive bits equal to `value` at or after `start`, or -1 if
+        there is none.
+
+        :param length: int
+        :param value: int 1 or 0
+        :param start: int 0 <= start <= len(self)
+        :return: int
+
+        Raises:
+        - ValueError if length is not positive
+        - IndexError if start is out of range
+        """
+        if length <= 0:
+            raise ValueError(f"length must be positive, got {length}")
+
+        if not 0 <= start <= self._meta.size:
+            raise IndexError(start)
+
+        return find_run(self.__directory().data, self._meta.size, length, 1 if value else 0, start)
+
+    def allocate(self, length: int, start: int = 0) -> int:
+        """Treating this BitVector as an allocation bitmap, finds the
+        first run of `length` zero bits at or after `start`, sets them
+        to one and returns the offset of the run.
+
+        > offset = bitmap.allocate(16)
+        > bitmap.free(offset, 16)
+
+        :param length: int
+        :param start: int
+        :return: int
+
+        Raises:
+        - ValueError if length is not positive or there is no free run
+        - IndexError if start is out of range
+        """
+        offset = self.find_run(length, 0, start)
+
+        if offset < 0:
+            raise ValueError(f"No run of {length} free bits")
+
+        self[offset : offset + length] = -1
+
+        return offset
+
+    def free(self, offset: int, length: int) -> None:
+        """Clears `length` bits starting at `offset`, releasing a run
+        returned by `allocate`.
+
+        :param offset: int
+        :param length: int
+
+        Raises:
+        - IndexError if the run is not inside the vector
+        """
+        if offset < 0 or length < 0 or offset + length > self._meta.size:
+            raise IndexError(f"Run {offset}:{offset + length} is out of range")
+
+        self[offset : offset + length] = 0
+
+    def unpack(self, as_dict: bool = True) -> Union[Dict[str, int], tuple]:
+        """Returns the value of every BitField declared by this class,
+        decoded in a single pass.
+
+        :param as_dict: bool return a dict of names and values rather
+                        than a tuple of values in declaration order
+        :return: Union[Dict[str, int], tuple]
+        """
+        if as_dict:
+            return self._codec.unpack_dict(self.value)
+        return self._codec.unpack(self.value)
+
+    def pack(self, **fields: int):
+        """Assigns several BitFields declared by this class in a single
+        pass and returns self.
+
+        > cmd.pack(power=1, speed=5)
+
+        :return: self
+
+        Raises:
+        - TypeError for unknown or read-only fields
+        """
+        self.value = self._codec.pack(self.value, **fields)
+        return self
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(value={self!s}, size={len(self)})"
 
     def __str__(self) -> str:
-        nibbles = (len(self) // 4) + (1 if (len(self) % 4) else 0)
-        return "0x" + hex(self.value)[2:].zfill(nibbles)
+        return "0x" + hex(self.value)[2:].zfill(self._meta.nibbles)
 
     def __len__(self) -> int:
         """Length of the vector in bits."""
-        try:
-            return self._len
-        except AttributeError:
-            pass
-        self._len: int = self.MAX.bit_length()
-        return self._len
+        return self._meta.size
+
+    def __sizeof__(self) -> int:
+        """Bytes retained by this BitVector: the object, its storage, its
+        rank directory if built and the instance dictionary of
+        subclasses that have one, see `bitvector.backends.store_sizeof`.
+        The Metadata shared by all vectors of the same size and backend
+        is not included.
+        """
+        size = object.__sizeof__(self) + store_sizeof(self._value)
+        rank = getattr(self, "_rank", None)
+        if rank is not None:
+            size += sys.getsizeof(rank)
+        if hasattr(self, "__dict__"):
+            size += sys.getsizeof(self.__dict__)
+        return size
 
     def __getitem__(self, key: Union[int, slice]) -> int:
         """Given a key, retrieve a bit or bitfield."""
@@ -124,17 +874,22 @@ class BitVector:
         if isinstance(key, int):
             offset: int = cast(int, key)
             if offset < 0:
-                offset += len(self)
+                offset += self._meta.size
             return self._getb(offset)
 
         if isinstance(key, slice):
             rng: slice = cast(slice, key)
-            value = 0
-            for n, b in enumerate(range(*rng.indices(len(self)))):
-                v = self._getb(b)
-                if v:
-                    value += 1 << n
-            return value
+            meta = self._meta
+            start, stop, step = rng.indices(meta.size)
+            if step == 1:
+                if stop <= start:
+                    return 0
+                return meta.backend.getfield(self._value, start, stop - start)
+            count, low, width = span(start, stop, step)
+            if count == 0:
+                return 0
+            field = meta.backend.getfield(self._value, low, width)
+            return get_slice(field, start - low, stop - low, step)
 
         raise ValueError(f"Unknown key type: {type(key)}")
 
@@ -156,23 +911,50 @@ class BitVector:
         if isinstance(key, int):
             offset = int(key)
             if offset < 0:
-                offset += len(self)
+                offset += self._meta.size
 
             self._setval(offset, value)
             return
 
         try:
-            if value is True or value is False:
-                for b in range(*key.indices(len(self))):
-                    self._setval(b, value)
-                return
-
-            for n, b in enumerate(range(*key.indices(len(self)))):
-                self._setval(b, (value >> n) & 0x1)
-
+            start, stop, step = key.indices(self._meta.size)
         except AttributeError:
             raise ValueError("Expected int or slice key") from None
 
+        if value is True or value is False:
+            value = -1 if value else 0
+
+        count, low, width = span(start, stop, step)
+
+        if count == 0:
+            return
+
+        backend = self._meta.backend
+
+        if step != 1:
+            field = backend.getfield(self._value, low, width)
+            value = set_slice(field, start - low, stop - low, step, value)
+
+        self._value = backend.setfield(self._value, low, width, value)
+        self._rank = None
+
+    def _new_like(self, value: int, size: int):
+        """Returns a new instance of this class using the same storage
+        backend as self, initialized with `value` and `size`. Operators
+        returning a new vector create it here, subclasses whose
+        constructor takes other arguments override it.
+
+        :param value: int
+        :param size: int
+        :return: BitVector
+        """
+        backend = self._meta.backend.name
+
+        if backend == "int":
+            return self.__class__(value, size=size)
+
+        return self.__class__(value, size=size, backend=backend)
+
     def __binary_op(self, other, func, return_obj: bool = False, reverse: bool = False):
         """Calls the supplied function `func` with self and other.
 
@@ -185,12 +967,25 @@ class BitVector:
         :param return_obj: bool
         :return: Union[int, bool, BitVector]
         """
+        meta = self._meta
+        native = meta.backend.binary_op
+
+        if native and return_obj and getattr(other, "_meta", None) is meta:
+            store = native(func, self._value, other._value, False)
+            if store is not NotImplemented:
+                retval = self._new_like(0, meta.size)
+                retval._value = store
+                return retval
+
+        if type(other) is not int and not isinstance(other, BitVector):
+            if getattr(other, "_reflects_bitvectors", False):
+                return NotImplemented
 
         try:
             retval = func(self.value, other.value)
             if return_obj:
                 size = len(min(self, other, key=len))
-                retval = self.__class__(retval, size=size)
+                retval = self._new_like(retval, size)
             return retval
         except AttributeError:
             pass
@@ -201,7 +996,7 @@ class BitVector:
         retval = func(self.value, other)
 
         if return_obj:
-            retval = self.__class__(retval, size=len(self))
+            retval = self._new_like(retval, self._meta.size)
 
         return retval
 
@@ -216,9 +1011,9 @@ class BitVector:
         :return: Union[int, BitVector]
         """
 
-        retval = func(self.value) & self.MAX
+        retval = func(self.value) & self._meta.mask
         if return_obj:
-            retval = self.__class__(retval, size=len(self))
+            retval = self._new_like(retval, self._meta.size)
         return retval
 
     def __inplace_op(self, other, func) -> object:
@@ -229,6 +1024,20 @@ class BitVector:
         :param func: Callable from operator
         :return: self
         """
+        meta = self._meta
+        native = meta.backend.binary_op
+
+        if native and getattr(other, "_meta", None) is meta:
+            store = native(func, self._value, other._value, True)
+            if store is not NotImplemented:
+                self._value = store
+                self._rank = None
+                return self
+
+        if type(other) is not int and not isinstance(other, BitVector):
+            if getattr(other, "_reflects_bitvectors", False):
+                return NotImplemented
+
         try:
             self.value = func(self.value, other.value)
         except AttributeError:
@@ -238,7 +1047,7 @@ class BitVector:
     @property
     def bin(self) -> str:
         """Binary string representation of BitVector."""
-        return f"0b{bin(self.value)[2:].zfill(len(self))}"
+        return f"0b{bin(self.value)[2:].zfill(self._meta.size)}"
 
     @property
     def hex(self) -> str:
@@ -248,11 +1057,68 @@ class BitVector:
     @property
     def bytes(self) -> bytes:
         """Byte array representation of BitVector."""
-        n = len(self) // 8 + (1 if len(self) % 8 else 0)
-        return self.value.to_bytes(n, "big")
+        return self.value.to_bytes(self._meta.nbytes, "big")
+
+    def to_buffer(self, byteorder: Optional[str] = None, bit_order: Optional[str] = None) -> memoryview:
+        """Returns a memoryview of this BitVector's bytes.
+
+        A vector kept in a byte buffer returns a writable view of that
+        buffer, without copying, when the requested layout matches its
+        own or no layout is requested. Otherwise a read-only copy is
+        returned in the requested layout, which defaults to "big" byte
+        order and "lsb" bit order like the `bytes` property.
+
+        :param byteorder: Optional[str] "little" or "big"
+        :param bit_order: Optional[str] "lsb" or "msb"
+        :return: memoryview
+
+        Raises:
+        - ValueError if the layout is unknown
+        """
+        meta = self._meta
+        native = getattr(meta.backend, "byteorder", None)
+
+        if native and byteorder in (None, native) and bit_order in (None, getattr(meta.backend, "bit_order", None)):
+            return self._value[: meta.nbytes]
+
+        data = int_to_bytes(self.value, meta.nbytes, byteorder or "big", bit_order or "lsb")
+
+        return memoryview(data)
+
+    def to_numpy(self, dtype=bool, bit_order: str = "lsb"):
+        """Returns the bits of this BitVector as a NumPy array (requires NumPy).
+
+        With dtype=bool the array holds one element per bit, element
+        zero being bit zero. With dtype uint8 or uint64 the bits are
+        packed into bytes or words, `bit_order` selecting whether the
+        lowest numbered bit of each is its least ("lsb") or most
+        ("msb") significant bit; dtype=uint8 with bit_order="msb"
+        matches `np.packbits`.
+
+        :param dtype: bool, numpy.uint8 or numpy.uint64
+        :param bit_order: str
+        :return: numpy.ndarray
+
+        Raises:
+        - TypeError for other dtypes
+        - ValueError if bit_order is unknown
+        - ImportError if NumPy is not installed
+        """
+        from ._numpy import to_numpy
+
+        return to_numpy(self, dtype, bit_order)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Buffer protocol support (Python 3.12+), see `to_buffer`."""
+        return self.to_buffer()
 
     def __bool__(self) -> bool:
         """Returns False if zero else True."""
+        native = getattr(self._meta.backend, "nonzero", None)
+
+        if native:
+            return native(self._value)
+
         return bool(self.value)
 
     def __eq__(self, other) -> bool:
@@ -0,0 +1,481 @@
+"""A columnar container of many fixed-width BitVectors."""
+
+import operator
+import sys
+
+from array import array
+from typing import Iterable, Iterator, List, Tuple, Type, Union
+
+from .backends import store_sizeof
+from .bitvector import BitVector, metadata
+from ._rank import POPCOUNT
+
+
+_LOW_BYTE = b"\xff" + bytes(7)
+
+
+class BitVectorArray:
+    """An array of `count` vectors of `size` bits stored contiguously
+    in 64-bit words, each row padded to a whole number of words.
+
+    Indexing returns a BitVector view of a row that reads and writes
+    the array's storage directly. Bitwise operators, shifts,
+    comparisons and popcounts apply to every row in a single call,
+    treating the whole array as one large integer where possible:
+
+    ```python
+    > from bitvector import BitVectorArray
+    >
+    > regs = BitVectorArray([0x12, 0x34, 0x56], size=8)
+    > (regs & 0x0F).tolist()
+    [2, 4, 6]
+    > regs[1][0:4]
+    4
+    ```
+    """
+
+    __slots__ = ("_meta", "_count", "_stride", "_words", "_bytes", "_vector_type")
+
+    @classmethod
+    def zeros(cls, count: int, size: int = 128, vector_type: Type[BitVector] = BitVector):
+        """Create a BitVectorArray of `count` vectors initialized with zeros.
+
+        :param count: int
+        :param size: int
+        :param vector_type: Type[BitVector]
+        :return: BitVectorArray
+        """
+        return cls(size=size, count=count, vector_type=vector_type)
+
+    def __init__(
+        self,
+        values: Iterable[Union[int, BitVector]] = (),
+        size: int = 128,
+        count: int = 0,
+        vector_type: Type[BitVector] = BitVector,
+    ):
+        """Initialize a BitVectorArray with integer or BitVector values.
+
+        If `count` is larger than the number of values the remaining
+        rows are zero.
+
+        :param values: Iterable[Union[int, BitVector]]
+        :param size: int width of each vector in bits
+        :param count: int minimum number of vectors
+        :param vector_type: Type[BitVector] BitVector subclass returned by indexing
+
+        Raises:
+        - ValueError if size <= 0
+        """
+        meta = metadata(size)
+        stride = ((size + 63) // 64) * 8
+        rows = [
+            (int(getattr(v, "value", v)) & meta.mask).to_bytes(stride, "little")
+            for v in values
+        ]
+        rows.extend([bytes(stride)] * max(0, count - len(rows)))
+
+        self._setup(meta, len(rows), b"".join(rows), vector_type)
+
+    def _setup(self, meta, count: int, data: bytes, vector_type: Type[BitVector]) -> None:
+        self._meta = meta
+        self._count = count
+        self._stride = ((meta.size + 63) // 64) * 8
+        self._words = array("Q")
+        self._words.frombytes(data)
+        self._bytes = memoryview(self._words).cast("B")
+        self._vector_type = vector_type
+
+    @property
+    def size(self) -> int:
+        """Width in bits of each vector."""
+        return self._meta.size
+
+    @property
+    def words(self) -> array:
+        """The underlying array of 64-bit words, `size` bits padded to
+        whole words per row."""
+        return self._words
+
+    def __len__(self) -> int:
+        """Number of vectors in the array."""
+        return self._count
+
+    def __sizeof__(self) -> int:
+        # the byte view spans the words, which store_sizeof counts with it
+        return object.__sizeof__(self) + store_sizeof(self._bytes)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(count={self._count}, size={self._meta.size})"
+
+    def _index(self, key: int) -> int:
+        index = int(key)
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(key)
+        return index
+
+    def _row(self, index: int) -> memoryview:
+        offset = index * self._stride
+        return self._bytes[offset : offset + self._stride]
+
+    def __getitem__(self, key: Union[int, slice]):
+        """Returns a BitVector view of a row, or a new BitVectorArray
+        holding a copy of the rows addressed by a slice."""
+
+        if isinstance(key, slice):
+            return self.__class__(
+                [self._rowint(n) for n in range(*key.indices(self._count))],
+                size=self._meta.size,
+                vector_type=self._vector_type,
+            )
+
+        bv = self._vector_type.__new__(self._vector_type)
+        bv._meta = metadata(self._meta.size, "bytes")
+        bv._value = self._row(self._index(key))
+        return bv
+
+    def __setitem__(self, key: int, value: Union[int, BitVector]) -> None:
+        """Replaces the row at `key` with `value`."""
+        bits = int(getattr(value, "value", value)) & self._meta.mask
+        self._row(self._index(key))[:] = bits.to_bytes(self._stride, "little")
+
+    def __iter__(self) -> Iterator[BitVector]:
+        for index in range(self._count):
+            yield self[index]
+
+    def _rowint(self, index: int) -> int:
+        return int.from_bytes(self._row(index), "little")
+
+    def tolist(self) -> List[int]:
+        """Returns the integer values of all rows.
+
+        :return: List[int]
+        """
+        return [self._rowint(n) for n in range(self._count)]
+
+    def _toint(self) -> int:
+        return int.from_bytes(self._bytes, "little")
+
+    def _repeat(self, value: int) -> int:
+        """Returns an integer with `value` in every row."""
+        return int.from_bytes(value.to_bytes(self._stride, "little") * self._count, "little")
+
+    def _new(self, value: int):
+        result = self.__class__.__new__(self.__class__)
+        data = value.to_bytes(len(self._bytes), "little")
+        result._setup(self._meta, self._count, data, self._vector_type)
+        return result
+
+    def _operand(self, other) -> int:
+        """Returns `other` as an integer covering every row, broadcasting
+        an int or BitVector to all rows."""
+
+        if isinstance(other, BitVectorArray):
+            if other._meta.size != self._meta.size or other._count != self._count:
+                raise ValueError(
+                    f"Shape mismatch: {self._count}x{self._meta.size} "
+                    f"and {other._count}x{other._meta.size}"
+                )
+            return other._toint()
+
+        return self._repeat(int(getattr(other, "value", other)) & self._meta.mask)
+
+    def __binary_op(self, other, func):
+        return self._new(func(self._toint(), self._operand(other)))
+
+    def __inplace_op(self, other, func):
+        value = func(self._toint(), self._operand(other))
+        self._bytes[:] = value.to_bytes(len(self._bytes), "little")
+        return self
+
+    def __shift(self, count: int, left: bool) -> int:
+        count = int(getattr(count, "value", count))
+        if count < 0:
+            raise ValueError("negative shift count")
+        mask = self._meta.mask
+        if left:
+            return (self._toint() << count) & self._repeat((mask << count) & mask)
+        return (self._toint() >> count) & self._repeat(mask >> count)
+
+    def __and__(self, other):
+        """Bitwise AND of every row with other, returning a new BitVectorArray.
+
+        :param other: Union[BitVectorArray, BitVector, int]
+        :return: BitVectorArray
+        """
+        return self.__binary_op(other, operator.and_)
+
+    __rand__ = __and__
+
+    def __iand__(self, other):
+        """Bitwise AND of every row with other in-place.
+
+        :param other: Union[BitVectorArray, BitVector, int]
+        :return: self
+        """
+        return self.__inplace_op(other, operator.and_)
+
+    def __or__(self, other):
+        """Bitwise OR of every row with other, returning a new BitVectorArray.
+
+        :param other: Union[BitVectorArray, BitVector, int]
+        :return: BitVectorArray
+        """
+        return self.__binary_op(other, operator.or_)
+
+    __ror__ = __or__
+
+    def __ior__(self, other):
+        """Bitwise OR of every row with other in-place.
+
+        :param other: Union[BitVectorArray, BitVector, int]
+        :return: self
+        """
+        return self.__inplace_op(other, operator.or_)
+
+    def __xor__(self, other):
+        """Bitwise XOR of every row with other, returning a new BitVectorArray.
+
+        :param other: Union[BitVectorArray, BitVector, int]
+        :return: BitVectorArray
+        """
+        return self.__binary_op(other, operator.xor)
+
+    __rxor__ = __xor__
+
+    def __ixor__(self, other):
+        """Bitwise XOR of every row with other in-place.
+
+        :param other: Union[BitVectorArray, BitVector, int]
+        :return: self
+        """
+        return self.__inplace_op(other, operator.xor)
+
+    def __invert__(self):
+        """Inverts every row, returning a new BitVectorArray.
+
+        :return: BitVectorArray
+        """
+        return self.__binary_op(self._meta.mask, operator.xor)
+
+    def __lshift__(self, other):
+        """Shifts every row left by other positions, returning a new BitVectorArray.
+
+        :param other: Union[BitVector, int]
+        :return: BitVectorArray
+        """
+        return self._new(self.__shift(other, True))
+
+    def __ilshift__(self, other):
+        """Shifts every row left by other positions in-place.
+
+        :param other: Union[BitVector, int]
+        :return: self
+        """
+        self._bytes[:] = self.__shift(other, True).to_bytes(len(self._bytes), "little")
+        return self
+
+    def __rshift__(self, other):
+        """Shifts every row right by other positions, returning a new BitVectorArray.
+
+        :param other: Union[BitVector, int]
+        :return: BitVectorArray
+        """
+        return self._new(self.__shift(other, False))
+
+    def __irshift__(self, other):
+        """Shifts every row right by other positions in-place.
+
+        :param other: Union[BitVector, int]
+        :return: self
+        """
+        self._bytes[:] = self.__shift(other, False).to_bytes(len(self._bytes), "little")
+        return self
+
+    def _popcounts(self, data: bytes) -> List[int]:
+        """Returns the number of set bits in each row of `data`, which
+        has the same layout as the array's storage.
+
+        Bytes are translated to their bit counts and the counts of the
+        eight bytes in each word are summed into the word's low byte
+        with shifts over the whole array, leaving one Python level
+        addition per word only for rows wider than a word.
+        """
+        counts = int.from_bytes(data.translate(POPCOUNT), "little")
+        counts += counts >> 8
+        counts += counts >> 16
+        counts += counts >> 32
+        nwords = len(data) // 8
+        counts &= int.from_bytes(_LOW_BYTE * nwords, "little")
+        words = counts.to_bytes(len(data), "little")[::8]
+        step = self._stride // 8
+        if step == 1:
+            return list(words)
+        return [sum(words[n : n + step]) for n in range(0, len(words), step)]
+
+    def __compare(self, other, func) -> List[bool]:
+        if func in (operator.eq, operator.ne):
+            diff = self._toint() ^ self._operand(other)
+            counts = self._popcounts(diff.to_bytes(len(self._bytes), "little"))
+            if func is operator.eq:
+                return [not n for n in counts]
+            return [bool(n) for n in counts]
+        if isinstance(other, BitVectorArray):
+            self._operand(other)
+            return [func(a, b) for a, b in zip(self.tolist(), other.tolist())]
+        value = int(getattr(other, "value", other))
+        return [func(a, value) for a in self.tolist()]
+
+    def __eq__(self, other) -> List[bool]:  # type: ignore[override]
+        """Compares every row with other.
+
+        :param other: Union[BitVectorArray, BitVector, int]
+        :return: List[bool]
+        """
+        return self.__compare(other, operator.eq)
+
+    def __ne__(self, other) -> List[bool]:  # type: ignore[override]
+        """Compares every row with other.
+
+        :param other: Union[BitVectorArray, BitVector, int]
+        :return: List[bool]
+        """
+        return self.__compare(other, operator.ne)
+
+    def __lt__(self, other) -> List[bool]:
+        """Compares every row with other.
+
+        :param other: Union[BitVectorArray, BitVector, int]
+        :return: List[bool]
+        """
+        return self.__compare(other, operator.lt)
+
+    def __le__(self, other) -> List[bool]:
+        """Compares every row with other.
+
+        :param other: Union[BitVectorArray, BitVector, int]
+        :return: List[bool]
+        """
+        return self.__compare(other, operator.le)
+
+    def __gt__(self, other) -> List[bool]:
+        """Compares every row with other.
+
+        :param other: Union[BitVectorArray, BitVector, int]
+        :return: List[bool]
+        """
+        return self.__compare(other, operator.gt)
+
+    def __ge__(self, other) -> List[bool]:
+        """Compares every row with other.
+
+        :param other: Union[BitVectorArray, BitVector, int]
+        :return: List[bool]
+        """
+        return self.__compare(other, operator.ge)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def _field(self, field) -> Tuple[int, int]:
+        """Returns (low, width) for a field given as a BitField name of
+        the array's vector type, a BitField or a slice."""
+
+        if isinstance(field, str):
+            field = getattr(self._vector_type, field)
+
+        start, stop, step = getattr(field, "field", field).indices(self._meta.size)
+
+        if step != 1:
+            raise ValueError("Field columns must be contiguous")
+
+        return start, max(0, stop - start)
+
+    def column(self, field, numpy: bool = False):
+        """Returns the value of `field` for every row.
+
+        The field is a BitField name of the array's vector type, a
+        BitField or a contiguous slice. Fields up to 64 bits wide are
+        returned as an `array('Q')`, or a NumPy uint64 array if `numpy`
+        is True, wider fields as a list of ints. No per-row objects are
+        created.
+
+        :param field: Union[str, BitField, slice]
+        :param numpy: bool
+        :return: Union[array, numpy.ndarray, List[int]]
+
+        Raises:
+        - ValueError if numpy is True and the field is wider than 64 bits
+        """
+        low, width = self._field(field)
+        data = self._toint() >> low & self._repeat((1 << width) - 1)
+
+        if width > 64:
+            if numpy:
+                raise ValueError("NumPy columns are limited to 64 bits")
+            raw = data.to_bytes(len(self._bytes), "little")
+            stride = self._stride
+            return [
+                int.from_bytes(raw[n : n + stride], "little")
+                for n in range(0, len(raw), stride)
+            ]
+
+        words = array("Q")
+        words.frombytes(data.to_bytes(len(self._bytes), "little"))
+
+        if sys.byteorder == "big":
+            words.byteswap()
+
+        words = words[:: self._stride // 8]
+
+        if numpy:
+            from ._numpy import uint64_column
+
+            return uint64_column(words)
+
+        return words
+
+    def set_column(self, field, values: Iterable[int]) -> None:
+        """Assigns one value of `field` to every row.
+
+        The field is a BitField name of the array's vector type, a
+        BitField or a contiguous slice. `values` is an iterable of ints
+        (an `array('Q')`, a NumPy array, a list, ...) with one value per
+        row; bits of a value beyond the field width are ignored.
+
+        :param field: Union[str, BitField, slice]
+        :param values: Iterable[int]
+
+        Raises:
+        - ValueError if the number of values differs from the number of rows
+        """
+        low, width = self._field(field)
+        mask = (1 << width) - 1
+        step = self._stride // 8
+
+        if width <= 64:
+            if not isinstance(values, array) or values.typecode != "Q":
+                values = array("Q", (int(v) & mask for v in values))
+            if len(values) != self._count:
+                raise ValueError(f"Expected {self._count} values, got {len(values)}")
+            lanes = array("Q", bytes(len(self._bytes)))
+            lanes[::step] = values
+            if sys.byteorder == "big":
+                lanes.byteswap()
+            data = lanes.tobytes()
+        else:
+            data = b"".join((int(v) & mask).to_bytes(self._stride, "little") for v in values)
+            if len(data) != len(self._bytes):
+                raise ValueError(f"Expected {self._count} values, got {len(data) // self._stride}")
+
+        field_mask = self._repeat(mask << low)
+        value = self._toint() & ~field_mask | (int.from_bytes(data, "little") << low) & field_mask
+        self._bytes[:] = value.to_bytes(len(self._bytes), "little")
+
+    def popcount(self) -> List[int]:
+        """Returns the number of set bits in every row.
+
+        :return: List[int]
+        """
+        return self._popcounts(self._bytes.tobytes())
@@ -0,0 +1,157 @@
+"""Compiled encoders and decoders for BitField layouts.
+
+A BitVector subclass declaring BitField attributes describes a record
+layout. When the subclass is created its fields are compiled into a
+RecordCodec holding the shift and mask of every field, which decodes
+all fields of a value or assigns several fields in a single pass:
+
+```python
+> class IOTDeviceCommand(BitVector):
+>     power = BitField(0, 1)
+>     speed = BitField(2, 4)
+>     red   = BitField(8, 8)
+>
+> cmd = IOTDeviceCommand(size=32)
+> cmd.pack(power=1, speed=5, red=0xaa)
+IOTDeviceCommand(value=0x0000aa15, size=32)
+> cmd.unpack()
+{'power': 1, 'speed': 5, 'red': 170}
+```
+
+By default the codec generates a specialized function for each
+operation with the shifts and masks inlined as constants. Pass
+`codegen=False` in the class statement to use the generic
+implementation instead:
+
+```python
+> class Plain(BitVector, codegen=False):
+>     ...
+```
+"""
+
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+
+_MISSING = object()
+
+
+class RecordCodec:
+    """Decodes and encodes the named fields of an integer value.
+
+    Fields are (name, low, width, writable) tuples; `pack` only
+    accepts writable fields. `extent` is the number of bits spanned by
+    the fields, from bit zero to the end of the highest field.
+    """
+
+    def __init__(self, fields: Iterable[Tuple[str, int, int, bool]] = (), codegen: bool = True):
+        """
+        :param fields: Iterable[Tuple[str, int, int, bool]]
+        :param codegen: bool generate specialized code
+        """
+        self.fields = tuple((name, low, (1 << width) - 1, writable) for name, low, width, writable in fields)
+        self.names = tuple(name for name, _, _, _ in self.fields)
+        self.codegen = codegen
+        self._writable = {name: (low, mask) for name, low, mask, ok in self.fields if ok}
+        self.extent = max((low + mask.bit_length() for _, low, mask, _ in self.fields), default=0)
+
+        if codegen:
+            # generated functions shadow the generic methods
+            self.unpack = self._compile_unpack("tuple")  # type: ignore[method-assign]
+            self.unpack_dict = self._compile_unpack("dict")  # type: ignore[method-assign]
+            self.pack = self._compile_pack()  # type: ignore[method-assign]
+
+    @classmethod
+    def from_class(cls, owner: type, codegen: bool = True) -> "RecordCodec":
+        """Returns a RecordCodec for the BitFields declared by `owner`
+        and its base classes, in declaration order.
+
+        :param owner: type
+        :param codegen: bool
+        :return: RecordCodec
+        """
+        from .bitfield import BitField, ReadOnlyBitField
+
+        fields: Dict[str, Any] = {}
+
+        for klass in reversed(owner.__mro__):
+            for name, attr in vars(klass).items():
+                if isinstance(attr, ReadOnlyBitField):
+                    fields.pop(name, None)
+                    fields[name] = attr
+                elif name in fields:
+                    del fields[name]
+
+        return cls(
+            (
+                (name, attr.field.start, attr.field.stop - attr.field.start, isinstance(attr, BitField))
+                for name, attr in fields.items()
+            ),
+            codegen=codegen,
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(self.names)})"
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def unpack(self, value: int) -> tuple:
+        """Returns the value of every field as a tuple in field order.
+
+        :param value: int
+        :return: tuple
+        """
+        return tuple((value >> low) & mask for _, low, mask, _ in self.fields)
+
+    def unpack_dict(self, value: int) -> Dict[str, int]:
+        """Returns a dictionary mapping field names to their values.
+
+        :param value: int
+        :return: Dict[str, int]
+        """
+        return {name: (value >> low) & mask for name, low, mask, _ in self.fields}
+
+    def pack(self, value: int, **fields: int) -> int:
+        """Returns `value` with the named fields replaced.
+
+        :param value: int
+        :return: int
+
+        Raises:
+        - TypeError for unknown or read-only fields
+        """
+        for name, bits in fields.items():
+            try:
+                low, mask = self._writable[name]
+            except KeyError:
+                raise TypeError(f"pack() got an unexpected keyword argument '{name}'") from None
+            value = (value & ~(mask << low)) | ((bits & mask) << low)
+
+        return value
+
+    def _compile(self, name: str, source: str) -> Callable:
+        namespace: Dict[str, Any] = {"_MISSING": _MISSING}
+        exec(compile(source, f"<{self.__class__.__name__} {name}>", "exec"), namespace)
+        return namespace[name]
+
+    def _compile_unpack(self, kind: str) -> Callable:
+        terms = [f"(value >> {low}) & {mask:#x}" for _, low, mask, _ in self.fields]
+
+        if kind == "dict":
+            items = ", ".join(f"{name!r}: {term}" for name, term in zip(self.names, terms))
+            return self._compile("unpack_dict", f"def unpack_dict(value):\n    return {{{items}}}\n")
+
+        items = "".join(f"{term}, " for term in terms)
+        return self._compile("unpack", f"def unpack(value):\n    return ({items})\n")
+
+    def _compile_pack(self) -> Callable:
+        params = "".join(f", {name}=_MISSING" for name in self._writable)
+        lines = [f"def pack(value{', *' if params else ''}{params}):"]
+
+        for name, (low, mask) in self._writable.items():
+            lines.append(f"    if {name} is not _MISSING:")
+            lines.append(f"        value = (value & {~(mask << low):#x}) | (({name} & {mask:#x}) << {low})")
+
+        lines.append("    return value")
+
+        return self._compile("pack", "\n".join(lines) + "\n")
@@ -0,0 +1,392 @@
+"""Word-aligned run-length compressed bitmaps (EWAH).
+
+An EWAHBitmap keeps a vector as a stream of 64-bit words. Each marker
+word describes a run of clean words, all zeros or all ones, followed
+by a number of literal words copied verbatim after the marker:
+
+    bit 0       value of the clean words
+    bits 1-32   number of clean words
+    bits 33-63  number of literal words that follow
+
+Long, clustered bitmaps compress to a handful of markers, and the
+bitwise operators and `count` walk two streams marker by marker, so
+runs of clean words are combined without being expanded. Random bits
+leave few clean words and are better kept in a dense BitVector:
+
+```python
+> from bitvector import BitVector
+> from bitvector import EWAHBitmap
+>
+> a = EWAHBitmap.from_bitvector(BitVector(((1 << 5000) - 1) << 10000, size=1 << 20))
+> b = EWAHBitmap(((1 << 20000) - 1), size=1 << 20)
+> (a & b).count()
+5000
+> a.nbytes
+40
+```
+"""
+
+import operator
+import re
+import sys
+
+from array import array
+from typing import Callable, Iterator, Tuple
+
+from .bitvector import BitVector
+from ._rank import popcount
+
+
+RUN_MAX = (1 << 32) - 1
+LITERAL_MAX = (1 << 31) - 1
+
+_NONZERO = bytes([0]) + bytes([1]) * 255
+_NONFULL = bytes([1]) * 255 + bytes([0])
+# runs of two or more clean words, or literal words along with lone
+# clean words, which cost a word either way
+_RUNS = re.compile(rb"(\x01{2,})|(\x02{2,})|(?:\x03|\x01(?!\x01)|\x02(?!\x02))+")
+
+
+def _words(data: bytes) -> array:
+    words = array("Q")
+    words.frombytes(data)
+    if sys.byteorder == "big":  # pragma: no cover
+        words.byteswap()
+    return words
+
+
+def _bytes(words: array) -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover
+        words = array("Q", words)
+        words.byteswap()
+    return words.tobytes()
+
+
+def _fold(flags: int) -> int:
+    """ORs the eight bytes of every word into its low byte."""
+    flags |= flags >> 8
+    flags |= flags >> 16
+    flags |= flags >> 32
+    return flags
+
+
+def _classes(data: bytes) -> bytes:
+    """Returns one byte per 64-bit word of `data`: 1 if the word is all
+    ones, 2 if it is all zeros and 3 otherwise.
+    """
+    nonzero = _fold(int.from_bytes(data.translate(_NONZERO), "little"))
+    nonfull = _fold(int.from_bytes(data.translate(_NONFULL), "little"))
+    return (nonzero + (nonfull << 1)).to_bytes(len(data), "little")[::8]
+
+
+class _Builder:
+    """Appends clean runs and literal words to an EWAH stream.
+
+    Words added with `add_bytes` are buffered and searched for clean
+    runs together, when a clean run is added or the stream finished.
+    """
+
+    __slots__ = ("words", "marker", "pending")
+
+    def __init__(self):
+        self.words = array("Q")
+        self.marker = -1
+        self.pending = []
+
+    def add_clean(self, bit: int, count: int) -> None:
+        if self.pending:
+            self.flush()
+
+        words = self.words
+
+        if self.marker >= 0:
+            marker = words[self.marker]
+            if not marker >> 33 and marker & 0x1 == bit:
+                take = min(RUN_MAX - (marker >> 1), count)
+                words[self.marker] = marker + (take << 1)
+                count -= take
+
+        while count:
+            take = min(RUN_MAX, count)
+            self.marker = len(words)
+            words.append(bit | (take << 1))
+            count -= take
+
+    def add_literals(self, literals: array) -> None:
+        if self.pending:
+            self.flush()
+
+        words = self.words
+        done = 0
+
+        while done < len(literals):
+            if self.marker < 0 or words[self.marker] >> 33 == LITERAL_MAX:
+                self.marker = len(words)
+                words.append(0)
+            marker = words[self.marker]
+            take = min(LITERAL_MAX - (marker >> 33), len(literals) - done)
+            words[self.marker] = marker + (take << 33)
+            words.extend(literals[done : done + take])
+            done += take
+
+    def add_bytes(self, data: bytes) -> None:
+        """Appends the little-endian words of `data`."""
+        self.pending.append(data)
+
+    def flush(self) -> None:
+        data = b"".join(self.pending)
+        self.pending.clear()
+        classes = _classes(data)
+        literals = None
+
+        for match in _RUNS.finditer(classes):
+            kind = match.lastindex
+            if kind is None:
+                if literals is None:
+                    literals = _words(data)
+                self.add_literals(literals[match.start() : match.end()])
+            else:
+                self.add_clean(kind & 0x1, match.end() - match.start())
+
+    def finish(self) -> array:
+        """Returns the stream."""
+        if self.pending:
+            self.flush()
+        return self.words
+
+
+class _Cursor:
+    """Reads an EWAH stream as segments of clean and literal words."""
+
+    __slots__ = ("words", "position", "bit", "clean", "lo", "hi")
+
+    def __init__(self, words: array):
+        self.words = words
+        self.position = 0
+        self.bit = self.clean = self.lo = self.hi = 0
+
+    def fill(self) -> bool:
+        """Loads the next marker once the current one is consumed and
+        returns False at the end of the stream.
+        """
+        words = self.words
+        while not self.clean and self.lo == self.hi:
+            if self.position >= len(words):
+                return False
+            marker = words[self.position]
+            self.bit = marker & 0x1
+            self.clean = (marker >> 1) & RUN_MAX
+            self.lo = self.position + 1
+            self.hi = self.position = self.lo + (marker >> 33)
+        return True
+
+    def literal(self, count: int) -> int:
+        """Consumes `count` literal words and returns them as an int."""
+        lo = self.lo
+        self.lo = lo + count
+        return int.from_bytes(_bytes(self.words[lo : lo + count]), "little")
+
+
+def _markers(words: array) -> Iterator[Tuple[int, int, int, int]]:
+    """Yields (bit, clean, lo, hi) for every marker of an EWAH stream."""
+    position = 0
+    while position < len(words):
+        marker = words[position]
+        lo = position + 1
+        position = lo + (marker >> 33)
+        yield marker & 0x1, (marker >> 1) & RUN_MAX, lo, position
+
+
+def _combine(func: Callable, a: array, b: array) -> array:
+    """Returns the EWAH stream of `func` applied to two streams covering
+    the same number of words.
+    """
+    x, y = _Cursor(a), _Cursor(b)
+    out = _Builder()
+
+    while x.fill() and y.fill():
+        if x.clean and y.clean:
+            count = min(x.clean, y.clean)
+            out.add_clean(func(x.bit, y.bit) & 0x1, count)
+            x.clean -= count
+            y.clean -= count
+            continue
+
+        if x.clean or y.clean:
+            run, lit = (x, y) if x.clean else (y, x)
+            count = min(run.clean, lit.hi - lit.lo)
+            run.clean -= count
+            result = func(run.bit, 1 - run.bit) & 0x1
+            if func(run.bit, run.bit) & 0x1 == result:
+                # the run decides the result, e.g. AND with zeros
+                lit.lo += count
+                out.add_clean(result, count)
+                continue
+            bits = lit.literal(count)
+            if func(run.bit, 0) & 0x1:
+                bits ^= (1 << (count * 64)) - 1
+            out.add_bytes(bits.to_bytes(count * 8, "little"))
+            continue
+
+        count = min(x.hi - x.lo, y.hi - y.lo)
+        bits = func(x.literal(count), y.literal(count))
+        out.add_bytes(bits.to_bytes(count * 8, "little"))
+
+    return out.finish()
+
+
+class EWAHBitmap:
+    """An EWAH compressed vector of `size` bits, see `bitvector.ewah`.
+
+    The bitwise operators `&`, `|`, `^` and `~`, `count` and equality
+    work on the compressed words. Operands may be EWAHBitmaps or
+    BitVectors of the same size, on either side, and the result is an
+    EWAHBitmap.
+    """
+
+    __slots__ = ("_size", "_words")
+
+    # BitVector operators return NotImplemented, so ours are called
+    _reflects_bitvectors = True
+
+    def __init__(self, value: int = 0, size: int = 128):
+        """Initialize an EWAHBitmap by compressing an integer value.
+
+        :param value: int
+        :param size: int
+
+        Raises:
+        - ValueError if size <= 0
+        """
+        if size <= 0:
+            raise ValueError("Size must greater than zero.")
+
+        nwords = (size + 63) // 64
+        value = int(value) & ((1 << size) - 1)
+        builder = _Builder()
+        builder.add_bytes(value.to_bytes(nwords * 8, "little"))
+
+        self._size = size
+        self._words = builder.finish()
+
+    @classmethod
+    def from_bitvector(cls, bv: BitVector) -> "EWAHBitmap":
+        """Create an EWAHBitmap by compressing a BitVector.
+
+        :param bv: BitVector
+        :return: EWAHBitmap
+        """
+        return cls(bv.value, size=len(bv))
+
+    @classmethod
+    def _from_words(cls, words: array, size: int) -> "EWAHBitmap":
+        ewah = cls.__new__(cls)
+        ewah._size = size
+        ewah._words = words
+        return ewah
+
+    def to_bitvector(self, backend: str = "int") -> BitVector:
+        """Returns the decompressed BitVector.
+
+        :param backend: str
+        :return: BitVector
+        """
+        return BitVector(self.value, size=self._size, backend=backend)
+
+    @property
+    def value(self) -> int:
+        """The decompressed integer value."""
+        chunks = []
+        for bit, clean, lo, hi in _markers(self._words):
+            chunks.append((b"\xff" if bit else b"\x00") * (clean * 8))
+            chunks.append(_bytes(self._words[lo:hi]))
+        return int.from_bytes(b"".join(chunks), "little")
+
+    @property
+    def size(self) -> int:
+        """Size of the vector in bits."""
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the compressed words in bytes."""
+        return len(self._words) * 8
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self._words)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(nbytes={self.nbytes}, size={self._size})"
+
+    def count(self) -> int:
+        """Returns the number of bits set to one."""
+        ones = 0
+        for bit, clean, lo, hi in _markers(self._words):
+            if bit:
+                ones += clean * 64
+            if hi > lo:
+                ones += popcount(int.from_bytes(_bytes(self._words[lo:hi]), "little"))
+        return ones
+
+    def __bool__(self) -> bool:
+        words = self._words
+        return any(bit and clean or any(words[lo:hi]) for bit, clean, lo, hi in _markers(words))
+
+    def __operand(self, other) -> array:
+        if isinstance(other, BitVector):
+            other = EWAHBitmap.from_bitvector(other)
+        elif not isinstance(other, EWAHBitmap):
+            return NotImplemented
+        if other._size != self._size:
+            raise ValueError(f"Size mismatch: {self._size} and {other._size}")
+        return other._words
+
+    def __binary_op(self, other, func: Callable) -> "EWAHBitmap":
+        words = self.__operand(other)
+        if words is NotImplemented:
+            return NotImplemented
+        return self._from_words(_combine(func, self._words, words), self._size)
+
+    def __and__(self, other) -> "EWAHBitmap":
+        return self.__binary_op(other, operator.and_)
+
+    def __or__(self, other) -> "EWAHBitmap":
+        return self.__binary_op(other, operator.or_)
+
+    def __xor__(self, other) -> "EWAHBitmap":
+        return self.__binary_op(other, operator.xor)
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def __invert__(self) -> "EWAHBitmap":
+        out = _Builder()
+        words = self._words
+
+        for bit, clean, lo, hi in _markers(words):
+            out.add_clean(1 - bit, clean)
+            if hi > lo:
+                bits = int.from_bytes(_bytes(words[lo:hi]), "little") ^ ((1 << ((hi - lo) * 64)) - 1)
+                out.add_bytes(bits.to_bytes((hi - lo) * 8, "little"))
+
+        inverted = out.finish()
+        tail = self._size & 0x3F
+
+        if tail:
+            mask = _Builder()
+            mask.add_clean(1, (self._size >> 6))
+            mask.add_literals(array("Q", [(1 << tail) - 1]))
+            inverted = _combine(operator.and_, inverted, mask.finish())
+
+        return self._from_words(inverted, self._size)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (EWAHBitmap, BitVector)):
+            return NotImplemented
+        if len(other) != self._size:
+            return False
+        return not self ^ other
@@ -0,0 +1,218 @@
+"""Immutable, hashable BitVectors.
+
+BitVector compares by value but is mutable, so it cannot be a dict key
+or a set member. A FrozenBitVector has the read-only API of BitVector,
+indexing, slicing, searches, conversions and operators, which return
+new FrozenBitVectors, and a hash computed on first use and cached:
+
+```python
+> from bitvector import BitVector, FrozenBitVector
+>
+> seen = {FrozenBitVector(0b1011, size=8)}
+> bv = BitVector(0b1011, size=8)
+> bv.freeze() in seen
+True
+> bv.freeze().thaw()[7] = 1
+```
+
+Like every BitVector it compares equal to vectors and ints of the same
+value whatever their size, and hashes like its integer value.
+
+Methods that would modify the vector raise TypeError, and augmented
+assignments such as `a |= b` bind a new FrozenBitVector to the name,
+as they do for tuples. BitFields declared on a subclass can be read,
+assigning them raises TypeError; ReadOnlyBitField states the intent.
+Buffer backends keep the bits in a read-only buffer.
+"""
+
+import functools
+
+from typing import Optional, Type
+
+from .bitvector import BitVector
+
+
+class FrozenBitVector(BitVector):
+    """An immutable, hashable BitVector, see `bitvector.frozen`."""
+
+    __slots__ = ("_hash",)
+
+    _hash: int
+
+    def __init__(self, value: int = 0, size: int = 128, backend: str = "int"):
+        """Initialize a FrozenBitVector with integer value and size in
+        bits.
+
+        :param value: int
+        :param size: int
+        :param backend: str
+
+        Raises:
+        - ValueError if size <= 0
+        - ValueError if backend is unknown
+        """
+        super().__init__(value, size, backend)
+        self._seal()
+
+    @classmethod
+    def ones(cls, size: int = 128) -> "FrozenBitVector":
+        """Create a FrozenBitVector initialized with ones.
+
+        :param size: int
+        """
+        return cls(-1, size=size)
+
+    def _seal(self) -> None:
+        store = self._value
+        if isinstance(store, memoryview) and not store.readonly:
+            self._value = store.toreadonly()
+
+    @classmethod
+    def _copy(cls, bv: BitVector) -> "FrozenBitVector":
+        frozen = super()._copy(bv)
+        frozen._seal()
+        return frozen
+
+    @classmethod
+    def from_buffer(cls, obj, byteorder: str = "big", bit_order: str = "lsb") -> "FrozenBitVector":
+        """Create a FrozenBitVector from the bytes of `obj`, see
+        `BitVector.from_buffer`. A buffer whose memory belongs to a bytes
+        object is wrapped without copying; any other buffer is copied,
+        including read-only views of memory that can still change.
+
+        :param obj: buffer
+        :param byteorder: str
+        :param bit_order: str
+        :return: FrozenBitVector
+
+        Raises:
+        - ValueError if the buffer is empty or the layout is unknown
+        - TypeError if obj does not support the buffer protocol
+        """
+        view = memoryview(obj)
+        if not isinstance(view.obj, bytes):
+            view = memoryview(view.tobytes())
+        return super().from_buffer(view, byteorder, bit_order)
+
+    def __setstate__(self, state: tuple) -> None:
+        super().__setstate__(state)
+        self._seal()
+
+    def to_buffer(self, byteorder: Optional[str] = None, bit_order: Optional[str] = None) -> memoryview:
+        """Returns a read-only memoryview of this vector's bytes, see
+        `BitVector.to_buffer`.
+
+        :param byteorder: Optional[str] "little" or "big"
+        :param bit_order: Optional[str] "lsb" or "msb"
+        :return: memoryview
+
+        Raises:
+        - ValueError if the layout is unknown
+        """
+        return super().to_buffer(byteorder, bit_order).toreadonly()
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        self._hash = hash(self.value)
+        return self._hash
+
+    def __copy__(self) -> "FrozenBitVector":
+        return self
+
+    def __deepcopy__(self, memo) -> "FrozenBitVector":
+        return self
+
+    def freeze(self, cls: Optional[Type["FrozenBitVector"]] = None) -> "FrozenBitVector":
+        """Returns self, or a copy if `cls` is another class.
+
+        :param cls: Optional[Type[FrozenBitVector]]
+        :return: FrozenBitVector
+        """
+        if cls is None or cls is self.__class__:
+            return self
+        return cls._copy(self)
+
+    def thaw(self, cls: Type[BitVector] = BitVector) -> BitVector:
+        """Returns a mutable copy of this vector. A vector kept in an int
+        shares it with the copy; a buffer is copied.
+
+        :param cls: Type[BitVector] BitVector subclass to create
+        :return: BitVector
+        """
+        return cls._copy(self)
+
+    @property
+    def value(self) -> int:
+        """The integer value of this BitVector."""
+        return self._meta.backend.to_int(self._value)
+
+    @value.setter
+    def value(self, new_value: int) -> None:
+        raise TypeError(f"{self.__class__.__name__} is immutable")
+
+
+def _immutable(name: str):
+    method = getattr(BitVector, name)
+
+    @functools.wraps(method)
+    def immutable(self, *args, **kwargs):
+        raise TypeError(f"{self.__class__.__name__} is immutable")
+
+    return immutable
+
+
+def _not_wrapped(name: str):
+    method = getattr(BitVector, name).__func__
+
+    @functools.wraps(method)
+    def not_wrapped(cls, *args, **kwargs):
+        raise TypeError(f"{cls.__name__} cannot wrap a buffer in place, freeze a BitVector instead")
+
+    return classmethod(not_wrapped)
+
+
+def _rebinding(name: str):
+    method = getattr(BitVector, name)
+
+    @functools.wraps(method)
+    def rebinding(self, other):
+        # falls back to the binary operator, which returns a new vector
+        return NotImplemented
+
+    return rebinding
+
+
+for _name in [
+    "__setitem__",
+    "clear",
+    "set",
+    "_setb",
+    "_clrb",
+    "_setval",
+    "toggle",
+    "pack",
+    "allocate",
+    "free",
+    "repoint",
+]:
+    setattr(FrozenBitVector, _name, _immutable(_name))
+
+for _name in ["overlay", "iter_overlay", "open"]:
+    setattr(FrozenBitVector, _name, _not_wrapped(_name))
+
+for _name in [
+    "__iadd__",
+    "__isub__",
+    "__imul__",
+    "__itruediv__",
+    "__ifloordiv__",
+    "__iand__",
+    "__ior__",
+    "__ixor__",
+    "__ilshift__",
+    "__irshift__",
+]:
+    setattr(FrozenBitVector, _name, _rebinding(_name))
@@ -0,0 +1,275 @@
+"""Opt-in counters and timers for BitVector hot paths.
+
+While instrumentation is enabled, every call through the binary,
+in-place and unary operators, indexing and BitField access is counted
+and timed per operation, BitVector subclass and vector size:
+
+```python
+> from bitvector import instrument
+>
+> with instrument.instrumented():
+>     handle(request)
+> instrument.snapshot()
+{'and/Flags/128': {'calls': 3, 'seconds': 2.1e-06},
+ 'getitem-int/Flags/128': {'calls': 41, 'seconds': 9.8e-06}, ...}
+```
+
+Instrumentation is also enabled when the package is imported with the
+environment variable BITVECTOR_INSTRUMENT set to a non-empty value
+other than "0". Enabling it swaps timing wrappers into BitVector,
+ReadOnlyBitField and BitField, and disabling it puts the original
+methods back, so when disabled it costs nothing.
+
+Operations are named like the `bitvector.bench` families: "and",
+"iand", "invert", "getitem-int", "getitem-slice", "setitem-int",
+"setitem-slice", "bitfield-get" and "bitfield-set". A BitField access
+is also counted as the slice access it makes, and subclasses that
+override indexing are counted only where they call BitVector's.
+"""
+
+import contextlib
+import functools
+import os
+import threading
+import weakref
+
+from time import perf_counter
+from typing import Dict, Iterator, Tuple
+
+from .bitvector import BitVector
+from .bitfield import BitField, ReadOnlyBitField
+
+
+#: Environment variable enabling instrumentation at import.
+ENV_VAR = "BITVECTOR_INSTRUMENT"
+
+_lock = threading.Lock()
+_local = threading.local()
+# one table per live thread, so recording a call takes no lock, and the
+# totals of the threads that have exited
+_tables: Dict[int, dict] = {}
+_retired: dict = {}
+_originals: Dict[Tuple[type, str], object] = {}
+
+
+class _Owner:
+    """Held only by a thread's `_local`, so it is released, and the
+    thread's table retired, when the thread exits.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+def _new_table() -> dict:
+    table = _local.table = {}
+    _local.owner = owner = _Owner()
+    with _lock:
+        _tables[id(table)] = table
+    weakref.finalize(owner, _retire, table)
+    return table
+
+
+def _retire(table: dict) -> None:
+    with _lock:
+        del _tables[id(table)]
+        _merge(_retired, table)
+
+
+def _merge(into: dict, table: dict) -> None:
+    for key, (calls, seconds) in list(table.items()):
+        entry = into.get(key)
+        if entry is None:
+            into[key] = [calls, seconds]
+        else:
+            entry[0] += calls
+            entry[1] += seconds
+
+
+def _record(operation: str, cls: type, size: int, seconds: float) -> None:
+    try:
+        table = _local.table
+    except AttributeError:
+        table = _new_table()
+    key = (operation, cls, size)
+    entry = table.get(key)
+    if entry is None:
+        table[key] = [1, seconds]
+    else:
+        entry[0] += 1
+        entry[1] += seconds
+
+
+def _op_name(func) -> str:
+    return func.__name__.rstrip("_")
+
+
+def _wrap_binary(method):
+    @functools.wraps(method)
+    def wrapper(self, other, func, *args, **kwargs):
+        start = perf_counter()
+        try:
+            return method(self, other, func, *args, **kwargs)
+        finally:
+            _record(_op_name(func), type(self), self._meta.size, perf_counter() - start)
+
+    return wrapper
+
+
+def _wrap_inplace(method):
+    @functools.wraps(method)
+    def wrapper(self, other, func):
+        start = perf_counter()
+        try:
+            return method(self, other, func)
+        finally:
+            _record("i" + _op_name(func), type(self), self._meta.size, perf_counter() - start)
+
+    return wrapper
+
+
+def _wrap_unary(method):
+    @functools.wraps(method)
+    def wrapper(self, func, *args, **kwargs):
+        start = perf_counter()
+        try:
+            return method(self, func, *args, **kwargs)
+        finally:
+            _record(_op_name(func), type(self), self._meta.size, perf_counter() - start)
+
+    return wrapper
+
+
+def _wrap_item(name: str, method):
+    int_name, slice_name = f"{name}-int", f"{name}-slice"
+
+    @functools.wraps(method)
+    def wrapper(self, key, *args):
+        start = perf_counter()
+        try:
+            return method(self, key, *args)
+        finally:
+            operation = int_name if isinstance(key, int) else slice_name
+            _record(operation, type(self), self._meta.size, perf_counter() - start)
+
+    return wrapper
+
+
+def _wrap_get(method):
+    @functools.wraps(method)
+    def wrapper(self, obj, type=None):
+        if obj is None:
+            return method(self, obj, type)
+        start = perf_counter()
+        try:
+            return method(self, obj, type)
+        finally:
+            _record("bitfield-get", obj.__class__, obj._meta.size, perf_counter() - start)
+
+    return wrapper
+
+
+def _wrap_set(method):
+    @functools.wraps(method)
+    def wrapper(self, obj, value):
+        start = perf_counter()
+        try:
+            return method(self, obj, value)
+        finally:
+            _record("bitfield-set", obj.__class__, obj._meta.size, perf_counter() - start)
+
+    return wrapper
+
+
+_TARGETS = (
+    (BitVector, "_BitVector__binary_op", _wrap_binary),
+    (BitVector, "_BitVector__inplace_op", _wrap_inplace),
+    (BitVector, "_BitVector__unary_op", _wrap_unary),
+    (BitVector, "__getitem__", functools.partial(_wrap_item, "getitem")),
+    (BitVector, "__setitem__", functools.partial(_wrap_item, "setitem")),
+    (ReadOnlyBitField, "__get__", _wrap_get),
+    (BitField, "__set__", _wrap_set),
+)
+
+
+def enabled() -> bool:
+    """True if instrumentation is enabled."""
+    return bool(_originals)
+
+
+def enable() -> None:
+    """Start counting and timing BitVector operations. Enabling twice
+    has no further effect.
+    """
+    with _lock:
+        if _originals:
+            return
+        for owner, name, wrap in _TARGETS:
+            method = owner.__dict__[name]
+            _originals[(owner, name)] = method
+            setattr(owner, name, wrap(method))
+
+
+def disable() -> None:
+    """Stop counting and timing, restoring the original methods. The
+    statistics gathered are kept until `reset`.
+    """
+    with _lock:
+        for (owner, name), method in _originals.items():
+            setattr(owner, name, method)
+        _originals.clear()
+
+
+def reset() -> None:
+    """Discard the statistics gathered."""
+    with _lock:
+        _retired.clear()
+        for table in _tables.values():
+            table.clear()
+
+
+def snapshot(reset: bool = False) -> Dict[str, Dict[str, float]]:
+    """Returns the calls made and seconds spent in each operation, keyed
+    "operation/class/size", as a dict of plain values ready to export
+    to a metrics system.
+
+    :param reset: bool discard the statistics after taking them
+    :return: Dict[str, Dict[str, float]]
+    """
+    merged: dict = {}
+
+    with _lock:
+        for table in [_retired, *_tables.values()]:
+            _merge(merged, table)
+            if reset:
+                table.clear()
+
+    totals: Dict[str, Dict[str, float]] = {}
+    for (operation, cls, size), (calls, seconds) in merged.items():
+        entry = totals.setdefault(f"{operation}/{cls.__name__}/{size}", {"calls": 0, "seconds": 0.0})
+        entry["calls"] += calls
+        entry["seconds"] += seconds
+
+    return dict(sorted(totals.items()))
+
+
+@contextlib.contextmanager
+def instrumented(clear: bool = True) -> Iterator[None]:
+    """Context manager enabling instrumentation for its body, then
+    restoring the previous state.
+
+    :param clear: bool discard earlier statistics on entry
+    """
+    was_enabled = enabled()
+    if clear:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def _enable_from_environment() -> None:
+    if os.environ.get(ENV_VAR, "0") not in ("", "0"):
+        enable()
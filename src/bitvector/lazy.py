@@ -0,0 +1,381 @@
+"""Lazy bitwise expressions over wide BitVectors.
+
+Every operator applied to BitVectors creates a new BitVector for its
+result, so `(a & b) | (c & ~d) ^ e` allocates four full-width
+intermediates. Wrapping an operand with `lazy` makes the operators
+build an expression instead, evaluated once, when `evaluate` is called
+or the result is first used:
+
+```python
+> from bitvector.lazy import lazy
+>
+> expr = (lazy(a) & b) | (lazy(c) & ~d) ^ e
+> expr.count()                        # evaluates once
+> expr.evaluate(out=scratch)          # or into an existing vector
+```
+
+Evaluation is a single pass over the vectors in chunks of CHUNK_BYTES,
+combining the chunk of every operand before moving on to the next, so
+intermediates stay chunk-sized. Vectors kept in little-endian buffers,
+like the "bytes", "words" and "numpy" backends, are read in place and
+the result is written straight into its buffer; other vectors are
+converted once, when first needed. Chains of the same operator are
+flattened, and within a chunk AND stops at the first all-zero result
+and OR at the first all-one result without reading the remaining
+operands. When every vector is kept in an int, the whole expression
+is a single chunk and runs on the ints directly.
+
+Operands must be BitVectors of the same size, or ints. The result is
+created like the result of an operator applied to the first vector in
+the expression. Only `&`, `|`, `^` and `~` are lazy, and the operands
+are read when the expression is evaluated, not when it is built.
+
+The left operand decides: with a BitVector on the left, as in
+`a & lazy(b)`, BitVector's operator runs and evaluates the expression
+on the right at once, so start expressions with a lazy operand. An int
+on the left, as in `0xFF & lazy(b)`, stays lazy.
+"""
+
+import abc
+
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+from .bitvector import BitVector
+
+
+#: Bytes of every operand combined per step of an evaluation.
+CHUNK_BYTES = 1 << 16
+
+Operand = Union["Expr", BitVector, int]
+
+Reader = Callable[[int, int, int], int]
+
+
+class Expr(abc.ABC):
+    """A lazy bitwise expression, see `bitvector.lazy`.
+
+    Attributes and methods other than the operators are those of the
+    evaluated BitVector.
+    """
+
+    __slots__ = ("_result",)
+
+    def __init__(self):
+        self._result = None
+
+    def __and__(self, other: Operand) -> "Expr":
+        return _Op.make("and", self, other)
+
+    def __rand__(self, other: Operand) -> "Expr":
+        return _Op.make("and", other, self)
+
+    def __or__(self, other: Operand) -> "Expr":
+        return _Op.make("or", self, other)
+
+    def __ror__(self, other: Operand) -> "Expr":
+        return _Op.make("or", other, self)
+
+    def __xor__(self, other: Operand) -> "Expr":
+        return _Op.make("xor", self, other)
+
+    def __rxor__(self, other: Operand) -> "Expr":
+        return _Op.make("xor", other, self)
+
+    def __invert__(self) -> "Expr":
+        return _Not(self)
+
+    @abc.abstractmethod
+    def _leaves(self) -> Iterator["_Leaf"]:
+        """Yields the leaves of the expression, left to right."""
+
+    @abc.abstractmethod
+    def _compile(self, ctx: "_Context") -> Reader:
+        """Returns a function reading the bits of the expression between
+        two bytes, see `_Context.reader`.
+        """
+
+    def evaluate(self, out: Optional[BitVector] = None) -> BitVector:
+        """Returns the value of the expression, computed on the first
+        call and kept for later ones. With `out` the value is written
+        into that vector, in place if it is kept in a writable
+        little-endian buffer, and `out` is returned.
+
+        :param out: Optional[BitVector] of the same size as the operands
+        :return: BitVector
+
+        Raises:
+        - ValueError if the vectors differ in size or there are none
+        """
+        if out is None and self._result is not None:
+            return self._result
+
+        vectors = [leaf.operand for leaf in self._leaves() if isinstance(leaf.operand, BitVector)]
+
+        if not vectors:
+            raise ValueError("Expression has no BitVector operands")
+
+        size = len(vectors[0])
+
+        if any(len(bv) != size for bv in vectors) or (out is not None and len(out) != size):
+            raise ValueError("Operands must be the same size")
+
+        ctx = _Context(size, any(_buffer(bv) is not None for bv in vectors))
+        read = self._compile(ctx)
+        result = out if out is not None else vectors[0]._new_like(0, size)
+        target = _buffer(result, writable=True)
+        mask = vectors[0]._meta.mask
+
+        if target is not None:
+            for lo, hi, chunk_mask in ctx.chunks(mask):
+                target[lo:hi] = read(lo, hi, chunk_mask).to_bytes(hi - lo, "little")
+            result._rank = None
+        else:
+            if ctx.chunked:
+                data = bytearray(ctx.nbytes)
+                for lo, hi, chunk_mask in ctx.chunks(mask):
+                    data[lo:hi] = read(lo, hi, chunk_mask).to_bytes(hi - lo, "little")
+                value = int.from_bytes(data, "little")
+            else:
+                value = read(0, ctx.nbytes, mask)
+            if out is not None:
+                out.value = value
+            else:
+                result = vectors[0]._new_like(value, size)
+
+        if out is None:
+            self._result = result
+
+        return result
+
+    def __len__(self) -> int:
+        return len(self.evaluate())
+
+    def __getitem__(self, key):
+        return self.evaluate()[key]
+
+    def __iter__(self):
+        return iter(self.evaluate())
+
+    def __bool__(self) -> bool:
+        return bool(self.evaluate())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Expr):
+            other = other.evaluate()
+        return self.evaluate() == other
+
+    __hash__ = None  # type: ignore
+
+    def __getattr__(self, name: str):
+        # only called for names the expression does not have
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.evaluate(), name)
+
+
+class _Leaf(Expr):
+    __slots__ = ("operand",)
+
+    def __init__(self, operand: Union[BitVector, int]):
+        super().__init__()
+        self.operand = operand
+
+    def __repr__(self) -> str:
+        operand = self.operand
+        if isinstance(operand, BitVector):
+            return f"{operand.__class__.__name__}(size={len(operand)}, backend={operand.backend!r})"
+        return hex(operand)
+
+    def _leaves(self) -> Iterator["_Leaf"]:
+        yield self
+
+    def _compile(self, ctx: "_Context") -> Reader:
+        return ctx.reader(self.operand)
+
+
+class _Op(Expr):
+    __slots__ = ("name", "operands")
+
+    def __init__(self, name: str, operands: List[Expr]):
+        super().__init__()
+        self.name = name
+        self.operands = operands
+
+    @classmethod
+    def make(cls, name: str, left: Operand, right: Operand) -> "_Op":
+        operands = []
+        for operand in (left, right):
+            if not isinstance(operand, (Expr, BitVector, int)):
+                return NotImplemented
+            operand = _wrap(operand)
+            if isinstance(operand, _Op) and operand.name == name:
+                operands.extend(operand.operands)
+            else:
+                operands.append(operand)
+        return cls(name, operands)
+
+    def __repr__(self) -> str:
+        symbol = {"and": " & ", "or": " | ", "xor": " ^ "}[self.name]
+        return f"({symbol.join(map(repr, self.operands))})"
+
+    def _leaves(self) -> Iterator[_Leaf]:
+        for operand in self.operands:
+            yield from operand._leaves()
+
+    def _compile(self, ctx: "_Context") -> Reader:
+        first, *rest = [operand._compile(ctx) for operand in self.operands]
+
+        if self.name == "and":
+
+            def run(lo: int, hi: int, mask: int) -> int:
+                bits = first(lo, hi, mask)
+                for read in rest:
+                    if not bits:
+                        return 0
+                    bits &= read(lo, hi, mask)
+                return bits
+
+        elif self.name == "or":
+
+            def run(lo: int, hi: int, mask: int) -> int:
+                bits = first(lo, hi, mask)
+                for read in rest:
+                    if bits == mask:
+                        return mask
+                    bits |= read(lo, hi, mask)
+                return bits
+
+        else:
+
+            def run(lo: int, hi: int, mask: int) -> int:
+                bits = first(lo, hi, mask)
+                for read in rest:
+                    bits ^= read(lo, hi, mask)
+                return bits
+
+        return run
+
+
+class _Not(Expr):
+    __slots__ = ("operand",)
+
+    def __init__(self, operand: Expr):
+        super().__init__()
+        self.operand = operand
+
+    def __invert__(self) -> Expr:
+        return self.operand
+
+    def __repr__(self) -> str:
+        return f"~{self.operand!r}"
+
+    def _leaves(self) -> Iterator[_Leaf]:
+        return self.operand._leaves()
+
+    def _compile(self, ctx: "_Context") -> Reader:
+        read = self.operand._compile(ctx)
+        return lambda lo, hi, mask: mask ^ read(lo, hi, mask)
+
+
+class _Context:
+    """How one evaluation reads its operands: in chunks of CHUNK_BYTES
+    if any vector is kept in a buffer, otherwise as whole ints.
+    """
+
+    def __init__(self, size: int, chunked: bool):
+        self.size = size
+        self.nbytes = (size + 7) // 8
+        self.chunked = chunked
+        self.readers: Dict[int, Reader] = {}
+
+    def chunks(self, mask: int) -> Iterator[tuple]:
+        """Yields the first and last byte and the mask of each chunk,
+        `mask` being the mask of the whole vector.
+        """
+        size, nbytes = self.size, self.nbytes
+
+        if not self.chunked:
+            yield 0, nbytes, mask
+            return
+
+        full = (1 << (CHUNK_BYTES * 8)) - 1
+        for lo in range(0, nbytes, CHUNK_BYTES):
+            hi = min(lo + CHUNK_BYTES, nbytes)
+            yield lo, hi, full if (lo + CHUNK_BYTES) * 8 <= size else (1 << (size - lo * 8)) - 1
+
+    def reader(self, operand: Union[BitVector, int]) -> Reader:
+        """Returns a function reading the bits of `operand` between bytes
+        `lo` and `hi`, shared by every leaf holding that operand.
+        """
+        try:
+            return self.readers[id(operand)]
+        except KeyError:
+            pass
+
+        data = _buffer(operand) if isinstance(operand, BitVector) else None
+        read: Reader
+
+        if data is not None:
+            from_bytes = int.from_bytes
+
+            def read(lo: int, hi: int, mask: int) -> int:
+                return from_bytes(data[lo:hi], "little")
+
+        elif not self.chunked:
+            value = operand.value if isinstance(operand, BitVector) else operand & ((1 << self.size) - 1)
+
+            def read(lo: int, hi: int, mask: int) -> int:
+                return value
+
+        else:
+            read = self._converting(operand)
+
+        self.readers[id(operand)] = read
+        return read
+
+    def _converting(self, operand: Union[BitVector, int]) -> Reader:
+        # converts the value to bytes the first time a chunk is needed
+        nbytes = self.nbytes
+        size = self.size
+        converted: List[bytes] = []
+
+        def read(lo: int, hi: int, mask: int) -> int:
+            if not converted:
+                value = operand.value if isinstance(operand, BitVector) else operand & ((1 << size) - 1)
+                converted.append(value.to_bytes(nbytes, "little"))
+            return int.from_bytes(converted[0][lo:hi], "little")
+
+        return read
+
+
+def _buffer(bv: BitVector, writable: bool = False) -> Optional[memoryview]:
+    """Returns the store of `bv` if it is a little-endian, lsb first
+    byte buffer, and writable if requested, else None.
+    """
+    store = bv._value
+    backend = bv._meta.backend
+    if not isinstance(store, memoryview) or getattr(backend, "byteorder", None) != "little":
+        return None
+    if getattr(backend, "bit_order", None) != "lsb" or (writable and store.readonly):
+        return None
+    return store
+
+
+def _wrap(operand: Operand) -> Expr:
+    if isinstance(operand, Expr):
+        return operand
+    if isinstance(operand, (BitVector, int)):
+        return _Leaf(operand)
+    raise TypeError(f"Unsupported operand type: {type(operand).__name__}")
+
+
+def lazy(operand: Union[BitVector, int]) -> Expr:
+    """Returns `operand` as a lazy expression, see `bitvector.lazy`.
+
+    :param operand: Union[BitVector, int]
+    :return: Expr
+
+    Raises:
+    - TypeError for other operand types
+    """
+    return _wrap(operand)
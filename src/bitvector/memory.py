@@ -0,0 +1,102 @@
+"""Memory footprint of BitVectors and collections of them.
+
+`sys.getsizeof` reports the bytes a BitVector, BitVectorArray,
+RoaringBitmap or EWAHBitmap retains, including its storage. `footprint`
+totals them for a whole collection and relates the total to the bits
+it holds, for sizing caches by memory:
+
+```python
+> from bitvector.memory import footprint
+>
+> report = footprint(cache)
+> report.total_bytes, report.bytes_per_set_bit, report.overhead
+(1123456, 0.57, 2.44)
+```
+"""
+
+import sys
+
+from collections.abc import Mapping
+from typing import Iterable, NamedTuple, Union
+
+from .bitvector import BitVector
+from .bitvectorarray import BitVectorArray
+from .ewah import EWAHBitmap
+from .roaring import RoaringBitmap
+from ._rank import count_ones
+
+
+_VECTORS = (BitVector, BitVectorArray, RoaringBitmap, EWAHBitmap)
+
+Vectors = Union[BitVector, BitVectorArray, RoaringBitmap, EWAHBitmap]
+
+
+class Footprint(NamedTuple):
+    """Memory used by a collection of bit vectors."""
+
+    #: Number of vectors.
+    vectors: int
+    #: Bits in all the vectors.
+    bits: int
+    #: Bits set to one in all the vectors.
+    ones: int
+    #: Bytes retained by the vectors and the collection holding them.
+    total_bytes: int
+
+    @property
+    def payload_bytes(self) -> int:
+        """Bytes needed to hold the bits packed eight to a byte."""
+        return (self.bits + 7) // 8
+
+    @property
+    def bytes_per_set_bit(self) -> float:
+        """Total bytes per bit set to one, infinite without ones."""
+        return self.total_bytes / self.ones if self.ones else float("inf")
+
+    @property
+    def overhead(self) -> float:
+        """Total bytes per payload byte, 1.0 for no overhead at all."""
+        return self.total_bytes / self.payload_bytes if self.bits else float("inf")
+
+
+def _measure(bv) -> Footprint:
+    if isinstance(bv, BitVectorArray):
+        data = memoryview(bv.words).cast("B")
+        return Footprint(len(bv), len(bv) * bv.size, count_ones(data), sys.getsizeof(bv))
+
+    if isinstance(bv, BitVector):
+        return Footprint(1, len(bv), bv.count(), sys.getsizeof(bv))
+
+    if isinstance(bv, (RoaringBitmap, EWAHBitmap)):
+        return Footprint(1, bv.size, bv.count(), sys.getsizeof(bv))
+
+    raise TypeError(f"Expected a BitVector, BitVectorArray or bitmap, got {type(bv).__name__}")
+
+
+def footprint(vectors: Union[Vectors, Iterable[Vectors], Mapping]) -> Footprint:
+    """Returns the memory footprint of `vectors`: a BitVector, a
+    BitVectorArray, a RoaringBitmap or EWAHBitmap, or an iterable or
+    mapping whose values are any of these. The bytes of a list, dict
+    or other container are included, but not those of mapping keys.
+    An object appearing more than once is counted once.
+
+    :param vectors: Union[Vectors, Iterable[Vectors], Mapping]
+    :return: Footprint
+
+    Raises:
+    - TypeError if an item is not a vector, array or bitmap
+    """
+    if isinstance(vectors, _VECTORS):
+        return _measure(vectors)
+
+    items = vectors.values() if isinstance(vectors, Mapping) else vectors
+    total = [0, 0, 0, sys.getsizeof(vectors)]
+    seen = set()
+
+    for bv in items:
+        if id(bv) not in seen:
+            seen.add(id(bv))
+            for n, value in enumerate(_measure(bv)):
+                total[n] += value
+
+    return Footprint(*total)
@@ -0,0 +1,241 @@
+"""Parallel bulk operations over large BitVectors and collections.
+
+Popcounts, searches and AND/OR/XOR reductions of wide vectors are
+split into byte ranges, each range a separate task for a pool of
+worker processes, so they scale with the number of cores rather than
+running on one:
+
+```python
+> from bitvector import parallel
+>
+> union = parallel.reduce(operator.or_, bitmaps, workers=8)
+> parallel.count(union, workers=8)
+```
+
+The vectors are copied once into a shared memory block the workers
+attach to, laid out as one row per vector, or used in place when a
+single SharedBitVector is given. Workers read their byte range of
+every row and write reductions straight into an output row, so only
+offsets and counts travel through the pool.
+
+Pass an `executor` to reuse a pool across calls; otherwise one with
+`workers` processes is created for the call. With one worker the
+operation runs in the calling process.
+"""
+
+import operator
+import os
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import ExitStack
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .bitvector import BitVector
+from .shared import HEADER_BYTES, SharedBitVector, _buffer
+from ._rank import count_ones, find_next
+
+
+#: Smallest byte range given to a worker.
+MIN_TASK_BYTES = 1 << 20
+
+_REDUCERS = {operator.and_: "and", operator.or_: "or", operator.xor: "xor"}
+
+_FUNCS = {name: func for func, name in _REDUCERS.items()}
+
+
+class _Rows(NamedTuple):
+    """Vectors of `nbytes` bytes laid out in a shared memory block, row
+    `n` starting at `base + n * stride`.
+    """
+
+    name: str
+    base: int
+    stride: int
+    nbytes: int
+    nrows: int
+
+    def row(self, shm: SharedMemory, n: int) -> memoryview:
+        start = self.base + n * self.stride
+        return _buffer(shm)[start : start + self.nbytes]
+
+
+def _stage(stack: ExitStack, vectors: Sequence[BitVector], extra_rows: int = 0) -> Tuple[_Rows, SharedMemory]:
+    """Returns the rows holding `vectors` in little-endian, lsb first
+    order, followed by `extra_rows` zeroed rows, and the block.
+    """
+    nbytes = (len(vectors[0]) + 7) // 8
+
+    if len(vectors) == 1 and not extra_rows and isinstance(vectors[0], SharedBitVector):
+        shm = vectors[0]._shm
+        return _Rows(shm.name, HEADER_BYTES, 0, nbytes, 1), shm
+
+    stride = (nbytes + 7) & ~0x7
+    nrows = len(vectors) + extra_rows
+    shm = SharedMemory(create=True, size=stride * nrows)
+    stack.callback(shm.unlink)
+    stack.callback(shm.close)
+    rows = _Rows(shm.name, 0, stride, nbytes, nrows)
+
+    for n, bv in enumerate(vectors):
+        view = rows.row(shm, n)
+        view[:] = bv.to_buffer("little", "lsb")
+        view.release()
+
+    return rows, shm
+
+
+def _ranges(nbytes: int, workers: int) -> List[Tuple[int, int]]:
+    """Splits `nbytes` into ranges of whole 64-bit words, about four per
+    worker so faster workers take more of them.
+    """
+    size = max(MIN_TASK_BYTES, -(-nbytes // (workers * 4)))
+    size = (size + 7) & ~0x7
+    return [(lo, min(lo + size, nbytes)) for lo in range(0, nbytes, size)]
+
+
+def _attach(rows: _Rows) -> SharedMemory:
+    return SharedMemory(name=rows.name)
+
+
+def _count_task(rows: _Rows, lo: int, hi: int) -> int:
+    shm = _attach(rows)
+    try:
+        data = rows.row(shm, 0)
+        ones = count_ones(data[lo:hi])
+        data.release()
+        return ones
+    finally:
+        shm.close()
+
+
+def _find_task(rows: _Rows, lo: int, hi: int, value: int) -> int:
+    shm = _attach(rows)
+    try:
+        data = rows.row(shm, 0)
+        found = find_next(data[lo:hi], 0, value)
+        data.release()
+        return -1 if found < 0 else lo * 8 + found
+    finally:
+        shm.close()
+
+
+def _reduce_task(rows: _Rows, lo: int, hi: int, name: str) -> None:
+    func = _FUNCS[name]
+    shm = _attach(rows)
+    try:
+        bits = int.from_bytes(rows.row(shm, 0)[lo:hi], "little")
+        for n in range(1, rows.nrows - 1):
+            bits = func(bits, int.from_bytes(rows.row(shm, n)[lo:hi], "little"))
+        rows.row(shm, rows.nrows - 1)[lo:hi] = bits.to_bytes(hi - lo, "little")
+    finally:
+        shm.close()
+
+
+def _run(
+    stack: ExitStack, task: Callable, rows: _Rows, workers: Optional[int], executor: Optional[Executor], *args
+):
+    """Runs `task` over the byte ranges of `rows` and returns the results
+    in order.
+    """
+    workers = workers or os.cpu_count() or 1
+    ranges = _ranges(rows.nbytes, workers)
+
+    if executor is None and (workers == 1 or len(ranges) == 1):
+        return [task(rows, lo, hi, *args) for lo, hi in ranges]
+
+    if executor is None:
+        executor = stack.enter_context(ProcessPoolExecutor(min(workers, len(ranges))))
+
+    futures = [executor.submit(task, rows, lo, hi, *args) for lo, hi in ranges]
+    return [future.result() for future in futures]
+
+
+def count(bv: BitVector, workers: Optional[int] = None, executor: Optional[Executor] = None) -> int:
+    """Returns the number of bits set to one in `bv`, counted in parallel.
+
+    :param bv: BitVector
+    :param workers: Optional[int] processes, defaults to the number of CPUs
+    :param executor: Optional[Executor] pool to run the tasks in
+    :return: int
+    """
+    with ExitStack() as stack:
+        rows, _ = _stage(stack, [bv])
+        return sum(_run(stack, _count_task, rows, workers, executor))
+
+
+def _find(bv: BitVector, value: int, workers: Optional[int], executor: Optional[Executor]) -> int:
+    with ExitStack() as stack:
+        rows, _ = _stage(stack, [bv])
+        for found in _run(stack, _find_task, rows, workers, executor, value):
+            if found >= 0:
+                return found if found < len(bv) else -1
+        return -1
+
+
+def find_first_set(bv: BitVector, workers: Optional[int] = None, executor: Optional[Executor] = None) -> int:
+    """Returns the offset of the first bit set to one in `bv`, or -1,
+    searching byte ranges in parallel.
+
+    :param bv: BitVector
+    :param workers: Optional[int]
+    :param executor: Optional[Executor]
+    :return: int
+    """
+    return _find(bv, 1, workers, executor)
+
+
+def find_first_zero(bv: BitVector, workers: Optional[int] = None, executor: Optional[Executor] = None) -> int:
+    """Returns the offset of the first bit set to zero in `bv`, or -1,
+    searching byte ranges in parallel.
+
+    :param bv: BitVector
+    :param workers: Optional[int]
+    :param executor: Optional[Executor]
+    :return: int
+    """
+    return _find(bv, 0, workers, executor)
+
+
+def reduce(
+    func: Callable[[int, int], int],
+    vectors: Iterable[BitVector],
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> BitVector:
+    """Returns the AND, OR or XOR of all `vectors`, computed in parallel
+    over byte ranges. The result is created like the result of an
+    operator applied to the first vector.
+
+    :param func: operator.and_, operator.or_ or operator.xor
+    :param vectors: Iterable[BitVector] of the same size
+    :param workers: Optional[int]
+    :param executor: Optional[Executor]
+    :return: BitVector
+
+    Raises:
+    - ValueError for other functions, no vectors or mixed sizes
+    """
+    try:
+        name = _REDUCERS[func]
+    except KeyError:
+        raise ValueError(f"Unsupported reduction: {func!r}") from None
+
+    vectors = list(vectors)
+
+    if not vectors:
+        raise ValueError("reduce() of no vectors")
+
+    size = len(vectors[0])
+
+    if any(len(bv) != size for bv in vectors):
+        raise ValueError("Vectors must be the same size")
+
+    with ExitStack() as stack:
+        rows, shm = _stage(stack, vectors, extra_rows=1)
+        _run(stack, _reduce_task, rows, workers, executor, name)
+        result = rows.row(shm, rows.nrows - 1)
+        value = int.from_bytes(result, "little")
+        result.release()
+
+    return vectors[0]._new_like(value, size)
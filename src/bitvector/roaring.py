@@ -0,0 +1,612 @@
+"""Compressed bitmaps for large, sparse sets of bit offsets.
+
+A RoaringBitmap splits its offsets into chunks of 65536 bits keyed by
+the high bits of the offset and keeps each non-empty chunk in the
+smallest of three containers:
+
+- array: the sorted low 16 bits of each one, for up to 4096 ones
+- bitmap: all 65536 bits of the chunk as an integer
+- run: (start, last) pairs of consecutive ones, chosen by
+  `run_optimize` or `add_range` when runs are smaller
+
+so a 2**32 bit bitmap holding a few thousand ones takes kilobytes
+rather than the half gigabyte of a dense BitVector:
+
+```python
+> from bitvector.roaring import RoaringBitmap
+>
+> a = RoaringBitmap([1, 70000, 3_000_000_000])
+> b = RoaringBitmap(range(0, 100000, 2))
+> sorted(a & b)
+[70000]
+> (a | b).count()
+50002
+```
+"""
+
+import operator
+import sys
+
+from array import array
+from bisect import bisect_left
+from itertools import groupby
+from typing import Callable, Dict, Iterable, Iterator, Optional, Union
+
+from .bitvector import BitVector
+from ._rank import find_next, iter_set, popcount
+
+
+CHUNK_SIZE = 1 << 16
+CHUNK_BYTES = CHUNK_SIZE // 8
+ARRAY_MAX = 4096
+
+
+class _Array:
+    """Sorted low bits of the ones in a sparse chunk."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: array):
+        self.values = values
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self.values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, low: int) -> bool:
+        values = self.values
+        index = bisect_left(values, low)
+        return index < len(values) and values[index] == low
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.values)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.values) * 2
+
+    def copy(self) -> "_Array":
+        return _Array(array("H", self.values))
+
+    def to_int(self) -> int:
+        data = bytearray(CHUNK_BYTES)
+        for low in self.values:
+            data[low >> 3] |= 1 << (low & 0x7)
+        return int.from_bytes(data, "little")
+
+    def add(self, low: int) -> "Container":
+        values = self.values
+        index = bisect_left(values, low)
+        if index < len(values) and values[index] == low:
+            return self
+        if len(values) >= ARRAY_MAX:
+            return _Bitmap(self.to_int() | (1 << low), len(values) + 1)
+        values.insert(index, low)
+        return self
+
+    def discard(self, low: int) -> Optional["Container"]:
+        values = self.values
+        index = bisect_left(values, low)
+        if index < len(values) and values[index] == low:
+            del values[index]
+        return self if values else None
+
+
+class _Bitmap:
+    """All 65536 bits of a dense chunk."""
+
+    __slots__ = ("value", "ones")
+
+    def __init__(self, value: int, ones: int):
+        self.value = value
+        self.ones = ones
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self.value)
+
+    def __len__(self) -> int:
+        return self.ones
+
+    def __contains__(self, low: int) -> bool:
+        return bool((self.value >> low) & 0x1)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter_set(self.value.to_bytes(CHUNK_BYTES, "little"), CHUNK_SIZE)
+
+    @property
+    def nbytes(self) -> int:
+        return CHUNK_BYTES
+
+    def copy(self) -> "_Bitmap":
+        return _Bitmap(self.value, self.ones)
+
+    def to_int(self) -> int:
+        return self.value
+
+    def add(self, low: int) -> "Container":
+        if not (self.value >> low) & 0x1:
+            self.value |= 1 << low
+            self.ones += 1
+        return self
+
+    def discard(self, low: int) -> Optional["Container"]:
+        if (self.value >> low) & 0x1:
+            self.value &= ~(1 << low)
+            self.ones -= 1
+            if self.ones <= ARRAY_MAX:
+                return _from_int(self.value)
+        return self
+
+
+class _Run:
+    """Runs of consecutive ones as flattened (start, last) pairs."""
+
+    __slots__ = ("runs",)
+
+    def __init__(self, runs: array):
+        self.runs = runs
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self.runs)
+
+    def __len__(self) -> int:
+        runs = self.runs
+        return sum(runs[1::2]) - sum(runs[0::2]) + len(runs) // 2
+
+    def __contains__(self, low: int) -> bool:
+        runs = self.runs
+        index = bisect_left(runs, low)
+        return index < len(runs) and (runs[index] == low or index & 0x1 == 1)
+
+    def __iter__(self) -> Iterator[int]:
+        runs = self.runs
+        for n in range(0, len(runs), 2):
+            yield from range(runs[n], runs[n + 1] + 1)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.runs) * 2
+
+    def copy(self) -> "_Run":
+        return _Run(array("H", self.runs))
+
+    def to_int(self) -> int:
+        runs = self.runs
+        value = 0
+        for n in range(0, len(runs), 2):
+            value |= ((1 << (runs[n + 1] - runs[n] + 1)) - 1) << runs[n]
+        return value
+
+    def add(self, low: int) -> "Container":
+        runs = self.runs
+        index = bisect_left(runs, low)
+
+        if index < len(runs) and (runs[index] == low or index & 0x1 == 1):
+            return self
+
+        after = index > 0 and runs[index - 1] == low - 1
+        before = index < len(runs) and runs[index] == low + 1
+
+        if after and before:
+            del runs[index - 1 : index + 1]
+        elif after:
+            runs[index - 1] = low
+        elif before:
+            runs[index] = low
+        else:
+            runs[index:index] = array("H", [low, low])
+
+        return self._checked()
+
+    def discard(self, low: int) -> Optional["Container"]:
+        runs = self.runs
+        index = bisect_left(runs, low)
+
+        if index >= len(runs) or (runs[index] != low and index & 0x1 == 0):
+            return self
+
+        pair = index & ~0x1
+        start, last = runs[pair], runs[pair + 1]
+
+        if start == last:
+            del runs[pair : pair + 2]
+        elif low == start:
+            runs[pair] = low + 1
+        elif low == last:
+            runs[pair + 1] = low - 1
+        else:
+            runs[pair + 1 : pair + 2] = array("H", [low - 1, low + 1, last])
+
+        return self._checked() if runs else None
+
+    def _checked(self) -> "Container":
+        """Returns self, or a bitmap once the runs outgrow one."""
+        if len(self.runs) * 2 > CHUNK_BYTES:
+            return _from_int(self.to_int())  # type: ignore
+        return self
+
+
+Container = Union[_Array, _Bitmap, _Run]
+
+
+def _from_int(value: int) -> Optional[Container]:
+    """Returns an array or bitmap container holding the bits of `value`,
+    or None if it is zero.
+    """
+    ones = popcount(value)
+
+    if not ones:
+        return None
+
+    if ones <= ARRAY_MAX:
+        return _Array(array("H", iter_set(value.to_bytes(CHUNK_BYTES, "little"), CHUNK_SIZE)))
+
+    return _Bitmap(value, ones)
+
+
+def _from_sorted(values: list) -> Optional[Container]:
+    """Returns a container holding the sorted, distinct low bits in
+    `values`, or None if there are none.
+    """
+    if not values:
+        return None
+
+    if len(values) <= ARRAY_MAX:
+        return _Array(array("H", values))
+
+    return _from_int(_Array(array("H", values)).to_int())
+
+
+def _optimize(container: Container) -> Container:
+    """Returns the smallest container holding the same bits."""
+    value = container.to_int()
+    starts = value & ~(value << 1)
+    nruns = popcount(starts)
+
+    if nruns * 4 >= min(popcount(value) * 2, CHUNK_BYTES):
+        return _from_int(value) if isinstance(container, _Run) else container  # type: ignore
+
+    lasts = value & ~(value >> 1)
+    runs = array("H")
+    for start, last in zip(
+        iter_set(starts.to_bytes(CHUNK_BYTES, "little"), CHUNK_SIZE),
+        iter_set(lasts.to_bytes(CHUNK_BYTES, "little"), CHUNK_SIZE),
+    ):
+        runs.append(start)
+        runs.append(last)
+
+    return _Run(runs)
+
+
+def _andnot(a, b):
+    return a & ~b
+
+
+_SET_OPS: Dict[Callable, Callable] = {
+    operator.and_: set.intersection,
+    operator.or_: set.union,
+    operator.xor: set.symmetric_difference,
+    _andnot: set.difference,
+}
+
+
+def _combine(func: Callable, a: Container, b: Container) -> Optional[Container]:
+    """Returns the container holding `func` applied to two containers,
+    or None if the result is empty.
+    """
+    if isinstance(a, _Array) and isinstance(b, _Array):
+        return _from_sorted(sorted(_SET_OPS[func](set(a.values), b.values)))
+
+    return _from_int(func(a.to_int(), b.to_int()))
+
+
+class RoaringBitmap:
+    """A compressed bitmap of `size` bits, see `bitvector.roaring`.
+
+    Supports the set algebra operators `&`, `|`, `^` and `-`
+    (difference) with other RoaringBitmaps or BitVectors, membership
+    tests, iteration over the offsets of the ones in increasing order
+    and conversion to and from a dense BitVector. As it iterates over
+    the ones, `len()` is their number like `count()`, while `size` is
+    the number of bits.
+    """
+
+    __slots__ = ("_size", "_chunks")
+
+    # BitVector operators return NotImplemented, so ours are called
+    _reflects_bitvectors = True
+
+    def __init__(self, values: Iterable[int] = (), size: int = 1 << 32):
+        """Initialize a RoaringBitmap with the offsets of its ones.
+
+        :param values: Iterable[int] offsets of the bits set to one
+        :param size: int
+
+        Raises:
+        - ValueError if size <= 0
+        - IndexError if an offset is out of range
+        """
+        if size <= 0:
+            raise ValueError("Size must greater than zero.")
+
+        self._size = size
+        self._chunks: Dict[int, Container] = {}
+        self.update(values)
+
+    @classmethod
+    def from_bitvector(cls, bv: BitVector) -> "RoaringBitmap":
+        """Create a RoaringBitmap holding the ones of a dense BitVector.
+        Empty chunks are skipped with a byte search rather than decoded.
+
+        :param bv: BitVector
+        :return: RoaringBitmap
+        """
+        rb = cls(size=len(bv))
+        data = bv.value.to_bytes((len(bv) + 7) // 8, "little")
+        offset = find_next(data, 0)
+
+        while offset >= 0:
+            key = offset >> 16
+            lo = key * CHUNK_BYTES
+            container = _from_int(int.from_bytes(data[lo : lo + CHUNK_BYTES], "little"))
+            if container is not None:
+                rb._chunks[key] = container
+            offset = find_next(data, (key + 1) << 16)
+
+        return rb
+
+    def to_bitvector(self, backend: str = "int") -> BitVector:
+        """Returns a dense BitVector of the same size holding the same
+        ones.
+
+        :param backend: str
+        :return: BitVector
+        """
+        data = bytearray((self._size + 7) // 8)
+
+        for key, container in self._chunks.items():
+            lo = key * CHUNK_BYTES
+            chunk = container.to_int().to_bytes(CHUNK_BYTES, "little")
+            data[lo : lo + CHUNK_BYTES] = chunk[: len(data) - lo]
+
+        return BitVector(int.from_bytes(data, "little"), size=self._size, backend=backend)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(count={self.count()}, size={self._size})"
+
+    @property
+    def size(self) -> int:
+        """Size of the bitmap in bits."""
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the containers' contents."""
+        return sum(container.nbytes for container in self._chunks.values())
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __sizeof__(self) -> int:
+        chunks = self._chunks
+        return object.__sizeof__(self) + sys.getsizeof(chunks) + sum(map(sys.getsizeof, chunks.values()))
+
+    def count(self) -> int:
+        """Returns the number of bits set to one."""
+        return sum(len(container) for container in self._chunks.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._chunks)
+
+    def __contains__(self, offset: int) -> bool:
+        container = self._chunks.get(offset >> 16)
+        return container is not None and (offset & 0xFFFF) in container
+
+    def __iter__(self) -> Iterator[int]:
+        chunks = self._chunks
+        for key in sorted(chunks):
+            base = key << 16
+            for low in chunks[key]:
+                yield base | low
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        if self._chunks.keys() != other._chunks.keys():
+            return False
+        return all(c.to_int() == other._chunks[k].to_int() for k, c in self._chunks.items())
+
+    def __check(self, offset: int) -> None:
+        if not 0 <= offset < self._size:
+            raise IndexError(offset)
+
+    def add(self, offset: int) -> None:
+        """Sets the bit at `offset` to one.
+
+        :param offset: int
+
+        Raises:
+        - IndexError if offset is out of range
+        """
+        self.__check(offset)
+        key, low = offset >> 16, offset & 0xFFFF
+        container = self._chunks.get(key)
+        if container is None:
+            self._chunks[key] = _Array(array("H", [low]))
+        else:
+            self._chunks[key] = container.add(low)
+
+    def discard(self, offset: int) -> None:
+        """Clears the bit at `offset` if it is set.
+
+        :param offset: int
+        """
+        key = offset >> 16
+        container = self._chunks.get(key)
+        if container is None:
+            return
+        container = container.discard(offset & 0xFFFF)
+        if container is None:
+            del self._chunks[key]
+        else:
+            self._chunks[key] = container
+
+    def update(self, values: Iterable[int]) -> None:
+        """Sets the bits at every offset in `values`, building a
+        container per chunk rather than adding them one at a time.
+
+        :param values: Iterable[int]
+
+        Raises:
+        - IndexError if an offset is out of range
+        """
+        values = sorted(set(values))
+
+        if not values:
+            return
+
+        self.__check(values[0])
+        self.__check(values[-1])
+
+        for key, group in groupby(values, lambda offset: offset >> 16):
+            container = _from_sorted([offset & 0xFFFF for offset in group])
+            self.__merge(key, container)
+
+    def add_range(self, start: int, stop: int) -> None:
+        """Sets the bits from `start` up to but not including `stop`.
+
+        :param start: int
+        :param stop: int
+
+        Raises:
+        - IndexError if the range is out of bounds
+        """
+        if start >= stop:
+            return
+
+        self.__check(start)
+        self.__check(stop - 1)
+
+        for key in range(start >> 16, ((stop - 1) >> 16) + 1):
+            lo = max(start, key << 16) & 0xFFFF
+            hi = min(stop, (key + 1) << 16) - (key << 16)
+            container = _from_int(((1 << (hi - lo)) - 1) << lo)
+            self.__merge(key, container)
+            self._chunks[key] = _optimize(self._chunks[key])
+
+    def __merge(self, key: int, container: Optional[Container]) -> None:
+        if container is None:
+            return
+        current = self._chunks.get(key)
+        if current is not None:
+            container = _combine(operator.or_, current, container)
+        self._chunks[key] = container  # type: ignore
+
+    def run_optimize(self) -> None:
+        """Converts each container to a run container where that is
+        smaller, and run containers that are not back to arrays or
+        bitmaps.
+        """
+        for key, container in self._chunks.items():
+            self._chunks[key] = _optimize(container)
+
+    def __operand(self, other) -> "RoaringBitmap":
+        if isinstance(other, RoaringBitmap):
+            return other
+        if isinstance(other, BitVector):
+            return RoaringBitmap.from_bitvector(other)
+        return NotImplemented
+
+    def __clip(self) -> None:
+        """Drops ones at or beyond the size of this bitmap."""
+        chunks = self._chunks
+        last = (self._size - 1) >> 16
+
+        for key in [key for key in chunks if key > last]:
+            del chunks[key]
+
+        if self._size & 0xFFFF and last in chunks:
+            container = _from_int(chunks[last].to_int() & ((1 << (self._size & 0xFFFF)) - 1))
+            if container is None:
+                del chunks[last]
+            else:
+                chunks[last] = container
+
+    def __binary_op(self, other, func: Callable) -> "RoaringBitmap":
+        other = self.__operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+
+        a, b = self._chunks, other._chunks
+
+        if func is operator.and_:
+            keys = a.keys() & b.keys()
+        elif func is _andnot:
+            keys = a.keys()
+        else:
+            keys = a.keys() | b.keys()
+
+        result = RoaringBitmap(size=self._size)
+        chunks = result._chunks
+
+        for key in keys:
+            x, y = a.get(key), b.get(key)
+            if y is None:
+                chunks[key] = x.copy()  # type: ignore
+            elif x is None:
+                chunks[key] = y.copy()
+            else:
+                container = _combine(func, x, y)
+                if container is not None:
+                    chunks[key] = container
+
+        if other._size > self._size:
+            result.__clip()
+
+        return result
+
+    def __inplace_op(self, other, func: Callable) -> "RoaringBitmap":
+        result = self.__binary_op(other, func)
+        if result is NotImplemented:
+            return NotImplemented
+        self._chunks = result._chunks
+        return self
+
+    def __and__(self, other) -> "RoaringBitmap":
+        return self.__binary_op(other, operator.and_)
+
+    def __or__(self, other) -> "RoaringBitmap":
+        return self.__binary_op(other, operator.or_)
+
+    def __xor__(self, other) -> "RoaringBitmap":
+        return self.__binary_op(other, operator.xor)
+
+    # AND, OR and XOR commute, so a BitVector on the left gives the same bitmap
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def __sub__(self, other) -> "RoaringBitmap":
+        return self.__binary_op(other, _andnot)
+
+    def __rsub__(self, other) -> "RoaringBitmap":
+        # a BitVector on the left is a set difference too, not subtraction
+        other = self.__operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return other.__binary_op(self, _andnot)
+
+    def __iand__(self, other) -> "RoaringBitmap":
+        return self.__inplace_op(other, operator.and_)
+
+    def __ior__(self, other) -> "RoaringBitmap":
+        return self.__inplace_op(other, operator.or_)
+
+    def __ixor__(self, other) -> "RoaringBitmap":
+        return self.__inplace_op(other, operator.xor)
+
+    def __isub__(self, other) -> "RoaringBitmap":
+        return self.__inplace_op(other, _andnot)
@@ -0,0 +1,158 @@
+"""BitVectors in shared memory for multiprocess workers.
+
+A SharedBitVector keeps its bits in a `multiprocessing.shared_memory`
+block, so worker processes attach to the same bits by name instead of
+receiving a pickled copy of the whole value. Concurrent writes are
+serialized with striped locks, see `bitvector._striped`:
+
+```python
+> from concurrent.futures import ProcessPoolExecutor
+> from bitvector.shared import SharedBitVector, attach
+>
+> def mark(offsets):
+>     for offset in offsets:
+>         seen[offset] = 1
+>
+> def init(name, locks):
+>     global seen
+>     seen = attach(name, locks)
+>
+> with SharedBitVector(size=1 << 30) as seen:
+>     with ProcessPoolExecutor(4, initializer=init, initargs=(seen.name, seen.locks)) as pool:
+>         list(pool.map(mark, batches))
+>     print(seen.count())
+>     seen.unlink()
+```
+
+The locks are multiprocessing locks, which can only be handed to
+processes as they start, e.g. through a pool initializer or Process
+arguments, where a SharedBitVector itself may also be passed.
+Processes that attach by name alone share the bits without locking.
+"""
+
+import multiprocessing
+
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Sequence
+
+from .bitvector import BitVector, metadata
+from ._striped import StripedLocks
+
+
+#: Bytes at the start of the block holding the size of the vector in bits.
+HEADER_BYTES = 8
+
+
+def _buffer(shm: SharedMemory) -> memoryview:
+    # SharedMemory.buf is only None once the block is closed
+    buf = shm.buf
+    if buf is None:
+        raise ValueError(f"Shared memory block {shm.name!r} is closed")
+    return buf
+
+
+class SharedBitVector(StripedLocks, BitVector):
+    """A BitVector stored in a named shared memory block, see
+    `bitvector.shared`.
+
+    The bits are laid out like the "bytes" backend after a small
+    header. Operators returning a new vector return an ordinary
+    "bytes" BitVector in private memory.
+    """
+
+    __slots__ = ("_shm", "_locks")
+
+    def __init__(self, value: int = 0, size: int = 128, name: Optional[str] = None, locks: int = 16):
+        """Create a shared memory block holding a BitVector of `size`
+        bits initialized with `value`.
+
+        :param value: int
+        :param size: int
+        :param name: Optional[str] block name, generated if None
+        :param locks: int number of lock stripes, zero for no locking
+
+        Raises:
+        - ValueError if size <= 0
+        - FileExistsError if a block called `name` exists
+        """
+        meta = metadata(size, "bytes")
+        shm = SharedMemory(name=name, create=True, size=HEADER_BYTES + meta.nbytes)
+        _buffer(shm)[:HEADER_BYTES] = size.to_bytes(HEADER_BYTES, "little")
+        stripes = tuple(multiprocessing.RLock() for _ in range(locks)) or None
+        self._map(shm, stripes)
+        if value:
+            self.value = value
+
+    @classmethod
+    def attach(cls, name: str, locks: Optional[Sequence] = None) -> "SharedBitVector":
+        """Attach to the SharedBitVector in the block called `name`.
+
+        :param name: str
+        :param locks: Optional[Sequence] the `locks` of the creator
+        :return: SharedBitVector
+
+        Raises:
+        - FileNotFoundError if there is no block called `name`
+        """
+        bv = cls.__new__(cls)
+        bv._map(SharedMemory(name=name), None if locks is None else tuple(locks))
+        return bv
+
+    def _map(self, shm: SharedMemory, locks: Optional[tuple]) -> None:
+        buf = _buffer(shm)
+        size = int.from_bytes(buf[:HEADER_BYTES], "little")
+        meta = self._meta = metadata(size, "bytes")
+        self._value = buf[HEADER_BYTES : HEADER_BYTES + meta.nbytes]
+        self._rank = None
+        self._shm = shm
+        self._locks = locks
+
+    def __reduce__(self):
+        return (self.__class__.attach, (self.name, self._locks))
+
+    def __del__(self) -> None:
+        # the block cannot be closed while this view of it exists
+        try:
+            self._value.release()
+        except (AttributeError, BufferError):
+            pass
+
+    def _new_like(self, value: int, size: int) -> BitVector:
+        return BitVector(value, size=size, backend="bytes")
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self._shm.name
+
+    @property
+    def locks(self) -> Optional[tuple]:
+        """The lock stripes, None if writes are not locked."""
+        return self._locks
+
+    def flush(self) -> None:
+        """Shared memory needs no flushing; provided for symmetry with
+        memory-mapped vectors.
+        """
+
+    def close(self) -> None:
+        """Detach this process from the block, after which the vector
+        cannot be used. The block lives on until `unlink` is called.
+
+        Raises:
+        - BufferError if views of the block are still in use
+        """
+        self._rank = None
+        self._value.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the block once every process has closed it."""
+        self._shm.unlink()
+
+
+def attach(name: str, locks: Optional[Sequence] = None) -> SharedBitVector:
+    """Attach to the SharedBitVector in the block called `name`, see
+    `SharedBitVector.attach`.
+    """
+    return SharedBitVector.attach(name, locks)
@@ -0,0 +1,75 @@
+"""A BitVector that can be written from several threads.
+
+Updating a bit is a read-modify-write of the storage, which threads
+racing on a free-threaded (no-GIL) build of CPython, or on any build
+once the interpreter switches threads mid-update, can interleave so
+that one of the updates is lost. ThreadSafeBitVector makes single bit
+writes, slice and BitField writes, value assignment and in-place
+operators atomic with striped locks, see `bitvector._striped`:
+
+```python
+> from bitvector.threadsafe import ThreadSafeBitVector
+>
+> seen = ThreadSafeBitVector(size=1 << 24)
+> with ThreadPoolExecutor(8) as pool:
+>     pool.map(seen._setb, offsets)
+```
+
+Stripes only help when the storage is updated in place, one byte or
+word at a time: with the default "bytes" backend, or another byte
+buffer backend, threads writing different words rarely contend. Other
+backends replace or restructure the whole store on a write and use a
+single lock.
+"""
+
+import threading
+
+from .bitvector import BitVector
+from ._striped import StripedLocks
+
+
+class ThreadSafeBitVector(StripedLocks, BitVector):
+    """A BitVector whose writes are atomic across threads, see
+    `bitvector.threadsafe`. Reads take no locks.
+    """
+
+    __slots__ = ("_locks",)
+
+    def __init__(self, value: int = 0, size: int = 128, backend: str = "bytes", locks: int = 16):
+        """Initialize a ThreadSafeBitVector with integer value and size
+        in bits.
+
+        :param value: int
+        :param size: int
+        :param backend: str
+        :param locks: int number of lock stripes, zero for no locking
+
+        Raises:
+        - ValueError if size <= 0
+        - ValueError if backend is unknown
+        """
+        super().__init__(value, size, backend)
+        self._locks = self._new_locks(locks)
+
+    def _new_like(self, value: int, size: int) -> BitVector:
+        # the default backend differs from BitVector's, so always pass it
+        locks = len(self._locks or ())
+        return self.__class__(value, size=size, backend=self._meta.backend.name, locks=locks)
+
+    def _new_locks(self, locks: int):
+        if not hasattr(self._meta.backend, "byteorder"):
+            locks = min(locks, 1)
+        return tuple(threading.RLock() for _ in range(locks)) or None
+
+    def __getstate__(self) -> tuple:
+        return (super().__getstate__(), len(self._locks or ()))
+
+    def __setstate__(self, state: tuple) -> None:
+        state, locks = state
+        super().__setstate__(state)
+        self._locks = self._new_locks(locks)
+
+    @property
+    def locks(self):
+        """The lock stripes, None if writes are not locked."""
+        return self._locks
@@ -0,0 +1,72 @@
+"""
+"""
+
+import json
+
+import pytest
+
+from bitvector import bench
+
+
+ARGS = ["--sizes", "8,1<<10", "--densities", "0.5", "--select", "getitem", "--min-time", "0.0005", "--repeat", "2"]
+
+
+@pytest.mark.fast
+def test_bench_run_keys():
+
+    results = bench.run([64, 2**12], [0.01, 0.5], select="count", min_time=0.0005, repeat=2)
+
+    assert sorted(results) == ["count/4096/0.01", "count/4096/0.5", "count/64/0.01", "count/64/0.5"]
+    assert all(seconds > 0 for seconds in results.values())
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("size", [8, 1024])
+def test_bench_families_run(size):
+
+    for name, func in bench.families(size, 0.5).items():
+        func()
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("density", [0.01, 0.25, 0.5, 1.0])
+def test_bench_random_value_density(density):
+
+    import random
+
+    value = bench.random_value(1 << 16, density, random.Random(0))
+
+    assert abs(bin(value).count("1") / (1 << 16) - density) < density / 2
+
+
+@pytest.mark.fast
+def test_bench_compare():
+
+    baseline = {"a": 1.0, "b": 1.0, "c": 1.0}
+    results = {"a": 1.2, "b": 2.0, "c": 1.5, "d": 9.0}
+
+    assert bench.compare(results, baseline, 0.25) == [("b", 1.0, 2.0, 2.0), ("c", 1.0, 1.5, 1.5)]
+    assert bench.compare(results, baseline, 1.0) == []
+
+
+@pytest.mark.fast
+def test_bench_main_baseline_gating(tmp_path, capsys):
+
+    output = tmp_path / "results.json"
+
+    assert bench.main(ARGS + ["--quiet", "--output", str(output)]) == 0
+
+    data = json.loads(output.read_text())
+    assert set(data) == {"environment", "results"}
+    assert "getitem-int/1024/0.5" in data["results"]
+
+    fast = {key: seconds * 1e6 for key, seconds in data["results"].items()}
+    slow = {key: seconds / 1e6 for key, seconds in data["results"].items()}
+
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"results": fast}))
+    assert bench.main(ARGS + ["--quiet", "--baseline", str(baseline)]) == 0
+
+    baseline.write_text(json.dumps({"results": slow}))
+    assert bench.main(ARGS + ["--quiet", "--baseline", str(baseline)]) == 1
+    assert "REGRESSION getitem-int/1024/0.5" in capsys.readouterr().out
@@ -0,0 +1,126 @@
+"""
+"""
+
+import random
+
+from array import array
+
+import pytest
+
+from bitvector import BitVector, BitVectorArray, BitField, ReadOnlyBitField
+
+
+class Record(BitVector):
+    def __init__(self, value: int = 0):
+        super().__init__(value, size=144)
+
+    flag = BitField(0)
+    byte1 = BitField(8, 8)
+    word = BitField(20, 16)
+    straddle = BitField(60, 10)
+    wide = BitField(64, 80)
+    status = ReadOnlyBitField(136, 8)
+
+
+FIELDS = ["flag", "byte1", "word", "straddle", "wide", "status"]
+
+VALUES = [random.getrandbits(144) for _ in range(50)]
+
+
+@pytest.fixture
+def records() -> BitVectorArray:
+    return BitVectorArray(VALUES, size=144, vector_type=Record)
+
+
+@pytest.mark.fast
+def test_bitfield_class_access_returns_descriptor():
+
+    assert isinstance(Record.byte1, BitField)
+    assert isinstance(Record.status, ReadOnlyBitField)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("name", FIELDS)
+def test_bitfield_column_from_array(name: str, records: BitVectorArray):
+
+    expected = [getattr(Record(v), name) for v in VALUES]
+    descriptor = getattr(Record, name)
+
+    result = descriptor.column(records)
+
+    assert list(result) == expected
+    assert list(records.column(name)) == expected
+    assert list(records.column(descriptor)) == expected
+    assert list(records.column(descriptor.field)) == expected
+
+    if name != "wide":
+        assert isinstance(result, array)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("name", FIELDS)
+def test_bitfield_column_from_objects_and_ints(name: str):
+
+    expected = [getattr(Record(v), name) for v in VALUES]
+    descriptor = getattr(Record, name)
+
+    assert list(descriptor.column([Record(v) for v in VALUES])) == expected
+    assert list(descriptor.column(VALUES)) == expected
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("name", ["flag", "byte1", "word", "straddle", "wide"])
+def test_bitfield_set_column_on_array(name: str, records: BitVectorArray):
+
+    descriptor = getattr(Record, name)
+    width = descriptor.field.stop - descriptor.field.start
+    values = [random.getrandbits(width) for _ in VALUES]
+
+    descriptor.set_column(records, values)
+
+    for n, value in enumerate(VALUES):
+        expected = Record(value)
+        setattr(expected, name, values[n])
+        assert records[n] == expected
+
+
+@pytest.mark.fast
+def test_bitfield_set_column_on_objects():
+
+    objects = [Record(v) for v in VALUES]
+    values = array("Q", range(len(VALUES)))
+
+    Record.word.set_column(objects, values)
+
+    assert [o.word for o in objects] == list(values)
+
+    with pytest.raises(ValueError):
+        Record.word.set_column(objects, values[1:])
+
+
+@pytest.mark.fast
+def test_bitfield_set_column_length_mismatch(records: BitVectorArray):
+
+    with pytest.raises(ValueError):
+        records.set_column("byte1", [1, 2, 3])
+
+    with pytest.raises(ValueError):
+        records.set_column("wide", [1, 2, 3])
+
+
+@pytest.mark.fast
+def test_bitfield_column_numpy(records: BitVectorArray):
+
+    np = pytest.importorskip("numpy")
+
+    result = Record.straddle.column(records, numpy=True)
+
+    assert result.dtype == np.uint64
+    assert result.tolist() == [Record(v).straddle for v in VALUES]
+    assert Record.byte1.column(VALUES, numpy=True).tolist() == list(Record.byte1.column(VALUES))
+
+    records.set_column("byte1", result & 0xFF)
+    assert list(records.column("byte1")) == [v & 0xFF for v in result.tolist()]
+
+    with pytest.raises(ValueError):
+        records.column("wide", numpy=True)
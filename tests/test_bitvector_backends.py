@@ -0,0 +1,141 @@
+"""
+"""
+
+import pickle
+
+import pytest
+
+from bitvector import BitVector, BitField, ReadOnlyBitField
+
+
+BACKENDS = ["int", "bytes", "words"]
+
+PATTERN = 0xDEAD_BEEF_CAFE_F00D_0123_4567_89AB_CDEF
+
+
+class Register(BitVector):
+    low = BitField(0, 12)
+    mid = BitField(12, 20)
+    top = ReadOnlyBitField(120, 8)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("size", [1, 7, 8, 63, 64, 65, 128, 1000])
+def test_bitvector_backend_create(backend: str, size: int):
+
+    bv = BitVector(PATTERN, size=size, backend=backend)
+
+    assert bv.backend == backend
+    assert len(bv) == size
+    assert bv.value == PATTERN & ((1 << size) - 1)
+
+
+@pytest.mark.fast
+def test_bitvector_backend_unknown():
+
+    with pytest.raises(ValueError):
+        BitVector(backend="abacus")
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("offset", [0, 1, 7, 8, 63, 64, 127])
+def test_bitvector_backend_single_bits(backend: str, offset: int):
+
+    bv = BitVector(backend=backend)
+
+    bv[offset] = 1
+    assert bv[offset] == 1
+    assert bv.value == 1 << offset
+
+    assert bv.toggle(offset) == 1
+    assert bv.value == 0
+
+    bv.set()
+    bv[offset] = 0
+    assert bv.value == bv.MAX ^ (1 << offset)
+
+    with pytest.raises(IndexError):
+        bv[len(bv)] = 1
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize(
+    "key", [slice(3, 70), slice(0, 8), slice(1, 127, 3), slice(100, 2, -7)]
+)
+def test_bitvector_backend_slices(backend: str, key: slice):
+
+    bv = BitVector(PATTERN, backend=backend)
+    reference = BitVector(PATTERN)
+
+    assert bv[key] == reference[key]
+
+    bv[key] = 0x1234_5678_9ABC
+    reference[key] = 0x1234_5678_9ABC
+
+    assert bv.value == reference.value
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_bitvector_backend_operators(backend: str):
+
+    a = BitVector(PATTERN, backend=backend)
+    b = BitVector(0xFFFF_0000, backend=backend)
+
+    for result, expected in [
+        (a & b, PATTERN & 0xFFFF_0000),
+        (a | b, PATTERN | 0xFFFF_0000),
+        (a ^ b, PATTERN ^ 0xFFFF_0000),
+        (~a, ~PATTERN & a.MAX),
+        (a << 4, (PATTERN << 4) & a.MAX),
+        (a >> 4, PATTERN >> 4),
+    ]:
+        assert isinstance(result, BitVector)
+        assert result.backend == backend
+        assert result.value == expected
+
+    a &= b
+    assert a.value == PATTERN & 0xFFFF_0000
+    assert a.backend == backend
+    assert a == b & PATTERN
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_bitvector_backend_bitfields(backend: str):
+
+    reg = Register(PATTERN, backend=backend)
+
+    assert reg.low == PATTERN & 0xFFF
+    assert reg.mid == (PATTERN >> 12) & 0xF_FFFF
+    assert reg.top == 0xDE
+
+    reg.mid = 0xABCDE
+    assert reg.mid == 0xABCDE
+    assert reg.low == PATTERN & 0xFFF
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_bitvector_backend_display_and_truth(backend: str):
+
+    bv = BitVector(0xF00D, size=16, backend=backend)
+
+    assert str(bv) == "0xf00d"
+    assert bv.bytes == b"\xf0\x0d"
+    assert bool(bv)
+    assert not BitVector(size=16, backend=backend)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_bitvector_backend_pickle(backend: str):
+
+    bv = BitVector(PATTERN, backend=backend)
+    result = pickle.loads(pickle.dumps(bv))
+
+    assert result.backend == backend
+    assert result == bv
@@ -0,0 +1,165 @@
+"""
+"""
+
+import sys
+
+from array import array
+
+import pytest
+
+from bitvector import BitVector, BitField
+
+
+LAYOUTS = [
+    ("little", "lsb"),
+    ("big", "lsb"),
+    ("little", "msb"),
+    ("big", "msb"),
+]
+
+
+def reference_value(data: bytes, byteorder: str, bit_order: str) -> int:
+    if bit_order == "msb":
+        data = bytes(int(f"{b:08b}"[::-1], 2) for b in data)
+    return int.from_bytes(data, byteorder)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("byteorder, bit_order", LAYOUTS)
+def test_bitvector_from_buffer_value(byteorder: str, bit_order: str):
+
+    data = bytearray(b"\x01\x80\x3c\xa5\xff\x00")
+    bv = BitVector.from_buffer(data, byteorder=byteorder, bit_order=bit_order)
+
+    assert len(bv) == len(data) * 8
+    assert bv.value == reference_value(data, byteorder, bit_order)
+
+    expected = BitVector(bv.value, size=len(bv))
+    for key in [slice(0, 8), slice(3, 29), slice(5, 45, 3), slice(40, 2, -1)]:
+        assert bv[key] == expected[key]
+
+    for offset in range(len(bv)):
+        assert bv[offset] == expected[offset]
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("byteorder, bit_order", LAYOUTS)
+def test_bitvector_from_buffer_writes_through(byteorder: str, bit_order: str):
+
+    data = bytearray(6)
+    bv = BitVector.from_buffer(data, byteorder=byteorder, bit_order=bit_order)
+    expected = BitVector(size=len(bv))
+
+    for key, value in [(0, 1), (13, 1), (47, 1), (slice(9, 30), 0x1BEEF), (13, 0)]:
+        bv[key] = value
+        expected[key] = value
+
+    bv.toggle(20)
+    expected.toggle(20)
+
+    assert bv.value == expected.value
+    assert reference_value(data, byteorder, bit_order) == expected.value
+
+    bv |= 0xFF
+    assert reference_value(data, byteorder, bit_order) == expected.value | 0xFF
+
+    bv.clear()
+    assert data == bytearray(6)
+
+
+@pytest.mark.fast
+def test_bitvector_from_buffer_shares_memory():
+
+    data = bytearray(b"\x00\x00")
+    bv = BitVector.from_buffer(data)
+
+    data[0] = 0x80
+
+    assert bv[15] == 1
+    assert bv.to_buffer().obj is data
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("obj", [b"\xde\xad", memoryview(b"\xde\xad"), array("H", [0xADDE])])
+def test_bitvector_from_buffer_sources(obj):
+
+    bv = BitVector.from_buffer(obj, byteorder="big")
+
+    assert bv == 0xDEAD
+
+
+@pytest.mark.fast
+def test_bitvector_from_buffer_read_only():
+
+    bv = BitVector.from_buffer(b"\x00\x01")
+
+    assert bv[0] == 1
+
+    with pytest.raises(TypeError):
+        bv[0] = 0
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("args", [(b"",), (b"\x00", "middle"), (b"\x00", "big", "mid")])
+def test_bitvector_from_buffer_invalid(args):
+
+    with pytest.raises(ValueError):
+        BitVector.from_buffer(*args)
+
+
+@pytest.mark.fast
+def test_bitvector_from_buffer_subclass_fields():
+
+    class Header(BitVector):
+        version = BitField(28, 4)
+        length = BitField(0, 16)
+
+    packet = bytearray(b"\x45\x00\x00\x54")
+    header = Header.from_buffer(packet)
+
+    assert header.version == 4
+    assert header.length == 0x54
+
+    header.length = 0x1234
+    assert packet == bytearray(b"\x45\x00\x12\x34")
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", ["bytes", "words"])
+def test_bitvector_to_buffer_zero_copy(backend: str):
+
+    bv = BitVector(0x1234, size=16, backend=backend)
+    view = bv.to_buffer()
+
+    assert bytes(view) == b"\x34\x12"
+
+    view[0] = 0xFF
+    assert bv == 0x12FF
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("byteorder, bit_order", LAYOUTS)
+def test_bitvector_to_buffer_copy(byteorder: str, bit_order: str):
+
+    bv = BitVector(0x1234_5678, size=32)
+    view = bv.to_buffer(byteorder, bit_order)
+
+    assert view.readonly
+    assert reference_value(bytes(view), byteorder, bit_order) == 0x1234_5678
+
+
+@pytest.mark.fast
+def test_bitvector_to_buffer_defaults_match_bytes():
+
+    bv = BitVector(0xCAFE, size=16)
+
+    assert bytes(bv.to_buffer()) == bv.bytes
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="PEP 688")
+@pytest.mark.fast
+def test_bitvector_buffer_protocol():
+
+    bv = BitVector(0xBEEF, size=16, backend="bytes")
+
+    assert bytes(memoryview(bv)) == b"\xef\xbe"
@@ -0,0 +1,114 @@
+"""
+"""
+
+import random
+
+import pytest
+
+from bitvector import BitVector, BitField, ReadOnlyBitField
+from bitvector.codec import RecordCodec
+
+
+class Command(BitVector):
+    def __init__(self, value: int = 0):
+        super().__init__(value, size=32)
+
+    power = BitField(0, 1)
+    spin = BitField(1, 1)
+    speed = BitField(2, 4)
+    sense = BitField(6, 2)
+    red = BitField(8, 8)
+    blue = BitField(16, 8)
+    green = ReadOnlyBitField(24, 8)
+
+
+class PlainCommand(Command, codegen=False):
+    pass
+
+
+class ExtendedCommand(Command):
+    spin = None
+    extra = BitField(28, 4)
+
+
+NAMES = ["power", "spin", "speed", "sense", "red", "blue", "green"]
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("cls", [Command, PlainCommand])
+def test_codec_unpack(cls: type):
+
+    for _ in range(100):
+        bv = cls(random.getrandbits(32))
+        expected = {name: getattr(bv, name) for name in NAMES}
+
+        assert bv.unpack() == expected
+        assert bv.unpack(as_dict=False) == tuple(expected.values())
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("cls", [Command, PlainCommand])
+def test_codec_pack(cls: type):
+
+    bv = cls(0xFF00_0000)
+    result = bv.pack(power=1, speed=5, red=0xAA, blue=0x1BB)
+
+    assert result is bv
+    assert bv == 0xFFBB_AA15
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("cls", [Command, PlainCommand])
+def test_codec_pack_rejects_read_only_and_unknown(cls: type):
+
+    bv = cls()
+
+    with pytest.raises(TypeError):
+        bv.pack(green=1)
+
+    with pytest.raises(TypeError):
+        bv.pack(purple=1)
+
+    assert bv == 0
+
+
+@pytest.mark.fast
+def test_codec_compiled_from_class():
+
+    assert Command._codec.names == tuple(NAMES)
+    assert Command._codec.codegen
+    assert not PlainCommand._codec.codegen
+    assert BitVector._codec.names == ()
+    assert BitVector().unpack() == {}
+
+
+@pytest.mark.fast
+def test_codec_inherited_fields():
+
+    assert ExtendedCommand._codec.names == ("power", "speed", "sense", "red", "blue", "green", "extra")
+
+    bv = ExtendedCommand(0x1234_5678)
+    assert bv.unpack()["extra"] == 0x1
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("codegen", [True, False])
+def test_codec_standalone(codegen: bool):
+
+    codec = RecordCodec([("low", 0, 4, True), ("high", 4, 4, False)], codegen=codegen)
+
+    assert len(codec) == 2
+    assert codec.unpack(0xA5) == (0x5, 0xA)
+    assert codec.unpack_dict(0xA5) == {"low": 0x5, "high": 0xA}
+    assert codec.pack(0xA5, low=0xF) == 0xAF
+
+    with pytest.raises(TypeError):
+        codec.pack(0, high=1)
+
+
+@pytest.mark.fast
+def test_codec_without_writable_fields():
+
+    codec = RecordCodec([("status", 0, 8, False)])
+
+    assert codec.pack(0x12) == 0x12
@@ -0,0 +1,91 @@
+"""
+"""
+
+import pickle
+
+import pytest
+
+from bitvector import BitVector, BitField
+from bitvector.bitvector import MASK_CACHE_BITS, metadata
+
+
+class Pickled(BitVector):
+    low = BitField(0, 4)
+
+
+@pytest.mark.fast
+def test_bitvector_has_no_instance_dict():
+
+    bv = BitVector()
+
+    assert not hasattr(bv, "__dict__")
+
+    with pytest.raises(AttributeError):
+        bv.extra = 1
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("size", [1, 8, 31, 128, 4096])
+def test_bitvector_metadata_shared_by_size(size: int):
+
+    a = BitVector(size=size)
+    b = BitVector(1, size=size)
+
+    assert a._meta is b._meta
+    assert a._meta is metadata(size)
+    assert a._meta.size == size
+    assert a._meta.mask == (1 << size) - 1
+    assert a._meta.nibbles == len(hex((1 << size) - 1)) - 2
+    assert a._meta.nbytes == len(a.bytes)
+
+
+@pytest.mark.fast
+def test_bitvector_wide_mask_not_kept():
+
+    size = MASK_CACHE_BITS + 8
+    bv = BitVector(-1, size=size, backend="bytes")
+
+    assert bv.count() == size
+    assert BitVector(1 << size | 5, size=size, backend="bytes") == 5
+    assert bv.MAX == (1 << size) - 1
+
+    with pytest.raises(AttributeError):
+        object.__getattribute__(bv._meta, "mask")
+
+    bv.value = -2
+    assert bv.count() == size - 1
+
+
+@pytest.mark.fast
+def test_bitvector_max_is_read_only():
+
+    bv = BitVector(size=8)
+
+    assert bv.MAX == 0xFF
+
+    with pytest.raises(AttributeError):
+        bv.MAX = 0xF
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("size", [1, 16, 128])
+def test_bitvector_pickle_round_trip(size: int):
+
+    bv = BitVector((1 << size) - 2, size=size)
+    result = pickle.loads(pickle.dumps(bv))
+
+    assert result == bv
+    assert len(result) == size
+    assert result._meta is bv._meta
+
+
+@pytest.mark.fast
+def test_bitvector_subclass_pickle_keeps_attributes():
+
+    bv = Pickled(0xA5, size=8)
+    bv.note = "kept"
+
+    result = pickle.loads(pickle.dumps(bv))
+
+    assert result.low == 0x5
+    assert result.note == "kept"
@@ -0,0 +1,131 @@
+"""
+"""
+
+import pytest
+
+from bitvector import BitVector, BitField
+
+
+LAYOUTS = [
+    ("little", "lsb"),
+    ("big", "lsb"),
+    ("little", "msb"),
+    ("big", "msb"),
+]
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "vector.bits"
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("byteorder, bit_order", LAYOUTS)
+def test_bitvector_open_round_trip(path, byteorder: str, bit_order: str):
+
+    with BitVector.open(path, size=4096, mode="w+", byteorder=byteorder, bit_order=bit_order) as bv:
+        assert len(bv) == 4096
+        assert bv.value == 0
+        bv[7] = 1
+        bv[100:140] = 0xDEADBEEF5
+        bv[-1] = 1
+
+    assert path.stat().st_size == 512
+
+    expected = BitVector(size=4096)
+    expected[7] = 1
+    expected[100:140] = 0xDEADBEEF5
+    expected[-1] = 1
+
+    with BitVector.open(path, byteorder=byteorder, bit_order=bit_order) as bv:
+        assert bv == expected
+        assert bv[100:140] == 0xDEADBEEF5
+
+
+@pytest.mark.fast
+def test_bitvector_open_layout_matches_bytes_backend(path):
+
+    path.write_bytes(bytes([0x01, 0x80, 0x00, 0xFF]))
+
+    with BitVector.open(path) as bv:
+        assert bv.backend == "bytes"
+        assert bv.value == int.from_bytes(path.read_bytes(), "little")
+        assert list(bv.iter_ones()) == [0, 15, 24, 25, 26, 27, 28, 29, 30, 31]
+
+
+@pytest.mark.fast
+def test_bitvector_open_modes(path):
+
+    path.write_bytes(bytes(64))
+
+    with BitVector.open(path) as bv:
+        with pytest.raises(TypeError):
+            bv[0] = 1
+
+    with BitVector.open(path, mode="r+", size=256) as bv:
+        assert len(bv) == 256
+        bv.set()
+        bv.flush()
+        assert path.read_bytes() == bytes([0xFF]) * 32 + bytes(32)
+
+    with pytest.raises(ValueError):
+        BitVector.open(path, mode="a")
+
+    with pytest.raises(ValueError):
+        BitVector.open(path, mode="w+")
+
+    with pytest.raises(ValueError):
+        BitVector.open(path, size=12)
+
+    with pytest.raises(ValueError):
+        BitVector.open(path, size=1024)
+
+    with pytest.raises(FileNotFoundError):
+        BitVector.open(path.with_name("missing.bits"))
+
+
+@pytest.mark.fast
+def test_bitvector_open_inplace_ops(path):
+
+    other = BitVector(size=1 << 16, backend="bytes")
+    other[::3] = True
+
+    with BitVector.open(path, size=1 << 16, mode="w+") as bv:
+        bv[::2] = True
+        bv |= other
+        expected = BitVector(bv.value, size=1 << 16)
+        bv &= other
+        expected &= other
+        assert bv == expected
+        bv ^= other
+        assert bv.count() == 0
+
+
+@pytest.mark.fast
+def test_bitvector_open_bitfields(path):
+    class Header(BitVector):
+        kind = BitField(0, 4)
+        length = BitField(4, 12)
+
+    with Header.open(path, size=16, mode="w+") as header:
+        header.kind = 3
+        header.length = 0xABC
+
+    with Header.open(path) as header:
+        assert header.kind == 3
+        assert header.length == 0xABC
+
+
+@pytest.mark.fast
+def test_bitvector_flush_close_not_mapped():
+
+    bv = BitVector(size=64)
+
+    with pytest.raises(TypeError):
+        bv.flush()
+
+    with pytest.raises(TypeError):
+        bv.close()
+
+    with pytest.raises(TypeError):
+        BitVector.from_buffer(bytearray(8)).flush()
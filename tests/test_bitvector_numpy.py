@@ -0,0 +1,99 @@
+"""
+"""
+
+import pytest
+
+from bitvector import BitVector
+
+np = pytest.importorskip("numpy")
+
+
+PATTERN = 0xDEAD_BEEF_CAFE_F00D_0123_4567_89AB_CDEF
+
+
+def bits_of(value: int, size: int) -> list:
+    return [bool((value >> n) & 0x1) for n in range(size)]
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("size", [1, 7, 64, 100, 128])
+@pytest.mark.parametrize("backend", ["int", "bytes", "words"])
+def test_bitvector_to_numpy_bool(size: int, backend: str):
+
+    bv = BitVector(PATTERN, size=size, backend=backend)
+    result = bv.to_numpy()
+
+    assert result.dtype == np.bool_
+    assert result.tolist() == bits_of(bv.value, size)
+
+
+@pytest.mark.fast
+def test_bitvector_to_numpy_uint8_matches_packbits():
+
+    bv = BitVector(PATTERN, size=100)
+    bools = bv.to_numpy(bool)
+
+    assert np.array_equal(bv.to_numpy(np.uint8, bit_order="msb"), np.packbits(bools))
+    assert np.array_equal(
+        bv.to_numpy(np.uint8), np.packbits(bools, bitorder="little")
+    )
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("bit_order", ["lsb", "msb"])
+def test_bitvector_to_numpy_uint64(bit_order: str):
+
+    bv = BitVector(PATTERN, size=100)
+    words = bv.to_numpy(np.uint64, bit_order=bit_order)
+
+    assert words.dtype == np.uint64
+    assert len(words) == 2
+
+    for n in range(len(bv)):
+        word = int(words[n // 64])
+        shift = n % 64 if bit_order == "lsb" else 63 - n % 64
+        assert (word >> shift) & 0x1 == bv[n]
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("dtype", [bool, np.uint8, np.uint64])
+@pytest.mark.parametrize("bit_order", ["lsb", "msb"])
+def test_bitvector_numpy_round_trip(dtype, bit_order: str):
+
+    bv = BitVector(PATTERN, size=128)
+    arr = bv.to_numpy(dtype, bit_order=bit_order)
+    result = BitVector.from_numpy(arr, bit_order=bit_order)
+
+    assert len(result) == 128
+    assert result == bv
+
+
+@pytest.mark.fast
+def test_bitvector_from_numpy_bool_size():
+
+    result = BitVector.from_numpy(np.array([1, 0, 1, 1, 0], dtype=bool))
+
+    assert len(result) == 5
+    assert result == 0b01101
+
+
+@pytest.mark.fast
+def test_bitvector_from_numpy_explicit_size():
+
+    result = BitVector.from_numpy(np.array([0xFF, 0xFF], dtype=np.uint8), size=12)
+
+    assert len(result) == 12
+    assert result == 0xFFF
+
+
+@pytest.mark.fast
+def test_bitvector_numpy_invalid():
+
+    with pytest.raises(TypeError):
+        BitVector.from_numpy(np.zeros(4, dtype=np.float32))
+
+    with pytest.raises(TypeError):
+        BitVector(1).to_numpy(np.int32)
+
+    with pytest.raises(ValueError):
+        BitVector(1).to_numpy(bit_order="middle")
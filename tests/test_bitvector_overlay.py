@@ -0,0 +1,147 @@
+"""
+"""
+
+import pytest
+
+from bitvector import BitVector, BitField, ReadOnlyBitField
+
+
+class UDPHeader(BitVector):
+    sport = BitField(48, 16)
+    dport = BitField(32, 16)
+    length = BitField(16, 16)
+    checksum = ReadOnlyBitField(0, 16)
+
+
+PACKETS = bytes.fromhex("c0de0035001c0000" "04d2006f0010abcd" "ffff000100080001")
+
+
+@pytest.mark.fast
+def test_bitvector_overlay_reads_buffer():
+
+    buf = bytearray(b"\xee" + PACKETS)
+    udp = UDPHeader.overlay(buf, offset=1)
+
+    assert len(udp) == 64
+    assert udp.value == int.from_bytes(PACKETS[:8], "big")
+    assert udp.unpack() == {"sport": 0xC0DE, "dport": 53, "length": 28, "checksum": 0}
+    assert udp.to_buffer().tobytes() == PACKETS[:8]
+
+
+@pytest.mark.fast
+def test_bitvector_overlay_writes_buffer():
+
+    buf = bytearray(PACKETS)
+    udp = UDPHeader.overlay(buf, offset=8)
+
+    udp.dport = 80
+    udp[0] = 0
+
+    assert buf[:8] == PACKETS[:8]
+    assert buf[8:16] == bytes.fromhex("04d200500010abcc")
+    assert buf[16:] == PACKETS[16:]
+
+    with pytest.raises(TypeError):
+        udp.checksum = 1
+
+
+@pytest.mark.fast
+def test_bitvector_overlay_repoint():
+
+    buf = bytearray(PACKETS)
+    udp = UDPHeader.overlay(buf)
+    window = udp._value
+
+    assert udp.repoint(16) is udp
+    assert udp._value is window
+    assert udp.sport == 0xFFFF
+
+    other = bytes(8)
+    udp.repoint(0, other)
+    assert udp.value == 0
+
+    with pytest.raises(ValueError):
+        udp.repoint(1)
+
+    with pytest.raises(TypeError):
+        BitVector(0, size=64).repoint(0)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("stride", [None, 8, 16])
+def test_bitvector_iter_overlay(stride):
+
+    records = [(h.sport, h.dport) for h in UDPHeader.iter_overlay(PACKETS, stride)]
+
+    expected = [(0xC0DE, 53), (1234, 111), (0xFFFF, 1)]
+
+    assert records == expected[:: (stride or 8) // 8]
+    assert len({id(h) for h in UDPHeader.iter_overlay(PACKETS)}) == 1
+
+
+@pytest.mark.fast
+def test_bitvector_iter_overlay_scans_each_record():
+
+    records = bytes.fromhex("0100" "ffff" "0000")
+
+    found = [
+        (bv.find_first_set(), bv.rank(1), list(bv.iter_ones()), bv.count())
+        for bv in BitVector.iter_overlay(records, size=16)
+    ]
+
+    assert found == [(8, 0, [8], 1), (0, 1, list(range(16)), 16), (-1, 0, [], 0)]
+
+
+@pytest.mark.fast
+def test_bitvector_overlay_read_only_buffer():
+
+    udp = UDPHeader.overlay(PACKETS)
+
+    assert udp.dport == 53
+
+    with pytest.raises(TypeError):
+        udp.dport = 1
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("size, offset", [(12, 0), (0, 0), (64, -1), (64, 17)])
+def test_bitvector_overlay_bad_arguments(size, offset):
+
+    with pytest.raises(ValueError):
+        UDPHeader.overlay(PACKETS, offset=offset, size=size)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("byteorder, bit_order", [("little", "lsb"), ("big", "msb")])
+def test_bitvector_overlay_matches_from_buffer(byteorder: str, bit_order: str):
+
+    buf = bytearray(PACKETS)
+    udp = UDPHeader.overlay(buf, offset=8, byteorder=byteorder, bit_order=bit_order)
+    ref = BitVector.from_buffer(bytearray(PACKETS[8:16]), byteorder=byteorder, bit_order=bit_order)
+
+    assert udp == ref
+    assert udp[5:40:3] == ref[5:40:3]
+
+    udp[3:19] = 0xBEEF
+    ref[3:19] = 0xBEEF
+    assert buf[8:16] == bytes(ref.to_buffer())
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("byteorder", ["little", "big"])
+@pytest.mark.parametrize("offset", [0, 4])
+def test_bitvector_overlay_count_stays_in_window(byteorder: str, offset: int):
+
+    buf = bytearray(b"\xff" * 16)
+    bv = BitVector.overlay(buf, offset=offset, size=32, byteorder=byteorder)
+
+    assert bv.count() == 32
+
+    bv[0:8] = 0
+
+    assert bv.count() == 24
+    assert buf == b"\xff" * offset + bytes(bv.to_buffer()) + b"\xff" * (12 - offset)
+
+    bv.repoint(12)
+
+    assert bv.count() == 32
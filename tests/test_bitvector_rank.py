@@ -0,0 +1,152 @@
+"""
+"""
+
+import random
+
+import pytest
+
+from bitvector import BitVector
+
+
+def reference_ones(value: int, size: int) -> list:
+    return [n for n in range(size) if value >> n & 1]
+
+
+@pytest.fixture(params=[1, 7, 511, 512, 513, 65536 + 700], ids=lambda n: f"size{n}")
+def sized(request):
+    rng = random.Random(request.param)
+    size = request.param
+    return size, rng.getrandbits(size) & rng.getrandbits(size)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", ["int", "bytes", "bytes-big-msb"])
+def test_bitvector_count_rank_select(sized, backend: str):
+
+    size, value = sized
+    bv = BitVector(value, size=size, backend=backend)
+    ones = reference_ones(value, size)
+
+    assert bv.count() == len(ones)
+
+    offsets = {0, size, size // 2, size - 1} | set(random.Random(size).sample(range(size + 1), min(size, 50)))
+    for offset in offsets:
+        assert bv.rank(offset) == sum(1 for n in ones if n < offset)
+
+    for k in {0, len(ones) // 3, len(ones) - 1} if ones else ():
+        assert bv.select(k) == ones[k]
+        assert bv.rank(bv.select(k)) == k
+
+
+@pytest.mark.fast
+def test_bitvector_select_every_one():
+
+    value = 0x8000_0000_0000_0001_0000_0000_0000_00F0 << 500
+    bv = BitVector(value, size=1024)
+
+    assert [bv.select(k) for k in range(bv.count())] == reference_ones(value, 1024)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda bv: bv.set(),
+        lambda bv: bv.clear(),
+        lambda bv: bv.toggle(600),
+        lambda bv: bv.__setitem__(600, 1),
+        lambda bv: bv.__setitem__(slice(100, 700, 3), -1),
+        lambda bv: bv.__ixor__(BitVector(1 << 600, size=1024)),
+        lambda bv: setattr(bv, "value", 12345),
+    ],
+)
+@pytest.mark.parametrize("backend", ["int", "bytes"])
+def test_bitvector_rank_invalidated_on_mutation(mutate, backend: str):
+
+    bv = BitVector(0xF0F0 << 400, size=1024, backend=backend)
+    assert bv.rank(1024) == 8
+
+    mutate(bv)
+
+    assert bv.rank(1024) == bv.count() == bin(bv.value).count("1")
+    assert bv.rank(700) == bin(bv.value & ((1 << 700) - 1)).count("1")
+
+
+@pytest.mark.fast
+def test_bitvector_rank_select_out_of_range():
+
+    bv = BitVector(0b1010, size=16)
+
+    for offset in [-1, 17]:
+        with pytest.raises(IndexError):
+            bv.rank(offset)
+
+    for k in [-1, 2]:
+        with pytest.raises(IndexError):
+            bv.select(k)
+
+    with pytest.raises(IndexError):
+        BitVector(0, size=16).select(0)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", ["int", "bytes", "bytes-big"])
+def test_bitvector_iter_ones_zeros(sized, backend: str):
+
+    size, value = sized
+    bv = BitVector(value, size=size, backend=backend)
+    ones = reference_ones(value, size)
+
+    assert list(bv.iter_ones()) == ones
+    assert list(bv.iter_zeros()) == sorted(set(range(size)) - set(ones))
+
+
+@pytest.mark.fast
+def test_bitvector_iter_ones_sparse_runs():
+
+    offsets = [0, 9, 17, 63, 64, 130, 131, 4000, 4095]
+    bv = BitVector(sum(1 << n for n in offsets), size=4096)
+
+    assert list(bv.iter_ones()) == offsets
+    assert list(BitVector(0, size=100).iter_ones()) == []
+    assert list(BitVector((1 << 100) - 1, size=100).iter_zeros()) == []
+
+
+@pytest.mark.fast
+def test_bitvector_find_set_and_zero(sized):
+
+    size, value = sized
+    bv = BitVector(value, size=size)
+    ones = reference_ones(value, size)
+    zeros = sorted(set(range(size)) - set(ones))
+
+    assert bv.find_first_set() == (ones[0] if ones else -1)
+    assert bv.find_last_set() == (ones[-1] if ones else -1)
+    assert bv.find_first_zero() == (zeros[0] if zeros else -1)
+    assert bv.find_last_zero() == (zeros[-1] if zeros else -1)
+
+    for offset in {0, 1, size // 3, size - 1, size} & set(range(size + 1)):
+        assert bv.find_next_set(offset) == next((n for n in ones if n >= offset), -1)
+        assert bv.find_next_zero(offset) == next((n for n in zeros if n >= offset), -1)
+
+
+@pytest.mark.fast
+def test_bitvector_find_edges():
+
+    full = BitVector((1 << 13) - 1, size=13)
+
+    assert full.find_first_zero() == -1
+    assert full.find_last_zero() == -1
+    assert full.find_next_set(13) == -1
+
+    bv = BitVector(0, size=13)
+    bv[12] = 1
+    assert bv.find_next_set(0) == 12
+    bv[12] = 0
+    assert bv.find_next_set(0) == -1
+
+    with pytest.raises(IndexError):
+        bv.find_next_set(14)
+
+    with pytest.raises(IndexError):
+        bv.find_next_zero(-1)
@@ -0,0 +1,163 @@
+"""
+"""
+
+import operator
+import subprocess
+import sys
+
+import pytest
+
+from bitvector import BitVector
+from bitvector import backends
+from bitvector.backends import BytesBackend, get_backend, register_backend
+
+
+class CountingBackend(BytesBackend):
+    name = "counting"
+    calls = []
+
+    @staticmethod
+    def binary_op(func, store, other, inplace):
+        if func is not operator.and_:
+            return NotImplemented
+        CountingBackend.calls.append(inplace)
+        result = bytes(a & b for a, b in zip(store, other))
+        if inplace:
+            store[:] = result
+            return store
+        return memoryview(bytearray(result))
+
+
+register_backend("counting", CountingBackend)
+register_backend("lazy-bytes", "bitvector.backends:BytesBackend")
+
+
+@pytest.mark.fast
+def test_backend_registry_names():
+
+    names = backends.backend_names()
+
+    for name in ["int", "bytes", "words", "numpy", "counting", "lazy-bytes"]:
+        assert name in names
+
+
+@pytest.mark.fast
+def test_backend_registry_duplicate_name():
+
+    with pytest.raises(ValueError):
+        register_backend("int", BytesBackend)
+
+
+@pytest.mark.fast
+def test_backend_registry_unknown_name():
+
+    with pytest.raises(ValueError):
+        get_backend("abacus")
+
+
+@pytest.mark.fast
+def test_backend_registry_lazy_entry_resolved_on_first_use():
+
+    bv = BitVector(0xFF00, size=16, backend="lazy-bytes")
+
+    assert get_backend("lazy-bytes") is BytesBackend
+    assert backends._REGISTRY["lazy-bytes"] is BytesBackend
+    assert bv[8:16] == 0xFF
+
+
+@pytest.mark.fast
+def test_backend_registry_import_does_not_load_numpy():
+
+    code = "import sys, bitvector; sys.exit('numpy' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code])
+
+    assert result.returncode == 0
+
+
+@pytest.mark.fast
+def test_import_does_not_load_optional_modules():
+
+    modules = ["bitvector.bitvectorarray", "bitvector.roaring", "bitvector.ewah", "bitvector.frozen", "bitvector.instrument"]
+    code = f"import sys, bitvector; sys.exit(any(m in sys.modules for m in {modules!r}))"
+    result = subprocess.run([sys.executable, "-c", code])
+
+    assert result.returncode == 0
+
+
+@pytest.mark.fast
+def test_import_resolves_optional_names_on_first_use():
+
+    import bitvector
+
+    from bitvector.roaring import RoaringBitmap
+
+    assert bitvector.RoaringBitmap is RoaringBitmap
+    assert set(bitvector.__all__) <= set(dir(bitvector))
+
+    with pytest.raises(AttributeError):
+        bitvector.NoSuchName
+
+
+@pytest.mark.fast
+def test_backend_native_binary_op_same_backend():
+
+    CountingBackend.calls.clear()
+
+    a = BitVector(0xF0F0, size=16, backend="counting")
+    b = BitVector(0xFF00, size=16, backend="counting")
+
+    result = a & b
+
+    assert result.backend == "counting"
+    assert result == 0xF000
+
+    a &= b
+    assert a == 0xF000
+
+    assert CountingBackend.calls == [False, True]
+
+    assert (a | b) == 0xFF00
+    assert CountingBackend.calls == [False, True]
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("left, right", [("words", "int"), ("int", "bytes"), ("counting", "words")])
+def test_backend_mixed_binary_ops(left: str, right: str):
+
+    a = BitVector(0xF0F0, size=16, backend=left)
+    b = BitVector(0xFF00, size=16, backend=right)
+
+    for result, expected in [(a & b, 0xF000), (a | b, 0xFFF0), (a ^ b, 0x0FF0)]:
+        assert result.backend == left
+        assert result == expected
+
+    a ^= b
+    assert a.backend == left
+    assert a == 0x0FF0
+
+
+@pytest.mark.fast
+def test_backend_mixed_sizes_use_smaller_size():
+
+    a = BitVector(0xFFFF, size=16, backend="words")
+    b = BitVector(0xFF, size=8, backend="words")
+
+    result = a & b
+
+    assert len(result) == 8
+    assert result == 0xFF
+
+
+@pytest.mark.fast
+def test_backend_numpy():
+
+    pytest.importorskip("numpy")
+
+    a = BitVector(0xF0F0, size=16, backend="numpy")
+    b = BitVector(0xFF00, size=16, backend="numpy")
+
+    assert (a & b) == 0xF000
+    assert (a | b).backend == "numpy"
+
+    a[0] = 1
+    assert a == 0xF0F1
@@ -0,0 +1,105 @@
+"""
+"""
+
+import random
+
+import pytest
+
+from bitvector import BitVector
+
+
+def reference_runs(value: int, size: int, bit: int) -> list:
+    runs, begin = [], None
+    for n in range(size + 1):
+        if n < size and (value >> n & 1) == bit:
+            if begin is None:
+                begin = n
+        elif begin is not None:
+            runs.append((begin, n - begin))
+            begin = None
+    return runs
+
+
+def fragmented(size: int, seed: int) -> int:
+    rng = random.Random(seed)
+    value, offset = 0, 0
+    while offset < size:
+        length = rng.choice([1, 2, 3, 7, 9, 20, 64, 100])
+        if rng.random() < 0.5:
+            value |= ((1 << length) - 1) << offset
+        offset += length
+    return value & ((1 << size) - 1)
+
+
+@pytest.fixture(params=[(1, 0), (13, 1), (64, 2), (1000, 3), (4099, 4)], ids=lambda p: f"size{p[0]}")
+def bitmap(request):
+    size, seed = request.param
+    return size, fragmented(size, seed)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", ["int", "bytes", "bytes-big"])
+@pytest.mark.parametrize("bit", [1, 0])
+def test_bitvector_iter_runs(bitmap, backend: str, bit: int):
+
+    size, value = bitmap
+    bv = BitVector(value, size=size, backend=backend)
+
+    assert list(bv.iter_runs(bit)) == reference_runs(value, size, bit)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("bit", [0, 1])
+@pytest.mark.parametrize("length", [1, 3, 8, 15, 16, 23, 40, 64, 90, 200])
+def test_bitvector_find_run(bitmap, bit: int, length: int):
+
+    size, value = bitmap
+    bv = BitVector(value, size=size, backend="bytes")
+    runs = reference_runs(value, size, bit)
+
+    for start in {0, 5, size // 2} & set(range(size + 1)):
+        expected = next((max(b, start) for b, n in runs if b + n - max(b, start) >= length), -1)
+        assert bv.find_run(length, bit, start) == expected
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", ["int", "bytes", "words"])
+def test_bitvector_allocate_free(backend: str):
+
+    bv = BitVector(0, size=256, backend=backend)
+
+    assert bv.allocate(10) == 0
+    assert bv.allocate(100) == 10
+    assert bv.allocate(1) == 110
+    assert bv.count() == 111
+
+    bv.free(10, 100)
+    assert bv.allocate(120) == 111
+    assert bv.allocate(50) == 10
+    assert bv.allocate(50) == 60
+    assert bv.find_run(1) == 231
+
+    with pytest.raises(ValueError):
+        bv.allocate(26)
+
+    assert bv.allocate(25) == 231
+    assert bv.find_first_zero() == -1
+
+
+@pytest.mark.fast
+def test_bitvector_run_errors():
+
+    bv = BitVector(0, size=64)
+
+    with pytest.raises(ValueError):
+        bv.find_run(0)
+
+    with pytest.raises(IndexError):
+        bv.find_run(1, start=65)
+
+    with pytest.raises(IndexError):
+        bv.free(60, 5)
+
+    assert bv.find_run(65) == -1
+    assert bv.find_run(64) == 0
+    assert bv.find_run(4, value=1) == -1
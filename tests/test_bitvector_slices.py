@@ -0,0 +1,87 @@
+"""
+"""
+
+import pytest
+
+from bitvector import BitVector
+
+
+def reference_get(value: int, key: slice, size: int) -> int:
+    result = 0
+    for n, b in enumerate(range(*key.indices(size))):
+        result |= ((value >> b) & 0x1) << n
+    return result
+
+
+def reference_set(value: int, key: slice, size: int, bits: int) -> int:
+    for n, b in enumerate(range(*key.indices(size))):
+        if (bits >> n) & 0x1:
+            value |= 1 << b
+        else:
+            value &= ~(1 << b)
+    return value
+
+
+PATTERN = 0xDEAD_BEEF_CAFE_F00D_0123_4567_89AB_CDEF
+
+SLICES = [
+    slice(None),
+    slice(0, 1),
+    slice(3, 67),
+    slice(64, 128),
+    slice(5, 5),
+    slice(100, 20),
+    slice(None, None, 2),
+    slice(1, 127, 3),
+    slice(7, 100, 13),
+    slice(None, None, 128),
+    slice(None, None, -1),
+    slice(100, 3, -1),
+    slice(127, None, -5),
+    slice(-10, None),
+    slice(-1, -20, -2),
+    slice(20, 100, -1),
+]
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("key", SLICES)
+def test_bitvector_slice_get_matches_reference(key: slice):
+
+    bv = BitVector(PATTERN)
+
+    assert bv[key] == reference_get(PATTERN, key, len(bv))
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("key", SLICES)
+@pytest.mark.parametrize("bits", [0, 1, 0x5A5A_5A5A, (1 << 200) - 1])
+def test_bitvector_slice_set_matches_reference(key: slice, bits: int):
+
+    bv = BitVector(PATTERN)
+    bv[key] = bits
+
+    assert bv.value == reference_set(PATTERN, key, len(bv), bits)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("key", SLICES)
+@pytest.mark.parametrize("flag", [True, False])
+def test_bitvector_slice_set_bool_matches_reference(key: slice, flag: bool):
+
+    bv = BitVector(PATTERN)
+    bv[key] = flag
+
+    expected = reference_set(PATTERN, key, len(bv), -1 if flag else 0)
+
+    assert bv.value == expected
+
+
+@pytest.mark.fast
+def test_bitvector_slice_wide_vector_field():
+
+    bv = BitVector(size=4096)
+    bv[4000:4032] = 0xFEEDFACE
+
+    assert bv[4000:4032] == 0xFEEDFACE
+    assert bv.value == 0xFEEDFACE << 4000
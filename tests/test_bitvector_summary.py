@@ -0,0 +1,89 @@
+"""
+"""
+
+import random
+
+import pytest
+
+from bitvector import BitVector
+from bitvector._summary import build
+
+
+SIZE = 64 * 64 * 3 + 5
+
+
+def assert_consistent(bv: BitVector) -> None:
+    levels = bv._value
+    assert [list(level) for level in levels] == [list(level) for level in build(levels[0])]
+
+    value = bv.value
+    ones = [n for n in range(len(bv)) if value >> n & 1]
+    assert list(bv.iter_ones()) == ones
+    assert bv.find_first_set() == (ones[0] if ones else -1)
+    assert bv.find_last_set() == (ones[-1] if ones else -1)
+    assert bool(bv) == bool(ones)
+    for offset in [0, 63, 64, 4095, 4096, SIZE // 2, SIZE - 1, SIZE]:
+        assert bv.find_next_set(offset) == next((n for n in ones if n >= offset), -1)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("size", [1, 64, 65, 4096, 4097, SIZE])
+def test_bitvector_summary_matches_int(size: int):
+
+    value = random.Random(size).getrandbits(size) & random.Random(-size).getrandbits(size)
+    bv = BitVector(value, size=size, backend="summary")
+
+    assert bv.backend == "summary"
+    assert bv == BitVector(value, size=size)
+    assert bv[3:size:7] == BitVector(value, size=size)[3:size:7]
+    assert len(bv._value[-1]) == 1
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda bv: bv.__setitem__(5000, 1),
+        lambda bv: bv.__setitem__(5000, 0),
+        lambda bv: bv.__setitem__(slice(100, 9000), 0),
+        lambda bv: bv.__setitem__(slice(4000, 4200), -1),
+        lambda bv: bv.__setitem__(slice(1, SIZE, 97), -1),
+        lambda bv: bv.toggle(12000),
+        lambda bv: bv.toggle(12001),
+        lambda bv: bv.clear(),
+        lambda bv: bv.set(),
+        lambda bv: bv.__iand__(1 << 10000),
+        lambda bv: bv.__ior__(BitVector(1 << 64, size=SIZE)),
+        lambda bv: bv.__ixor__(BitVector(1 << 12001, size=SIZE, backend="summary")),
+        lambda bv: bv.__ilshift__(700),
+    ],
+)
+def test_bitvector_summary_consistent_after_mutation(mutate):
+
+    bv = BitVector(0, size=SIZE, backend="summary")
+    for offset in [3, 64, 4096, 12001, SIZE - 1]:
+        bv[offset] = 1
+    assert_consistent(bv)
+
+    mutate(bv)
+    assert_consistent(bv)
+
+
+@pytest.mark.fast
+def test_bitvector_summary_random_walk():
+
+    rng = random.Random(14)
+    bv = BitVector(0, size=SIZE, backend="summary")
+    ref = 0
+
+    for _ in range(300):
+        offset = rng.randrange(SIZE)
+        if rng.random() < 0.5:
+            bv[offset] = 1
+            ref |= 1 << offset
+        else:
+            bv[offset] = 0
+            ref &= ~(1 << offset)
+
+    assert bv.value == ref
+    assert_consistent(bv)
@@ -0,0 +1,189 @@
+"""
+"""
+
+import operator
+
+import pytest
+
+from bitvector import BitVector, BitVectorArray, BitField
+
+
+VALUES = [0x00, 0x01, 0x5A, 0xA5, 0xFF, 0x80, 0x3C, 0x7E]
+
+
+@pytest.fixture(params=[8, 13, 64, 65, 200])
+def size(request) -> int:
+    return request.param
+
+
+def make(values, size):
+    mask = (1 << size) - 1
+    values = [(v * 0x0101_0101_0101_0101_0101_0101_0101) & mask for v in values]
+    return values, BitVectorArray(values, size=size)
+
+
+@pytest.mark.fast
+def test_bitvectorarray_create(size: int):
+
+    values, arr = make(VALUES, size)
+
+    assert len(arr) == len(VALUES)
+    assert arr.size == size
+    assert arr.tolist() == values
+    assert len(arr.words) == len(VALUES) * ((size + 63) // 64)
+
+
+@pytest.mark.fast
+def test_bitvectorarray_zeros():
+
+    arr = BitVectorArray.zeros(10, size=32)
+
+    assert arr.tolist() == [0] * 10
+
+
+@pytest.mark.fast
+def test_bitvectorarray_from_vectors():
+
+    arr = BitVectorArray([BitVector(0xF0, size=8), 0x0F], size=8)
+
+    assert arr.tolist() == [0xF0, 0x0F]
+
+
+@pytest.mark.fast
+def test_bitvectorarray_row_views_write_through(size: int):
+
+    values, arr = make(VALUES, size)
+
+    row = arr[2]
+    assert isinstance(row, BitVector)
+    assert len(row) == size
+    assert row == values[2]
+
+    row[size - 1] = 1
+    row[0:4] = 0x9
+    expected = BitVector(values[2], size=size)
+    expected[size - 1] = 1
+    expected[0:4] = 0x9
+
+    assert arr.tolist()[2] == expected.value
+    assert arr[-6] == expected
+
+    arr[3] = 0
+    assert arr[3] == 0
+
+    with pytest.raises(IndexError):
+        arr[len(arr)]
+
+
+@pytest.mark.fast
+def test_bitvectorarray_slice_copies():
+
+    arr = BitVectorArray(VALUES, size=8)
+    part = arr[1:7:2]
+
+    assert part.tolist() == VALUES[1:7:2]
+
+    part[0] = 0xEE
+    assert arr[1] == VALUES[1]
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("func", [operator.and_, operator.or_, operator.xor])
+def test_bitvectorarray_binary_ops(size: int, func):
+
+    values, arr = make(VALUES, size)
+    others, other = make(VALUES[::-1], size)
+    mask = (1 << size) - 1
+
+    assert func(arr, other).tolist() == [func(a, b) for a, b in zip(values, others)]
+    assert func(arr, 0x33).tolist() == [func(a, 0x33) & mask for a in values]
+    assert func(0x33, arr).tolist() == [func(a, 0x33) & mask for a in values]
+
+    inplace = BitVectorArray(values, size=size)
+    inplace = func(inplace, other)
+    assert inplace.tolist() == [func(a, b) for a, b in zip(values, others)]
+
+
+@pytest.mark.fast
+def test_bitvectorarray_inplace_ops(size: int):
+
+    values, arr = make(VALUES, size)
+    words = arr.words
+
+    arr &= 0x0F
+    arr |= 0x30
+    arr ^= 0x01
+    assert arr.tolist() == [((v & 0x0F) | 0x30) ^ 0x01 for v in values]
+    assert arr.words is words
+
+
+@pytest.mark.fast
+def test_bitvectorarray_invert(size: int):
+
+    values, arr = make(VALUES, size)
+    mask = (1 << size) - 1
+
+    assert (~arr).tolist() == [~v & mask for v in values]
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("count", [0, 1, 3, 7, 63, 64, 300])
+def test_bitvectorarray_shifts(size: int, count: int):
+
+    values, arr = make(VALUES, size)
+    mask = (1 << size) - 1
+
+    assert (arr << count).tolist() == [(v << count) & mask for v in values]
+    assert (arr >> count).tolist() == [v >> count for v in values]
+
+    arr <<= count
+    assert arr.tolist() == [(v << count) & mask for v in values]
+
+    with pytest.raises(ValueError):
+        arr >> -1
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "func", [operator.eq, operator.ne, operator.lt, operator.le, operator.gt, operator.ge]
+)
+def test_bitvectorarray_comparisons(func):
+
+    arr = BitVectorArray(VALUES, size=8)
+    other = BitVectorArray(VALUES[::-1], size=8)
+
+    assert func(arr, 0x5A) == [func(v, 0x5A) for v in VALUES]
+    assert func(arr, other) == [func(a, b) for a, b in zip(VALUES, VALUES[::-1])]
+
+
+@pytest.mark.fast
+def test_bitvectorarray_popcount(size: int):
+
+    values, arr = make(VALUES, size)
+
+    assert arr.popcount() == [bin(v).count("1") for v in values]
+
+
+@pytest.mark.fast
+def test_bitvectorarray_shape_mismatch():
+
+    with pytest.raises(ValueError):
+        BitVectorArray(VALUES, size=8) & BitVectorArray(VALUES, size=16)
+
+    with pytest.raises(ValueError):
+        BitVectorArray(VALUES, size=8) | BitVectorArray(VALUES[1:], size=8)
+
+
+@pytest.mark.fast
+def test_bitvectorarray_vector_type():
+
+    class Pair(BitVector):
+        low = BitField(0, 4)
+        high = BitField(4, 4)
+
+    arr = BitVectorArray(VALUES, size=8, vector_type=Pair)
+
+    assert [row.high for row in arr] == [v >> 4 for v in VALUES]
+
+    arr[4].low = 0
+    assert arr[4] == 0xF0
@@ -0,0 +1,113 @@
+"""
+"""
+
+import operator
+import random
+
+import pytest
+
+from bitvector import BitVector
+from bitvector.ewah import EWAHBitmap
+
+
+def clustered(seed: int, size: int) -> int:
+    rng = random.Random(seed)
+    value = 0
+    for _ in range(20):
+        start = rng.randrange(size)
+        value |= ((1 << rng.randrange(1, 3000)) - 1) << start
+    value |= rng.getrandbits(size) & rng.getrandbits(size) & ((1 << 2000) - 1)
+    return value & ((1 << size) - 1)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("size", [1, 63, 64, 65, 1000, 1 << 16])
+def test_ewah_round_trip_and_count(size):
+
+    value = clustered(size, size)
+    ewah = EWAHBitmap.from_bitvector(BitVector(value, size=size))
+
+    assert len(ewah) == ewah.size == size
+    assert ewah.value == value
+    assert ewah.to_bitvector() == BitVector(value, size=size)
+    assert ewah.count() == BitVector(value, size=size).count()
+    assert bool(ewah) == bool(value)
+
+
+@pytest.mark.fast
+def test_ewah_compresses_clean_runs():
+
+    size = 1 << 20
+    ewah = EWAHBitmap(((1 << 5000) - 1) << 10000, size=size)
+
+    assert ewah.nbytes == 40
+    assert EWAHBitmap(0, size=size).nbytes == 8
+    assert EWAHBitmap(-1, size=size).nbytes == 8
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("size", [65, 1000, 1 << 16])
+@pytest.mark.parametrize("func", [operator.and_, operator.or_, operator.xor])
+def test_ewah_binary_ops_match_dense(size, func):
+
+    a, b = clustered(1, size), clustered(2, size)
+    result = func(EWAHBitmap(a, size=size), EWAHBitmap(b, size=size))
+
+    assert isinstance(result, EWAHBitmap)
+    assert result.value == func(a, b)
+    assert result.count() == func(BitVector(a, size=size), BitVector(b, size=size)).count()
+    assert func(EWAHBitmap(a, size=size), BitVector(b, size=size)) == result
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("func", [operator.and_, operator.or_, operator.xor])
+@pytest.mark.parametrize("backend", ["int", "bytes"])
+def test_ewah_bitvector_on_the_left(func, backend):
+
+    size = 1000
+    a, b = clustered(1, size), clustered(2, size)
+    bv = BitVector(b, size=size, backend=backend)
+    result = func(bv, EWAHBitmap(a, size=size))
+
+    assert isinstance(result, EWAHBitmap)
+    assert result.value == func(b, a)
+
+    inplace = {
+        operator.and_: operator.iand,
+        operator.or_: operator.ior,
+        operator.xor: operator.ixor,
+    }[func](bv, EWAHBitmap(a, size=size))
+
+    assert isinstance(inplace, EWAHBitmap)
+    assert inplace == result
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("size", [1, 64, 100, 1 << 16])
+def test_ewah_invert(size):
+
+    value = clustered(3, size)
+    inverted = ~EWAHBitmap(value, size=size)
+
+    assert inverted.value == ~value & ((1 << size) - 1)
+    assert inverted.count() == size - EWAHBitmap(value, size=size).count()
+
+
+@pytest.mark.fast
+def test_ewah_equality_and_errors():
+
+    a = EWAHBitmap(0xF0F0, size=256)
+
+    assert a == EWAHBitmap(0xF0F0, size=256)
+    assert a == BitVector(0xF0F0, size=256)
+    assert a != EWAHBitmap(0xF0F1, size=256)
+    assert a != EWAHBitmap(0xF0F0, size=128)
+
+    with pytest.raises(ValueError):
+        a & EWAHBitmap(0xF0F0, size=128)
+
+    with pytest.raises(TypeError):
+        a & 1
+
+    with pytest.raises(ValueError):
+        EWAHBitmap(0, size=0)
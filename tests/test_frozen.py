@@ -0,0 +1,221 @@
+"""
+"""
+
+import copy
+import operator
+import pickle
+import sys
+
+import pytest
+
+from bitvector import BitVector, BitVectorArray, FrozenBitVector, ReadOnlyBitField
+
+BACKENDS = ["int", "bytes", "words", "summary", "bytes-big-msb"]
+
+
+class Header(FrozenBitVector):
+    version = ReadOnlyBitField(0, 4)
+    flags = ReadOnlyBitField(4, 4)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_frozen_hashable(backend):
+    a = FrozenBitVector(0b1011, size=64, backend=backend)
+    b = BitVector(0b1011, size=64).freeze()
+
+    assert hash(a) == hash(b) == hash(0b1011)
+    assert {a: "x"}[b] == "x"
+    assert len({a, b, FrozenBitVector(0b1011, size=64)}) == 1
+    assert a == 0b1011
+
+
+@pytest.mark.fast
+def test_frozen_hash_cached():
+    a = FrozenBitVector(1 << 10_000 | 1, size=20_000)
+    assert not hasattr(a, "_hash")
+    assert hash(a) == hash(a.value)
+    assert a._hash == hash(a.value)
+
+
+@pytest.mark.fast
+def test_frozen_zeros_and_ones():
+    assert FrozenBitVector.ones(8) == 0xFF
+    assert len(FrozenBitVector.ones(8)) == 8
+    assert hash(Header.ones(8)) == hash(0xFF)
+    assert FrozenBitVector.zeros(8) == 0
+
+
+@pytest.mark.fast
+def test_mutable_not_hashable():
+    with pytest.raises(TypeError):
+        hash(BitVector())
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_frozen_read_api(backend):
+    a = FrozenBitVector(0b1011_0110, size=16, backend=backend)
+
+    assert a[1] == 1 and a[0] == 0 and a[-16] == 0
+    assert a[4:8] == 0b1011
+    assert a[::2] == BitVector(0b1011_0110, size=16)[::2] == 0b0110
+    assert a.count() == 5
+    assert a.rank(4) == 2
+    assert list(a.iter_ones()) == [1, 2, 4, 5, 7]
+    assert a.find_first_set() == 1
+    assert a.bytes == b"\x00\xb6"
+    assert a.to_buffer().readonly
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize(
+    "func",
+    [operator.and_, operator.or_, operator.xor, operator.add, operator.sub, operator.lshift, operator.rshift],
+)
+def test_frozen_operators_return_frozen(backend, func):
+    a = FrozenBitVector(0xF0F0, size=32, backend=backend)
+    b = FrozenBitVector(0x0FF0, size=32, backend=backend)
+    other = 3 if func in (operator.lshift, operator.rshift) else b
+
+    result = func(a, other)
+    expected = func(BitVector(0xF0F0, size=32), other if isinstance(other, int) else BitVector(0x0FF0, size=32))
+
+    assert isinstance(result, FrozenBitVector)
+    assert result == expected
+    assert a == 0xF0F0
+    assert isinstance(~a, FrozenBitVector)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_frozen_inplace_rebinds(backend):
+    a = b = FrozenBitVector(0b0011, size=8, backend=backend)
+    a |= 0b0100
+    a ^= FrozenBitVector(0b0001, size=8, backend=backend)
+    a <<= 1
+
+    assert isinstance(a, FrozenBitVector)
+    assert a == 0b1100
+    assert b == 0b0011
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda bv: bv.__setitem__(0, 1),
+        lambda bv: bv.__setitem__(slice(0, 4), 0xF),
+        lambda bv: setattr(bv, "value", 1),
+        lambda bv: bv.clear(),
+        lambda bv: bv.set(),
+        lambda bv: bv.toggle(0),
+        lambda bv: bv._setb(0),
+        lambda bv: bv.allocate(2),
+        lambda bv: bv.free(0, 2),
+        lambda bv: bv.repoint(0),
+    ],
+)
+def test_frozen_mutators_raise(mutate):
+    a = FrozenBitVector(0b0101, size=8)
+    with pytest.raises(TypeError):
+        mutate(a)
+    assert a == 0b0101
+
+
+@pytest.mark.fast
+def test_frozen_readonly_bitfields():
+    header = BitVector(0x52, size=8).freeze(Header)
+
+    assert (header.version, header.flags) == (2, 5)
+    assert header.unpack() == {"version": 2, "flags": 5}
+    with pytest.raises(TypeError):
+        header.version = 3
+    with pytest.raises(TypeError):
+        header.pack(version=3)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_freeze_thaw(backend):
+    bv = BitVector(0b1010, size=64, backend=backend)
+    frozen = bv.freeze()
+    bv[0] = 1
+
+    assert type(frozen) is FrozenBitVector
+    assert frozen.backend == backend
+    assert frozen == 0b1010
+    assert frozen.freeze() is frozen
+
+    thawed = frozen.thaw()
+    thawed[2] = 1
+
+    assert type(thawed) is BitVector
+    assert thawed.backend == backend
+    assert thawed == 0b1110
+    assert frozen == 0b1010
+
+
+@pytest.mark.fast
+def test_freeze_shares_int():
+    bv = BitVector(1 << 100_000, size=100_001)
+    frozen = bv.freeze()
+    assert frozen._value is bv._value
+    assert frozen.thaw()._value is bv._value
+
+
+@pytest.mark.fast
+def test_freeze_array_row():
+    rows = BitVectorArray([1, 2, 0xFFF], size=12)
+    frozen = rows[2].freeze()
+
+    assert frozen == 0xFFF and hash(frozen) == hash(0xFFF)
+    assert frozen.to_buffer().readonly
+    assert len(frozen.to_buffer()) == 2
+    assert frozen.thaw() == 0xFFF
+    assert copy.copy(rows[1]) == copy.deepcopy(rows[1]) == 2
+
+    rows[2] = 0
+    assert frozen == 0xFFF
+
+
+@pytest.mark.fast
+def test_frozen_copy_and_pickle():
+    a = FrozenBitVector(0xAB, size=8, backend="bytes")
+
+    assert copy.copy(a) is a
+    assert copy.deepcopy(a) is a
+
+    b = pickle.loads(pickle.dumps(a))
+    assert type(b) is FrozenBitVector
+    assert b == a and hash(b) == hash(a)
+    assert b.to_buffer().readonly
+
+
+@pytest.mark.fast
+def test_frozen_from_buffer():
+    data = bytearray(b"\x01\x02")
+    a = FrozenBitVector.from_buffer(data)
+    data[1] = 0xFF
+    assert a == 0x0102
+
+    b = FrozenBitVector.from_buffer(b"\x01\x02")
+    assert b == 0x0102 and hash(b) == hash(0x0102)
+
+    data = bytearray(b"\x01\x02")
+    c = FrozenBitVector.from_buffer(memoryview(data).toreadonly())
+    hash(c)
+    data[1] = 0xFF
+    assert c == 0x0102 and hash(c) == hash(0x0102)
+
+    raw = b"\x01\x02\x03"
+    assert FrozenBitVector.from_buffer(memoryview(raw)[1:]).to_buffer().obj is raw
+
+    with pytest.raises(TypeError):
+        FrozenBitVector.overlay(b"\x00" * 8)
+
+
+@pytest.mark.fast
+def test_frozen_sizeof():
+    assert sys.getsizeof(FrozenBitVector(size=64)) >= sys.getsizeof(BitVector(size=64))
@@ -0,0 +1,145 @@
+"""
+"""
+
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from bitvector import BitVector, BitField
+from bitvector import instrument
+
+
+class Flags(BitVector):
+    low = BitField(0, 4)
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    instrument.disable()
+    instrument.reset()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+@pytest.mark.fast
+def test_instrument_disabled_restores_methods():
+    getitem = BitVector.__getitem__
+    instrument.enable()
+    assert instrument.enabled()
+    assert BitVector.__getitem__ is not getitem
+    instrument.disable()
+    assert not instrument.enabled()
+    assert BitVector.__getitem__ is getitem
+
+
+@pytest.mark.fast
+def test_instrument_disabled_records_nothing():
+    bv = BitVector(0xFF, size=64)
+    bv[3], bv[0:4], bv & bv
+    assert instrument.snapshot() == {}
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", ["int", "bytes"])
+def test_instrument_counts_operations(backend):
+    a = BitVector(0xF0, size=64, backend=backend)
+    b = BitVector(0x3C, size=64, backend=backend)
+
+    with instrument.instrumented():
+        assert a & b == 0x30
+        a |= b
+        assert (~a).value == ~0xFC & ((1 << 64) - 1)
+        a[0] = 1
+        a[8:16] = 0xFF
+        assert a[0] == 1
+        assert a[8:16] == 0xFF
+        assert a[:-1:2] >= 0
+
+    stats = instrument.snapshot()
+    assert stats["and/BitVector/64"]["calls"] == 1
+    assert stats["ior/BitVector/64"]["calls"] == 1
+    assert stats["invert/BitVector/64"]["calls"] == 1
+    assert stats["setitem-int/BitVector/64"]["calls"] == 1
+    assert stats["setitem-slice/BitVector/64"]["calls"] == 1
+    assert stats["getitem-int/BitVector/64"]["calls"] == 1
+    assert stats["getitem-slice/BitVector/64"]["calls"] == 2
+    assert all(entry["seconds"] >= 0 for entry in stats.values())
+
+
+@pytest.mark.fast
+def test_instrument_by_subclass_and_size():
+    flags = Flags(size=8)
+    wide = BitVector(size=1024)
+
+    with instrument.instrumented():
+        flags.low = 5
+        assert flags.low == 5
+        wide[1000] = 1
+
+    stats = instrument.snapshot()
+    assert stats["bitfield-set/Flags/8"]["calls"] == 1
+    assert stats["bitfield-get/Flags/8"]["calls"] == 1
+    assert stats["setitem-slice/Flags/8"]["calls"] == 1
+    assert stats["setitem-int/BitVector/1024"]["calls"] == 1
+    assert isinstance(Flags.low, BitField)
+
+
+@pytest.mark.fast
+def test_instrument_counts_calls_that_raise():
+    bv = BitVector(size=8)
+    with instrument.instrumented():
+        with pytest.raises(ValueError):
+            bv["a"]
+    assert instrument.snapshot()["getitem-slice/BitVector/8"]["calls"] == 1
+
+
+@pytest.mark.fast
+def test_instrument_snapshot_reset():
+    with instrument.instrumented():
+        BitVector(size=8)[0]
+    assert instrument.snapshot(reset=True)
+    assert instrument.snapshot() == {}
+
+
+@pytest.mark.fast
+def test_instrument_retires_thread_tables():
+    bv = BitVector(size=8)
+    tables = len(instrument._tables)
+
+    def work():
+        for _ in range(10):
+            bv[0]
+
+    with instrument.instrumented():
+        bv[0]
+        for _ in range(5):
+            threads = [threading.Thread(target=work) for _ in range(20)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+    assert len(instrument._tables) <= tables + 1
+    assert instrument.snapshot()["getitem-int/BitVector/8"]["calls"] == 1001
+    instrument.reset()
+    assert instrument.snapshot() == {}
+
+
+@pytest.mark.fast
+def test_instrumented_keeps_enabled_state():
+    instrument.enable()
+    with instrument.instrumented():
+        pass
+    assert instrument.enabled()
+
+
+@pytest.mark.fast
+def test_instrument_enabled_from_environment():
+    code = "import bitvector.instrument as i; print(i.enabled())"
+    env = dict(os.environ, BITVECTOR_INSTRUMENT="1", PYTHONPATH=os.pathsep.join(sys.path))
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "True"
@@ -0,0 +1,148 @@
+"""
+"""
+
+import operator
+import random
+
+from functools import reduce
+
+import pytest
+
+from bitvector import BitVector, FrozenBitVector
+from bitvector import lazy as lazy_module
+from bitvector.lazy import Expr, lazy
+
+BACKENDS = ["int", "bytes", "words", "bytes-big", "summary"]
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    # several chunks, and a partial last one, even for small vectors
+    monkeypatch.setattr(lazy_module, "CHUNK_BYTES", 16)
+
+
+def make(size: int, backends: list, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [BitVector(rng.getrandbits(size), size=size, backend=backend) for backend in backends]
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("size", [1, 7, 64, 130, 1000, 4099])
+@pytest.mark.parametrize("backend", BACKENDS + ["mixed"])
+def test_lazy_matches_eager(size, backend):
+    backends = BACKENDS if backend == "mixed" else [backend] * 5
+    a, b, c, d, e = make(size, backends, size)
+
+    expr = (lazy(a) & b) | (lazy(c) & ~lazy(d)) ^ e
+    result = expr.evaluate()
+
+    assert result == (a & b) | (c & ~d) ^ e
+    assert type(result) is BitVector
+    assert result.backend == a.backend
+    assert (~lazy(a)).evaluate() == ~a
+    assert (lazy(a) | ~lazy(a)).evaluate() == (1 << size) - 1
+    assert (lazy(a) & ~lazy(a)).evaluate() == 0
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("func", [operator.and_, operator.or_, operator.xor])
+@pytest.mark.parametrize("count", [5, 10, 20])
+def test_lazy_chains(func, count):
+    vectors = make(1000, (["bytes", "int"] * count)[:count], count)
+    expr = reduce(func, vectors[1:], lazy(vectors[0]))
+
+    assert isinstance(expr, Expr)
+    assert len(expr.operands) == count
+    assert expr.evaluate() == reduce(func, vectors)
+
+
+@pytest.mark.fast
+def test_lazy_short_circuits():
+    size = 1024
+    zero = BitVector(size=size, backend="bytes")
+    ones = BitVector((1 << size) - 1, size=size, backend="bytes")
+
+    class Exploding(BitVector):
+        @property
+        def value(self):
+            raise AssertionError("operand read")
+
+    never = Exploding(5, size=size)
+
+    assert (lazy(zero) & never).evaluate() == 0
+    assert (lazy(ones) | never).evaluate() == (1 << size) - 1
+
+
+@pytest.mark.fast
+def test_lazy_int_operands():
+    a, b = make(100, ["bytes", "int"])
+    assert (lazy(a) & 0xFF).evaluate() == a & 0xFF
+    assert (0xFF ^ lazy(b)).evaluate() == b ^ 0xFF
+    assert (lazy(a) | -1).evaluate() == (1 << 100) - 1
+
+
+@pytest.mark.fast
+def test_lazy_bitvector_on_the_left_is_eager():
+    a, b, c = make(300, ["bytes", "int", "bytes"])
+
+    result = a & (lazy(b) | c)
+
+    assert type(result) is BitVector
+    assert result == a & (b | c)
+    assert isinstance(lazy(a) & (lazy(b) | c), Expr)
+
+
+@pytest.mark.fast
+def test_lazy_evaluates_once():
+    a, b = make(256, ["bytes", "bytes"])
+    expr = lazy(a) ^ b
+    first = expr.evaluate()
+    assert expr.evaluate() is first
+    assert expr.count() == first.count()
+    assert len(expr) == 256
+    assert expr[3] == first[3]
+    assert list(expr) == list(first)
+    assert bool(expr) == bool(first)
+    assert expr == first and expr == (lazy(a) ^ b)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", ["bytes", "int", "summary"])
+def test_lazy_evaluate_into(backend):
+    a, b = make(1000, ["bytes", "int"])
+    out = BitVector(size=1000, backend=backend)
+    store = out._value
+    out.rank(10)
+
+    assert (lazy(a) & b).evaluate(out=out) is out
+    assert out == a & b
+    assert out.rank(1000) == (a & b).count()
+    if backend == "bytes":
+        assert out._value is store
+
+
+@pytest.mark.fast
+def test_lazy_result_type():
+    a = FrozenBitVector(0b1100, size=16, backend="bytes")
+    b = BitVector(0b1010, size=16)
+    result = (lazy(a) & b).evaluate()
+    assert type(result) is FrozenBitVector
+    assert result == 0b1000
+
+
+@pytest.mark.fast
+def test_lazy_errors():
+    with pytest.raises(ValueError):
+        (lazy(BitVector(size=8)) & BitVector(size=16)).evaluate()
+    with pytest.raises(ValueError):
+        (lazy(BitVector(size=8)) & 1).evaluate(out=BitVector(size=16))
+    with pytest.raises(ValueError):
+        (lazy(1) & 2).evaluate()
+    with pytest.raises(TypeError):
+        Expr()
+    with pytest.raises(TypeError):
+        lazy("a")
+    with pytest.raises(TypeError):
+        lazy(BitVector(size=8)) & "a"
+    with pytest.raises(TypeError):
+        hash(lazy(BitVector(size=8)))
@@ -0,0 +1,161 @@
+"""
+"""
+
+import random
+import sys
+import tracemalloc
+
+import pytest
+
+from bitvector import BitVector, BitVectorArray, EWAHBitmap, RoaringBitmap
+from bitvector.backends import _MANAGED_BUFFER
+from bitvector.memory import Footprint, footprint
+
+
+def retained(make, args: list):
+    """Returns the footprint of the objects made by `make` from each of
+    `args` and the bytes freed by deleting them. CPython keeps a few
+    freed lists and dicts for reuse, so enough objects are needed for
+    them not to matter.
+    """
+    tracemalloc.start()
+    try:
+        objects = [make(arg) for arg in args]
+        report = footprint(objects)
+        before = tracemalloc.get_traced_memory()[0]
+        del objects
+        return report.total_bytes, before - tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", ["int", "bytes", "words", "summary", "bytes-big-msb"])
+@pytest.mark.parametrize("size", [64, 1000, 1 << 16])
+def test_sizeof_matches_tracemalloc(backend, size):
+    rng = random.Random(size)
+
+    # the int backend keeps the int it is given, so each vector gets its own
+    def make(_):
+        return BitVector(rng.getrandbits(size), size=size, backend=backend)
+
+    total, freed = retained(make, list(range(100 if size > 1000 else 2000)))
+
+    assert total == pytest.approx(freed, rel=0.02)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("exporter", [bytearray, bytes])
+def test_managed_buffer_matches_tracemalloc(exporter):
+    # _MANAGED_BUFFER is sized from CPython's private structs
+    buffers = [exporter(64) for _ in range(2000)]
+
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        views = [memoryview(buffer) for buffer in buffers]
+        allocated = tracemalloc.get_traced_memory()[0] - start - sys.getsizeof(views)
+    finally:
+        tracemalloc.stop()
+
+    assert allocated / len(views) == pytest.approx(sys.getsizeof(views[0]) + _MANAGED_BUFFER, abs=1)
+
+
+@pytest.mark.fast
+def test_collection_sizeof_matches_tracemalloc():
+    rng = random.Random(7)
+    samples = [rng.sample(range(1 << 20), 300) for _ in range(200)]
+    words = [rng.getrandbits(4096) << 10000 for _ in range(200)]
+    rows = [[rng.getrandbits(100) for _ in range(50)] for _ in range(200)]
+
+    for make, args in [
+        (lambda values: RoaringBitmap(values, size=1 << 20), samples),
+        (lambda value: EWAHBitmap(value, size=1 << 16), words),
+        (lambda values: BitVectorArray(values, size=100), rows),
+    ]:
+        total, freed = retained(make, args)
+        assert total == pytest.approx(freed, rel=0.02)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", ["int", "bytes"])
+def test_sizeof_includes_rank_directory(backend):
+    bv = BitVector(random.Random(1).getrandbits(1 << 16), size=1 << 16, backend=backend)
+    before = sys.getsizeof(bv)
+
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        bv.rank(100)
+        allocated = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+
+    assert sys.getsizeof(bv) - before == pytest.approx(allocated, rel=0.05)
+    bv[0] = 1
+    assert sys.getsizeof(bv) == before
+
+
+@pytest.mark.fast
+def test_sizeof_includes_instance_dict():
+    class Tagged(BitVector):
+        pass
+
+    tagged = Tagged(size=64)
+    tagged.tag = "x"
+    assert sys.getsizeof(tagged) > sys.getsizeof(BitVector(size=64)) + sys.getsizeof({})
+
+
+@pytest.mark.fast
+def test_sizeof_excludes_wrapped_parts_of_buffers():
+    data = bytearray(1 << 16)
+    whole = BitVector.from_buffer(data)
+    windows = list(BitVector.iter_overlay(data, stride=8, size=64))
+    assert sys.getsizeof(whole) > len(data)
+    assert all(sys.getsizeof(window) < 1024 for window in windows[:10])
+
+
+@pytest.mark.fast
+def test_sizeof_excludes_mapped_files(tmp_path):
+    with BitVector.open(tmp_path / "bits", size=1 << 23, mode="w+") as bv:
+        assert sys.getsizeof(bv) < 4096
+
+
+@pytest.mark.fast
+def test_footprint_report():
+    vectors = [BitVector(0b1011, size=1024, backend="bytes") for _ in range(4)]
+    report = footprint(vectors)
+
+    assert isinstance(report, Footprint)
+    assert report.vectors == 4
+    assert report.bits == 4096
+    assert report.ones == 12
+    assert report.payload_bytes == 512
+    assert report.total_bytes == sys.getsizeof(vectors) + sum(map(sys.getsizeof, vectors))
+    assert report.bytes_per_set_bit == report.total_bytes / 12
+    assert report.overhead == report.total_bytes / 512
+    assert report.overhead > 1
+
+
+@pytest.mark.fast
+def test_footprint_mapping_and_duplicates():
+    bv = BitVector(1, size=64)
+    cache = {"a": bv, "b": bv, "c": BitVector(3, size=64)}
+    report = footprint(cache)
+    assert (report.vectors, report.bits, report.ones) == (2, 128, 3)
+    assert report.total_bytes == sys.getsizeof(cache) + 2 * sys.getsizeof(bv)
+
+
+@pytest.mark.fast
+def test_footprint_single_objects():
+    array = BitVectorArray([1, 3, 7], size=8)
+    assert footprint(array)[:3] == (3, 24, 6)
+    assert footprint(RoaringBitmap([1, 2], size=1 << 20))[:3] == (1, 1 << 20, 2)
+    assert footprint(EWAHBitmap(7, size=128))[:3] == (1, 128, 3)
+    assert footprint(BitVector(size=8)).bytes_per_set_bit == float("inf")
+
+
+@pytest.mark.fast
+def test_footprint_rejects_other_items():
+    with pytest.raises(TypeError):
+        footprint([BitVector(), 5])
@@ -0,0 +1,93 @@
+"""
+"""
+
+import operator
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from bitvector import BitVector, parallel
+from bitvector.shared import SharedBitVector
+
+
+SIZE = 8 * 4096 + 5
+
+
+@pytest.fixture(autouse=True)
+def small_tasks(monkeypatch):
+    monkeypatch.setattr(parallel, "MIN_TASK_BYTES", 256)
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(2) as pool:
+        yield pool
+
+
+def vectors(n: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [BitVector(rng.getrandbits(SIZE) & rng.getrandbits(SIZE), size=SIZE) for _ in range(n)]
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parallel_count(workers, executor):
+
+    bv = vectors(1)[0]
+    pool = executor if workers > 1 else None
+
+    assert parallel.count(bv, workers=workers, executor=pool) == bv.count()
+    assert parallel.count(BitVector(size=SIZE, backend="bytes"), workers=workers, executor=pool) == 0
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("offset", [0, 7, 2050, 17000, SIZE - 1])
+def test_parallel_find(offset, executor):
+
+    bv = BitVector(1 << offset, size=SIZE)
+
+    assert parallel.find_first_set(bv, executor=executor) == offset
+    assert parallel.find_first_zero(~bv, executor=executor) == offset
+
+    assert parallel.find_first_set(BitVector(size=SIZE), executor=executor) == -1
+    assert parallel.find_first_zero(BitVector(-1, size=SIZE), executor=executor) == -1
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("func", [operator.and_, operator.or_, operator.xor])
+def test_parallel_reduce(func, executor):
+
+    vs = vectors(7, seed=1)
+    expected = vs[0]
+    for bv in vs[1:]:
+        expected = func(expected, bv)
+
+    result = parallel.reduce(func, vs, executor=executor)
+
+    assert result == expected
+    assert type(result) is BitVector
+    assert parallel.reduce(func, vs[:1], workers=1) == vs[0]
+
+
+@pytest.mark.fast
+def test_parallel_shared_vector_in_place(executor):
+
+    with SharedBitVector(size=SIZE, locks=0) as bv:
+        bv[::3] = True
+        assert parallel.count(bv, executor=executor) == len(range(0, SIZE, 3))
+        assert parallel.find_first_zero(bv, executor=executor) == 1
+        bv.unlink()
+
+
+@pytest.mark.fast
+def test_parallel_reduce_errors():
+
+    with pytest.raises(ValueError):
+        parallel.reduce(operator.add, vectors(2))
+
+    with pytest.raises(ValueError):
+        parallel.reduce(operator.or_, [])
+
+    with pytest.raises(ValueError):
+        parallel.reduce(operator.or_, [BitVector(size=8), BitVector(size=16)])
@@ -0,0 +1,210 @@
+"""
+"""
+
+import operator
+import random
+
+import pytest
+
+from bitvector import BitVector
+from bitvector.roaring import ARRAY_MAX, RoaringBitmap
+
+
+SIZE = 1 << 20
+
+
+def sample(seed: int) -> set:
+    rng = random.Random(seed)
+    values = set(rng.sample(range(SIZE), 3000))  # sparse, array containers
+    values |= set(rng.sample(range(3 << 16, 4 << 16), 20000))  # dense, bitmap containers
+    start = rng.randrange(5 << 16, 6 << 16)
+    values |= set(range(start, start + 90000))  # runs
+    return values
+
+
+@pytest.fixture
+def pair():
+    a, b = sample(1), sample(2)
+    ra, rb = RoaringBitmap(a, size=SIZE), RoaringBitmap(b, size=SIZE)
+    rb.run_optimize()
+    return a, b, ra, rb
+
+
+@pytest.mark.fast
+def test_roaring_membership_iteration_count(pair):
+
+    a, _, ra, _ = pair
+
+    assert ra.count() == len(ra) == len(a)
+    assert list(ra) == sorted(a)
+    assert all(n in ra for n in list(a)[:500])
+    assert not any(n in ra for n in range(SIZE) if n not in a and n % 977 == 0)
+    assert ra.size == SIZE
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "func, setop",
+    [
+        (operator.and_, set.intersection),
+        (operator.or_, set.union),
+        (operator.xor, set.symmetric_difference),
+        (operator.sub, set.difference),
+    ],
+)
+def test_roaring_set_algebra(pair, func, setop):
+
+    a, b, ra, rb = pair
+    expected = sorted(setop(a, b))
+
+    assert list(func(ra, rb)) == expected
+    assert list(func(rb, ra)) == sorted(setop(b, a))
+    assert list(func(ra, rb.to_bitvector())) == expected
+
+    inplace = RoaringBitmap(a, size=SIZE)
+    inplace = {
+        operator.and_: operator.iand,
+        operator.or_: operator.ior,
+        operator.xor: operator.ixor,
+        operator.sub: operator.isub,
+    }[func](inplace, rb)
+    assert list(inplace) == expected
+    assert list(ra) == sorted(a)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "func, setop",
+    [
+        (operator.and_, set.intersection),
+        (operator.or_, set.union),
+        (operator.xor, set.symmetric_difference),
+        (operator.sub, set.difference),
+    ],
+)
+@pytest.mark.parametrize("backend", ["int", "bytes"])
+def test_roaring_set_algebra_bitvector_on_the_left(pair, func, setop, backend):
+
+    a, b, ra, rb = pair
+    bv = BitVector(rb.to_bitvector().value, size=SIZE, backend=backend)
+
+    result = func(bv, ra)
+
+    assert isinstance(result, RoaringBitmap)
+    assert list(result) == sorted(setop(b, a))
+    assert result.size == SIZE
+
+    inplace = {
+        operator.and_: operator.iand,
+        operator.or_: operator.ior,
+        operator.xor: operator.ixor,
+        operator.sub: operator.isub,
+    }[func](bv, ra)
+
+    assert list(inplace) == sorted(setop(b, a))
+
+
+@pytest.mark.fast
+def test_roaring_bitvector_round_trip(pair):
+
+    a, _, ra, rb = pair
+    bv = ra.to_bitvector()
+
+    assert len(bv) == SIZE
+    assert list(bv.iter_ones()) == sorted(a)
+    assert RoaringBitmap.from_bitvector(bv) == ra
+    assert RoaringBitmap.from_bitvector(rb.to_bitvector(backend="bytes")) == rb
+
+
+@pytest.mark.fast
+def test_roaring_container_transitions():
+
+    rb = RoaringBitmap(range(ARRAY_MAX), size=SIZE)
+    assert rb.nbytes == ARRAY_MAX * 2
+
+    rb.add(ARRAY_MAX)
+    assert rb.nbytes == 8192
+    assert rb.count() == ARRAY_MAX + 1
+
+    rb.discard(0)
+    assert rb.nbytes == ARRAY_MAX * 2
+    assert list(rb) == list(range(1, ARRAY_MAX + 1))
+
+    rb.run_optimize()
+    assert rb.nbytes == 4
+    assert 0 not in rb and 1 in rb and ARRAY_MAX in rb
+
+    rb.add(0)
+    rb.discard(100)
+    rb.discard(ARRAY_MAX)
+    rb.add(ARRAY_MAX + 1)
+    assert list(rb) == [n for n in range(ARRAY_MAX + 2) if n not in (100, ARRAY_MAX)]
+    assert rb.nbytes == 12
+
+    rb.add(ARRAY_MAX)
+    rb.add(100)
+    assert rb.nbytes == 4
+
+    for n in range(ARRAY_MAX + 2):
+        rb.discard(n)
+    assert not rb
+    assert rb.nbytes == 0
+
+
+@pytest.mark.fast
+def test_roaring_add_range():
+
+    rb = RoaringBitmap(size=SIZE)
+    rb.add_range(100, 200_000)
+    rb.add_range(150, 160)
+    rb.add(5)
+
+    assert rb.count() == 199_901
+    assert list(rb)[:3] == [5, 100, 101]
+    assert 199_999 in rb and 200_000 not in rb
+    assert rb.nbytes < 64
+
+
+@pytest.mark.fast
+def test_roaring_sizes_and_errors():
+
+    small = RoaringBitmap([1, 70_000], size=70_001)
+    big = RoaringBitmap([2, 70_000, 90_000], size=1 << 32)
+
+    assert list(small | big) == [1, 2, 70_000]
+    assert (small | big).size == 70_001
+    assert list(big | small) == [1, 2, 70_000, 90_000]
+
+    with pytest.raises(IndexError):
+        small.add(70_001)
+
+    with pytest.raises(IndexError):
+        RoaringBitmap([-1])
+
+    with pytest.raises(ValueError):
+        RoaringBitmap(size=0)
+
+    assert RoaringBitmap([3_000_000_000]).count() == 1
+    with pytest.raises(TypeError):
+        small & 1
+
+
+@pytest.mark.fast
+def test_roaring_run_container_random_edits():
+
+    rng = random.Random(15)
+    ref = set(range(1000, 3000)) | set(range(5000, 5100))
+    rb = RoaringBitmap(ref, size=SIZE)
+    rb.run_optimize()
+
+    for _ in range(2000):
+        n = rng.randrange(900, 5200)
+        if rng.random() < 0.5:
+            rb.add(n)
+            ref.add(n)
+        else:
+            rb.discard(n)
+            ref.discard(n)
+        assert (n in rb) == (n in ref)
+
+    assert list(rb) == sorted(ref)
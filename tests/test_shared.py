@@ -0,0 +1,132 @@
+"""
+"""
+
+import multiprocessing
+import pickle
+
+import pytest
+
+from bitvector import BitVector, BitField
+from bitvector.shared import SharedBitVector, attach
+
+
+def mark(bv, offsets) -> None:
+    for offset in offsets:
+        bv[offset] = 1
+        bv.toggle(0)
+    bv.close()
+
+
+@pytest.fixture
+def shared():
+    bv = SharedBitVector(size=4096, locks=4)
+    yield bv
+    bv.close()
+    bv.unlink()
+
+
+@pytest.mark.fast
+def test_shared_bitvector_behaves_like_bitvector(shared):
+
+    expected = BitVector(size=4096)
+
+    for bv in (shared, expected):
+        bv[3] = 1
+        bv[100:200] = 0xABCDEF
+        bv[::97] = True
+        bv.toggle(4)
+        bv ^= 0xFF
+        bv |= BitVector(1 << 4000, size=4096)
+
+    assert shared == expected
+    assert shared.count() == expected.count()
+    assert shared.backend == "bytes"
+
+    result = shared & expected
+    assert type(result) is BitVector
+    assert result == expected
+
+
+@pytest.mark.fast
+def test_shared_bitvector_attach_by_name(shared):
+
+    shared[1234] = 1
+
+    other = attach(shared.name)
+    assert len(other) == 4096
+    assert other.locks is None
+    assert other[1234] == 1
+
+    other[42] = 1
+    assert shared[42] == 1
+    other.close()
+
+    with pytest.raises(FileNotFoundError):
+        attach(shared.name + "-missing")
+
+
+@pytest.mark.fast
+def test_shared_bitvector_initial_value_and_fields():
+    class Flags(SharedBitVector):
+        ready = BitField(0)
+        count = BitField(8, 16)
+
+    with Flags(0x1234_01, size=64) as flags:
+        assert flags.ready == 1
+        assert flags.count == 0x1234
+        flags.count = 7
+        assert flags.value == 0x0007_01
+        flags.unlink()
+
+
+@pytest.mark.fast
+def test_shared_bitvector_stripes(shared):
+
+    locks = shared.locks
+
+    assert len(locks) == 4
+    assert shared._hold().locks == locks
+    assert shared._hold(0, 64).locks == [locks[0]]
+    assert shared._hold(130, 60).locks == [locks[2]]
+    assert shared._hold(60, 80).locks == [locks[0], locks[1], locks[2]]
+    assert shared._hold(0, 64 * 4).locks == locks
+
+    with SharedBitVector(size=64, locks=0) as bv:
+        assert bv.locks is None
+        bv[0] = 1
+        bv |= 2
+        assert bv.value == 3
+        bv.unlink()
+
+
+@pytest.mark.fast
+def test_shared_bitvector_workers(shared):
+
+    workers = [
+        multiprocessing.Process(target=mark, args=(shared, range(n + 8, 4096, 4)))
+        for n in range(4)
+    ]
+
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert all(worker.exitcode == 0 for worker in workers)
+    assert shared.count() == 4088
+    assert shared[0] == 0  # toggled an even number of times
+    assert shared[8:] == (1 << 4088) - 1
+
+
+@pytest.mark.fast
+def test_shared_bitvector_pickles_by_name():
+
+    with SharedBitVector(0xFF, size=64, locks=0) as bv:
+        other = pickle.loads(pickle.dumps(bv))
+        assert other.name == bv.name
+        assert other.value == 0xFF
+        other.close()
+        bv.unlink()
+
+    with pytest.raises(ValueError):
+        SharedBitVector(size=0)
@@ -0,0 +1,109 @@
+"""
+"""
+
+import copy
+import pickle
+import sys
+import threading
+
+import pytest
+
+from bitvector import BitVector, BitField
+from bitvector.threadsafe import ThreadSafeBitVector
+
+
+@pytest.fixture
+def fast_switching():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def run_threads(target, nthreads: int = 4) -> None:
+    threads = [threading.Thread(target=target, args=(n,)) for n in range(nthreads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", ["bytes", "words", "int"])
+def test_threadsafe_concurrent_bit_writes(backend, fast_switching):
+
+    bv = ThreadSafeBitVector(size=4160, backend=backend)
+
+    def work(n):
+        for offset in range(n, 4096, 4):
+            bv[offset] = 1
+            bv.toggle(4100)
+
+    run_threads(work)
+
+    assert bv[:4096] == (1 << 4096) - 1
+    assert bv[4100] == 0  # toggled an even number of times
+
+
+@pytest.mark.fast
+def test_threadsafe_concurrent_inplace_and_slices(fast_switching):
+
+    bv = ThreadSafeBitVector(size=1024)
+
+    def work(n):
+        nonlocal bv
+        for _ in range(200):
+            bv ^= 1 << (n * 100)
+            bv[n * 8 + 512 : n * 8 + 520] = 0xFF
+
+    run_threads(work)
+
+    assert bv[0] == bv[100] == bv[200] == bv[300] == 0
+    assert bv[512:544] == (1 << 32) - 1
+
+
+@pytest.mark.fast
+def test_threadsafe_behaves_like_bitvector():
+    class Flags(ThreadSafeBitVector):
+        ready = BitField(0)
+        count = BitField(8, 16)
+
+    flags = Flags(size=32)
+    flags.ready = 1
+    flags.count = 0x1234
+    flags.pack(ready=0)
+
+    expected = BitVector(0x123400, size=32)
+
+    assert flags == expected
+    assert flags.backend == "bytes"
+    assert type(flags | 1) is Flags
+    assert len(flags.locks) == 16
+    assert len(ThreadSafeBitVector(backend="int").locks) == 1
+    assert ThreadSafeBitVector(locks=0).locks is None
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("backend", ["int", "bytes", "words"])
+def test_threadsafe_operators_keep_backend_and_locks(backend):
+
+    bv = ThreadSafeBitVector(5, size=16, backend=backend, locks=4)
+
+    for result in (bv & 3, bv | 8, bv ^ 1, ~bv, bv << 1, bv + 1):
+        assert type(result) is ThreadSafeBitVector
+        assert result.backend == backend
+        assert len(result.locks) == len(bv.locks)
+
+    assert (bv & 3) == 1
+    assert ~bv == 0xFFFA
+
+
+@pytest.mark.fast
+def test_threadsafe_pickle_and_copy():
+
+    bv = ThreadSafeBitVector(0xABC, size=64, locks=4)
+
+    for other in (pickle.loads(pickle.dumps(bv)), copy.copy(bv), copy.deepcopy(bv)):
+        assert other == bv
+        assert len(other.locks) == 4
+        assert other.locks[0] is not bv.locks[0]